@@ -1,6 +1,18 @@
 """MemoVault - A simplified personal memory system for AI assistants."""
 
-from memovault.core.memovault import MemoVault
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from memovault.core.memovault import MemoVault
 
 __version__ = "0.1.0"
 __all__ = ["MemoVault"]
+
+
+def __getattr__(name: str):
+    # Imported lazily so `memovault --help` does not load the backends
+    if name == "MemoVault":
+        from memovault.core.memovault import MemoVault
+
+        return MemoVault
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,32 @@
-"""API module for MemoVault."""
-
-from memovault.api.mcp import MemoVaultMCPServer
-from memovault.api.models import (
-    AddMemoryRequest,
-    ChatRequest,
-    ChatResponse,
-    MemoryResponse,
-    SearchRequest,
-    SearchResponse,
-)
+"""API module for MemoVault.
+
+Names are resolved on first access (PEP 562), so importing this package does
+not pull in fastmcp or the memory backends until they are actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from memovault.api.mcp import MemoVaultMCPServer
+    from memovault.api.models import (
+        AddMemoryRequest,
+        ChatRequest,
+        ChatResponse,
+        MemoryResponse,
+        SearchRequest,
+        SearchResponse,
+    )
+
+_LAZY_IMPORTS = {
+    "MemoVaultMCPServer": "memovault.api.mcp",
+    "AddMemoryRequest": "memovault.api.models",
+    "ChatRequest": "memovault.api.models",
+    "ChatResponse": "memovault.api.models",
+    "MemoryResponse": "memovault.api.models",
+    "SearchRequest": "memovault.api.models",
+    "SearchResponse": "memovault.api.models",
+}
 
 __all__ = [
     "MemoVaultMCPServer",
@@ -19,3 +37,16 @@ __all__ = [
     "SearchRequest",
     "SearchResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
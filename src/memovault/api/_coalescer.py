@@ -0,0 +1,106 @@
+"""Short-window coalescing of concurrent search calls."""
+
+import asyncio
+from collections.abc import Hashable
+from typing import Any
+
+from memovault.core.memovault import MemoVault
+from memovault.memory.item import MemoryItem
+
+# (query, precomputed embedding or None, future resolved with the results)
+_Pending = tuple[str, list[float] | None, asyncio.Future]
+
+
+class SearchCoalescer:
+    """Batch searches that arrive within a short window.
+
+    Searches sharing the same top_k, age cutoff and filter are queued; the
+    group is flushed `window` seconds after its first query arrives with a
+    single MemoVault.batch_search() call (one embedder pass, one vector DB
+    request) and the results are fanned back out to the waiting callers.
+    """
+
+    def __init__(self, vault: MemoVault, window: float = 0.005):
+        """Initialize the coalescer.
+
+        Args:
+            vault: Vault to search.
+            window: Seconds to wait for more queries (<= 0 disables batching).
+        """
+        self.vault = vault
+        self.window = window
+        self._pending: dict[Hashable, list[_Pending]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def search(
+        self,
+        query: str,
+        top_k: int,
+        max_age_days: int | None = None,
+        filter_dict: dict[str, Any] | None = None,
+        query_vector: list[float] | None = None,
+    ) -> list[MemoryItem]:
+        """Search, sharing a backend call with concurrent searches.
+
+        Args:
+            query: Search query.
+            top_k: Number of results to return.
+            max_age_days: Optional hard age cutoff.
+            filter_dict: Optional payload filters.
+            query_vector: Embedding of the query, if already computed.
+
+        Returns:
+            List of matching memories.
+        """
+        if self.window <= 0:
+            kwargs: dict[str, Any] = {}
+            if filter_dict:
+                kwargs["filter"] = filter_dict
+            if query_vector is not None:
+                kwargs["query_vector"] = query_vector
+            return await asyncio.to_thread(
+                self.vault.search, query, top_k, max_age_days=max_age_days, **kwargs
+            )
+
+        loop = asyncio.get_running_loop()
+        key = (top_k, max_age_days, tuple(sorted(filter_dict.items())) if filter_dict else None)
+        future = loop.create_future()
+        group = self._pending.get(key)
+        if group is None:
+            group = self._pending[key] = []
+            loop.call_later(self.window, self._flush, key)
+        group.append((query, query_vector, future))
+        return await future
+
+    def _flush(self, key: Hashable) -> None:
+        group = self._pending.pop(key, None)
+        if group:
+            task = asyncio.ensure_future(self._run(key, group))
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Hashable, group: list[_Pending]) -> None:
+        top_k, max_age_days, filter_items = key
+        queries = [query for query, _, _ in group]
+        vectors = [vector for _, vector, _ in group]
+
+        kwargs: dict[str, Any] = {}
+        if filter_items:
+            kwargs["filter"] = dict(filter_items)
+        if all(vector is not None for vector in vectors):
+            kwargs["query_vectors"] = vectors
+
+        try:
+            results = await asyncio.to_thread(
+                self.vault.batch_search, queries, top_k, max_age_days=max_age_days, **kwargs
+            )
+        except Exception as e:
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), memories in zip(group, results):
+            if not future.done():
+                future.set_result(memories)
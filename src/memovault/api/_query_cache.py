@@ -0,0 +1,187 @@
+"""Query cache shared by the MCP and REST APIs."""
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from memovault.core.memovault import MemoVault
+from memovault.core.semantic_cache import SemanticCache
+
+# Number of query embeddings kept by the exact-text embedding cache
+EMBEDDING_CACHE_SIZE = 1024
+
+# The cache of each vault, shared by every API serving it
+_VAULT_CACHES: "weakref.WeakKeyDictionary[MemoVault, QueryCache]" = weakref.WeakKeyDictionary()
+_VAULT_CACHES_LOCK = threading.Lock()
+
+
+class QueryCache:
+    """Two-level cache for search results.
+
+    Repeated identical query text reuses its embedding (exact-text LRU), and
+    near-duplicate queries reuse earlier results through a SemanticCache.
+    Results must be dropped with invalidate() whenever the vault changes;
+    embeddings stay valid since they only depend on the query text.
+
+    Read `generation` before running a search and pass it to put(): a
+    result computed before a concurrent invalidate() is then discarded
+    instead of being cached after it.
+    """
+
+    def __init__(
+        self,
+        vault: MemoVault,
+        threshold: float = 0.97,
+        max_entries: int = 256,
+        ttl: float | None = None,
+        embedding_cache_size: int = EMBEDDING_CACHE_SIZE,
+    ):
+        """Initialize the cache.
+
+        Args:
+            vault: Vault whose embedder is used for queries.
+            threshold: Minimum cosine similarity for a result hit.
+            max_entries: Maximum number of cached results.
+            ttl: Seconds a cached result stays valid (None = until evicted).
+            embedding_cache_size: Maximum number of cached query embeddings.
+        """
+        self.vault = vault
+        self.embedding_cache_size = embedding_cache_size
+        self._results = SemanticCache(threshold=threshold, max_entries=max_entries, ttl=ttl)
+        # sha256(query) -> embedding, most recently used last
+        self._embeddings: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._embedding_hits = 0
+        self._embedding_misses = 0
+        # Incremented by every invalidate()
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_vault(cls, vault: MemoVault) -> "QueryCache":
+        """Create a cache sized from the vault settings."""
+        settings = vault.settings
+        return cls(
+            vault,
+            threshold=settings.semcache_tau,
+            max_entries=settings.semcache_size,
+            ttl=settings.semcache_ttl or None,
+        )
+
+    @classmethod
+    def for_vault(cls, vault: MemoVault) -> "QueryCache":
+        """Return the vault's shared cache, creating it on first use.
+
+        The MCP server and REST API serving the same vault get the same
+        instance, so a write through either one drops the results cached
+        by both.
+        """
+        with _VAULT_CACHES_LOCK:
+            cache = _VAULT_CACHES.get(vault)
+            if cache is None:
+                cache = _VAULT_CACHES[vault] = cls.from_vault(vault)
+            return cache
+
+    @staticmethod
+    def _text_key(query: str) -> bytes:
+        return hashlib.sha256(query.encode()).digest()
+
+    def cached_embedding(self, query: str) -> list[float] | None:
+        """Return the embedding of previously seen query text, without embedding."""
+        key = self._text_key(query)
+        with self._lock:
+            vector = self._embeddings.get(key)
+            if vector is not None:
+                self._embeddings.move_to_end(key)
+                self._embedding_hits += 1
+            return vector
+
+    def embed(self, query: str) -> list[float] | None:
+        """Embed a query, reusing the vector for repeated identical text.
+
+        Returns None when the backend has no embedder.
+        """
+        vector = self.cached_embedding(query)
+        if vector is not None:
+            return vector
+
+        with self._lock:
+            self._embedding_misses += 1
+        vector = self.vault.embed_query(query)
+        if vector is not None:
+            self._remember(self._text_key(query), vector)
+        return vector
+
+    def prime(self, queries: list[str]) -> None:
+        """Embed all uncached queries in a single embedder call."""
+        with self._lock:
+            pending = {
+                key: query
+                for key, query in ((self._text_key(q), q) for q in queries)
+                if key not in self._embeddings
+            }
+        if not pending:
+            return
+
+        vectors = self.vault.embed_queries(list(pending.values()))
+        for key, vector in zip(pending, vectors or []):
+            self._remember(key, vector)
+
+    def _remember(self, key: bytes, vector: list[float]) -> None:
+        with self._lock:
+            self._embeddings[key] = vector
+            self._embeddings.move_to_end(key)
+            if len(self._embeddings) > self.embedding_cache_size:
+                self._embeddings.popitem(last=False)
+
+    def get(self, vector: list[float], key: Hashable) -> Any | None:
+        """Return a cached result for a similar query, or None on a miss."""
+        with self._lock:
+            return self._results.get(vector, key)
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidate() calls so far."""
+        return self._generation
+
+    def put(
+        self, vector: list[float], value: Any, key: Hashable, generation: int | None = None
+    ) -> None:
+        """Cache a result for a query embedding.
+
+        Args:
+            vector: Query embedding.
+            value: Result to cache.
+            key: Exact-match part of the cache key (tool, top_k, filters...).
+            generation: The generation read before computing value; the
+                result is dropped if the cache was invalidated since.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._results.put(vector, value, key)
+
+    def invalidate(self) -> None:
+        """Drop cached results after the vault changes."""
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters and sizes of both cache levels."""
+        with self._lock:
+            return {
+                "embedding_cache": {
+                    "hits": self._embedding_hits,
+                    "misses": self._embedding_misses,
+                    "size": len(self._embeddings),
+                },
+                "query_cache": {
+                    "hits": self._results.hits,
+                    "misses": self._results.misses,
+                    "evictions": self._results.evictions,
+                    "size": len(self._results),
+                },
+            }
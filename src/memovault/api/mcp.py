@@ -1,17 +1,115 @@
 """MCP Server for Claude Code integration."""
 
 import asyncio
-from typing import Any
+import os
+import time
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable, Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from fastmcp import Context, FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from memovault.api._coalescer import SearchCoalescer
+from memovault.api._query_cache import QueryCache
+from memovault.config.settings import get_settings
+from memovault.core.memovault import MemoVault, get_default_vault
+from memovault.utils.log import get_logger
 
-from dotenv import load_dotenv
-from fastmcp import FastMCP
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
 
-from memovault.core.memovault import MemoVault
-from memovault.utils.log import get_logger
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not available on Windows
+    uvloop = None
 
-load_dotenv()
 logger = get_logger(__name__)
 
+# Upper bound on items accepted by add_memories_batch in a single call
+MAX_BATCH_SIZE = 64
+
+# Threads for blocking vault calls (embedder/Qdrant/LLM round-trips are I/O bound)
+WORKER_THREADS = max(4, (os.cpu_count() or 1) * 2)
+
+# Seconds a memory_status payload is reused by frequent pollers
+STATUS_TTL = 0.5
+
+# Seconds to fail fast after the vault could not be initialized
+INIT_RETRY_SECONDS = 5.0
+
+# Finished consolidation jobs kept for consolidation_status
+MAX_JOBS = 16
+
+# Characters of memory/STM text shown by the list tools
+PREVIEW_LEN = 100
+_ELLIPSIS = "..."
+
+_STREAM_END = object()
+
+T = TypeVar("T")
+
+
+def _truncate(text: str, limit: int = PREVIEW_LEN) -> str:
+    """Return text cut to limit characters, marked with an ellipsis if cut."""
+    return text if len(text) <= limit else text[:limit] + _ELLIPSIS
+
+
+def _json_result(payload: dict[str, Any]) -> Any:
+    """Return a tool payload with its text content pre-serialized by orjson.
+
+    Tools keep their dict return annotation so FastMCP still publishes an
+    output schema; the ToolResult is passed through as-is. Without orjson
+    the plain dict is returned and FastMCP serializes it.
+    """
+    if orjson is None:
+        return payload
+    return ToolResult(
+        content=[TextContent(type="text", text=orjson.dumps(payload).decode())],
+        structured_content=payload,
+    )
+
+
+async def _serve(server: Awaitable[None]) -> None:
+    """Await a server coroutine with a bounded default executor installed.
+
+    Every asyncio.to_thread() call in the tools runs on this pool.
+    """
+    executor = ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="memovault")
+    asyncio.get_running_loop().set_default_executor(executor)
+    await server
+
+
+class _InflightLimit(Middleware):
+    """Cap the number of tool calls running at once.
+
+    Calls beyond the limit wait on a semaphore instead of piling more work
+    onto the worker pool's unbounded queue.
+    """
+
+    def __init__(self, limit: int):
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> ToolResult:
+        async with self._semaphore:
+            return await call_next(context)
+
+
+async def _iterate_in_thread(iterator: Iterator[str]) -> AsyncGenerator[str, None]:
+    """Drive a blocking iterator from a worker thread, one item at a time."""
+    while True:
+        item = await asyncio.to_thread(next, iterator, _STREAM_END)
+        if item is _STREAM_END:
+            return
+        yield item
+
 
 class MemoVaultMCPServer:
     """MCP Server for MemoVault - integrates with Claude Code."""
@@ -20,29 +118,137 @@ class MemoVaultMCPServer:
         """Initialize the MCP server.
 
         Args:
-            memovault: Optional MemoVault instance. If not provided, creates lazily.
+            memovault: Optional MemoVault instance. If not provided, the shared
+                process-wide vault is attached lazily.
         """
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
         self.mcp = FastMCP("MemoVault Memory System")
+        settings = memovault.settings if memovault is not None else get_settings()
+        self.mcp.add_middleware(_InflightLimit(settings.max_inflight))
         self._provided_vault = memovault
         self._vault: MemoVault | None = memovault
+        self._qcache: QueryCache | None = None
+        self._coalescer: SearchCoalescer | None = None
+        self._static_status: dict[str, Any] | None = None
+        # Identical calls currently running, shared by concurrent duplicates
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        # Bumped on every write so cached payloads never outlive a change
+        self._version = 0
+        # (expiry, version, payload) of the last memory_status call
+        self._status: tuple[float, int, dict[str, Any]] | None = None
+        # (retry time, message) of the last failed vault initialization
+        self._init_error: tuple[float, str] | None = None
+        # Background consolidation jobs by id, oldest first
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._tasks: set[asyncio.Task] = set()
 
         self._setup_tools()
+        self._setup_routes()
         logger.info("MemoVault MCP Server initialized")
 
     @property
     def vault(self) -> MemoVault:
-        """Lazily initialize MemoVault on first access."""
+        """Lazily attach the shared MemoVault on first access.
+
+        After a failed initialization, calls within INIT_RETRY_SECONDS fail
+        fast with the same message instead of retrying backend connections.
+        """
         if self._vault is None:
+            if self._init_error is not None and time.monotonic() < self._init_error[0]:
+                raise RuntimeError(self._init_error[1])
             try:
-                self._vault = MemoVault()
+                self._vault = get_default_vault()
             except Exception as e:
-                logger.error(f"Failed to initialize MemoVault: {e}")
-                raise RuntimeError(
+                logger.error("Failed to initialize MemoVault: %s", e)
+                message = (
                     f"MemoVault backend unavailable: {e}. "
                     "Make sure Ollama and Qdrant are running (docker compose --profile vector up)."
-                ) from e
+                )
+                self._init_error = (time.monotonic() + INIT_RETRY_SECONDS, message)
+                raise RuntimeError(message) from e
+            self._init_error = None
         return self._vault
 
+    @property
+    def qcache(self) -> QueryCache:
+        """Query cache for search results, shared with other APIs on the same vault."""
+        if self._qcache is None:
+            self._qcache = QueryCache.for_vault(self.vault)
+        return self._qcache
+
+    @property
+    def coalescer(self) -> SearchCoalescer:
+        """Batches concurrent search_memories calls into one backend call."""
+        if self._coalescer is None:
+            window = self.vault.settings.search_batch_window_ms / 1000
+            self._coalescer = SearchCoalescer(self.vault, window=window)
+        return self._coalescer
+
+    @property
+    def static_status(self) -> dict[str, Any]:
+        """Status fields that are fixed for the lifetime of the vault."""
+        if self._static_status is None:
+            settings = self.vault.settings
+            self._static_status = {
+                "backend": self.vault._memory_config.backend,
+                "auto_score": settings.auto_score,
+                "importance_threshold": settings.importance_threshold,
+                "scorer_model": (
+                    settings.scorer_ollama_model or settings.scorer_openai_model or None
+                ),
+            }
+        return self._static_status
+
+    async def _embed_query(self, query: str) -> list[float] | None:
+        """Embed a query, reusing the vector for repeated identical text.
+
+        Returns None when the backend has no embedder.
+        """
+        # Cached vectors are returned without a thread hop
+        vector = self.qcache.cached_embedding(query)
+        if vector is not None:
+            return vector
+        return await asyncio.to_thread(self.qcache.embed, query)
+
+    async def _single_flight(self, key: Hashable, work: Callable[[], Awaitable[T]]) -> T:
+        """Run work once for concurrent calls sharing the same key.
+
+        The first caller runs the work; duplicates arriving while it is in
+        flight await its result instead of repeating the embed/search/LLM calls.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await work()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an unawaited failure is not logged twice
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached search results and status after the vault changes."""
+        self._version += 1
+        # The cache may hold results stored by the REST API even if this
+        # server never searched
+        if self._vault is not None:
+            self.qcache.invalidate()
+
     def _setup_tools(self):
         """Set up MCP tools."""
 
@@ -70,14 +276,57 @@ class MemoVaultMCPServer:
                 if memory_type:
                     metadata["type"] = memory_type
 
-                ids = self.vault.add(content, skip_scoring=skip_scoring, **metadata)
+                ids = await asyncio.to_thread(
+                    self.vault.add, content, skip_scoring=skip_scoring, **metadata
+                )
+                self._invalidate_cache()
                 if ids:
                     return f"Memory stored successfully (ID: {ids[0]})"
                 return "Memory was not stored (below importance threshold)"
             except Exception as e:
-                logger.error(f"Error adding memory: {e}")
+                logger.error("Error adding memory: %s", e)
                 return f"Error storing memory: {str(e)}"
 
+        @self.mcp.tool()
+        async def add_memories_batch(
+            contents: list[str],
+            memory_type: str | None = None,
+            skip_scoring: bool = False,
+        ) -> dict[str, Any]:
+            """Store several pieces of information in one call.
+
+            Prefer this over repeated add_memory calls for bulk ingest: all
+            items are embedded together in a single backend request.
+            At most 64 items are accepted per call.
+
+            Args:
+                contents: The pieces of information to remember (max 64)
+                memory_type: Optional type applied to every item
+                skip_scoring: If True, bypass importance scoring and store directly
+
+            Returns:
+                Dictionary with the stored memory IDs and their count
+            """
+            if len(contents) > MAX_BATCH_SIZE:
+                return {
+                    "error": f"Batch too large ({len(contents)} items, max {MAX_BATCH_SIZE})",
+                    "ids": [],
+                    "count": 0,
+                }
+            try:
+                metadata = {}
+                if memory_type:
+                    metadata["type"] = memory_type
+
+                ids = await asyncio.to_thread(
+                    self.vault.add, contents, skip_scoring=skip_scoring, **metadata
+                )
+                self._invalidate_cache()
+                return {"ids": ids, "count": len(ids)}
+            except Exception as e:
+                logger.error("Error adding memories: %s", e)
+                return {"error": str(e), "ids": [], "count": 0}
+
         @self.mcp.tool()
         async def search_memories(
             query: str,
@@ -99,38 +348,63 @@ class MemoVaultMCPServer:
             Returns:
                 Dictionary with matching memories
             """
-            try:
-                kwargs: dict[str, Any] = {}
-                filter_dict: dict[str, Any] = {}
-                if memory_type:
-                    filter_dict["metadata.type"] = memory_type
-                if source:
-                    filter_dict["metadata.source"] = source
-                if filter_dict:
-                    kwargs["filter"] = filter_dict
+            async def run() -> dict[str, Any]:
+                try:
+                    filter_dict: dict[str, Any] = {}
+                    if memory_type:
+                        filter_dict["metadata.type"] = memory_type
+                    if source:
+                        filter_dict["metadata.source"] = source
+
+                    # Near-duplicate queries are answered from the semantic cache;
+                    # the REST API shares it but stores its own value shape
+                    cache_key = ("mcp-search", top_k, memory_type, source, max_age_days)
+                    generation = self.qcache.generation
+                    query_vector = await self._embed_query(query)
+                    if query_vector is not None:
+                        cached = self.qcache.get(query_vector, cache_key)
+                        if cached is not None:
+                            # Count the recall as search() would have
+                            ids = [mem["id"] for mem in cached["memories"]]
+                            await asyncio.to_thread(self.vault.record_recalls, ids)
+                            return _json_result(cached)
+
+                    # Concurrent searches share one batched backend call
+                    results = await self.coalescer.search(
+                        query,
+                        top_k,
+                        max_age_days=max_age_days,
+                        filter_dict=filter_dict or None,
+                        query_vector=query_vector,
+                    )
+                    payload = {
+                        "memories": [
+                            {
+                                "id": mem.id,
+                                "memory": mem.memory,
+                                "type": mem.metadata.type,
+                            }
+                            for mem in results
+                        ],
+                        "total": len(results),
+                    }
+                    if query_vector is not None:
+                        self.qcache.put(query_vector, payload, cache_key, generation)
+                    return _json_result(payload)
+                except Exception as e:
+                    logger.error("Error searching memories: %s", e)
+                    return {"error": str(e), "memories": [], "total": 0}
 
-                results = self.vault.search(query, top_k, max_age_days=max_age_days, **kwargs)
-                return {
-                    "memories": [
-                        {
-                            "id": mem.id,
-                            "memory": mem.memory,
-                            "type": mem.metadata.type,
-                        }
-                        for mem in results
-                    ],
-                    "total": len(results),
-                }
-            except Exception as e:
-                logger.error(f"Error searching memories: {e}")
-                return {"error": str(e), "memories": [], "total": 0}
+            return await self._single_flight(("search", query, top_k, memory_type, source, max_age_days), run)
 
         @self.mcp.tool()
-        async def chat_with_memory(query: str, top_k: int = 5) -> str:
+        async def chat_with_memory(query: str, ctx: Context, top_k: int = 5) -> str:
             """Chat with memory-enhanced responses.
 
             Use this for questions where stored memories might provide context.
             The response will incorporate relevant memories automatically.
+            Partial text is sent as progress notifications while the reply
+            is generated.
 
             Args:
                 query: User's question or message
@@ -139,12 +413,23 @@ class MemoVaultMCPServer:
             Returns:
                 AI response enhanced with relevant memories
             """
-            try:
-                response = self.vault.chat(query, top_k=top_k)
-                return response
-            except Exception as e:
-                logger.error(f"Error in chat: {e}")
-                return f"Error generating response: {str(e)}"
+            async def run() -> str:
+                try:
+                    chunks: list[str] = []
+                    generated = 0
+                    # chat_stream() has its own reply cache and records every
+                    # turn, including cached ones, in the chat history
+                    stream = self.vault.chat_stream(query, top_k=top_k)
+                    async for chunk in _iterate_in_thread(stream):
+                        chunks.append(chunk)
+                        generated += len(chunk)
+                        await ctx.report_progress(generated, message=chunk)
+                    return "".join(chunks)
+                except Exception as e:
+                    logger.error("Error in chat: %s", e)
+                    return f"Error generating response: {str(e)}"
+
+            return await self._single_flight(("chat", query, top_k), run)
 
         @self.mcp.tool()
         async def get_memory(memory_id: str) -> dict[str, Any]:
@@ -156,19 +441,22 @@ class MemoVaultMCPServer:
             Returns:
                 The memory content and metadata
             """
-            try:
-                memory = self.vault.get(memory_id)
-                if memory:
-                    return {
-                        "id": memory.id,
-                        "memory": memory.memory,
-                        "type": memory.metadata.type,
-                        "created_at": memory.metadata.created_at,
-                    }
-                return {"error": "Memory not found"}
-            except Exception as e:
-                logger.error(f"Error getting memory: {e}")
-                return {"error": str(e)}
+            async def run() -> dict[str, Any]:
+                try:
+                    memory = await asyncio.to_thread(self.vault.get, memory_id)
+                    if memory:
+                        return {
+                            "id": memory.id,
+                            "memory": memory.memory,
+                            "type": memory.metadata.type,
+                            "created_at": memory.metadata.created_at,
+                        }
+                    return {"error": "Memory not found"}
+                except Exception as e:
+                    logger.error("Error getting memory: %s", e)
+                    return {"error": str(e)}
+
+            return await self._single_flight(("get", memory_id), run)
 
         @self.mcp.tool()
         async def delete_memory(memory_id: str) -> str:
@@ -181,10 +469,11 @@ class MemoVaultMCPServer:
                 Confirmation message
             """
             try:
-                self.vault.delete(memory_id)
+                await asyncio.to_thread(self.vault.delete, memory_id)
+                self._invalidate_cache()
                 return f"Memory deleted successfully (ID: {memory_id})"
             except Exception as e:
-                logger.error(f"Error deleting memory: {e}")
+                logger.error("Error deleting memory: %s", e)
                 return f"Error deleting memory: {str(e)}"
 
         @self.mcp.tool()
@@ -198,25 +487,26 @@ class MemoVaultMCPServer:
                 Dictionary with list of recent memories
             """
             try:
-                all_memories = self.vault.get_all()
-                # Get most recent (last added)
-                recent = all_memories[-limit:] if len(all_memories) > limit else all_memories
-                recent.reverse()  # Most recent first
+                # Most recent first; the backend returns pre-truncated previews
+                recent, total = await asyncio.gather(
+                    asyncio.to_thread(self.vault.get_recent_previews, limit, PREVIEW_LEN),
+                    asyncio.to_thread(self.vault.count),
+                )
 
-                return {
+                return _json_result({
                     "memories": [
                         {
-                            "id": mem.id,
-                            "memory": mem.memory[:100] + "..." if len(mem.memory) > 100 else mem.memory,
-                            "type": mem.metadata.type,
+                            "id": mem_id,
+                            "memory": preview + _ELLIPSIS if truncated else preview,
+                            "type": mem_type,
                         }
-                        for mem in recent
+                        for mem_id, preview, truncated, mem_type in recent
                     ],
-                    "total_in_vault": len(all_memories),
+                    "total_in_vault": total,
                     "returned": len(recent),
-                }
+                })
             except Exception as e:
-                logger.error(f"Error listing memories: {e}")
+                logger.error("Error listing memories: %s", e)
                 return {"error": str(e), "memories": [], "total_in_vault": 0}
 
         @self.mcp.tool()
@@ -229,11 +519,12 @@ class MemoVaultMCPServer:
                 Confirmation message
             """
             try:
-                count = self.vault.count()
-                self.vault.delete_all()
+                count = await asyncio.to_thread(self.vault.count)
+                await asyncio.to_thread(self.vault.delete_all)
+                self._invalidate_cache()
                 return f"All {count} memories have been deleted"
             except Exception as e:
-                logger.error(f"Error clearing memories: {e}")
+                logger.error("Error clearing memories: %s", e)
                 return f"Error clearing memories: {str(e)}"
 
         @self.mcp.tool()
@@ -243,24 +534,28 @@ class MemoVaultMCPServer:
             Returns:
                 Dictionary with status information
             """
-            try:
-                scorer_model = (
-                    self.vault.settings.scorer_ollama_model
-                    or self.vault.settings.scorer_openai_model
-                    or None
-                )
+            cached = self._status
+            if cached and cached[1] == self._version and time.monotonic() < cached[0]:
+                return cached[2]
+
+            async def run() -> dict[str, Any]:
+                version = self._version
                 stm_count = self.vault.stm.count() if self.vault.stm else 0
-                return {
+                memory_count = await asyncio.to_thread(self.vault.count)
+                status = {
                     "status": "active",
-                    "memory_count": self.vault.count(),
-                    "backend": self.vault._memory_config.backend,
-                    "auto_score": self.vault.settings.auto_score,
-                    "importance_threshold": self.vault.settings.importance_threshold,
-                    "scorer_model": scorer_model,
+                    "memory_count": memory_count,
+                    **self.static_status,
                     "stm_active": stm_count,
+                    **self.qcache.stats(),
                 }
+                self._status = (time.monotonic() + STATUS_TTL, version, status)
+                return status
+
+            try:
+                return await self._single_flight(("memory_status",), run)
             except Exception as e:
-                logger.error(f"Error getting status: {e}")
+                logger.error("Error getting status: %s", e)
                 return {"status": "error", "error": str(e)}
 
         # =====================================================================
@@ -279,12 +574,12 @@ class MemoVaultMCPServer:
             try:
                 if self.vault.stm is None:
                     return {"items": [], "total": 0, "message": "STM is disabled"}
-                items = self.vault.stm.get_active()
+                items = await asyncio.to_thread(self.vault.stm.get_active)
                 return {
                     "items": [
                         {
                             "id": item.id,
-                            "content": item.content[:100] + "..." if len(item.content) > 100 else item.content,
+                            "content": _truncate(item.content),
                             "utility_score": item.utility_score,
                             "category": item.category,
                             "decay_turns": item.decay_turns,
@@ -294,7 +589,7 @@ class MemoVaultMCPServer:
                     "total": len(items),
                 }
             except Exception as e:
-                logger.error(f"Error listing STM: {e}")
+                logger.error("Error listing STM: %s", e)
                 return {"error": str(e), "items": [], "total": 0}
 
         @self.mcp.tool()
@@ -308,30 +603,20 @@ class MemoVaultMCPServer:
                 Dictionary with lifecycle statistics
             """
             try:
-                all_memories = self.vault.get_all()
-                candidates = sum(
-                    1 for m in all_memories
-                    if getattr(m.metadata, "ltm_status", None) == "candidate"
-                )
-                promoted = sum(
-                    1 for m in all_memories
-                    if getattr(m.metadata, "ltm_status", None) == "promoted"
-                )
-                legacy = sum(
-                    1 for m in all_memories
-                    if getattr(m.metadata, "ltm_status", None) is None
-                )
+                counts = await asyncio.to_thread(self.vault.count_by_ltm_status)
+                legacy = counts.get(None, 0)
                 stm_count = self.vault.stm.count() if self.vault.stm else 0
 
                 return {
                     "stm_active": stm_count,
-                    "ltm_candidates": candidates,
-                    "ltm_promoted": promoted,
+                    "ltm_candidates": counts.get("candidate", 0),
+                    # Legacy memories without a status are treated as promoted
+                    "ltm_promoted": counts.get("promoted", 0) + legacy,
                     "ltm_legacy": legacy,
-                    "total_ltm": len(all_memories),
+                    "total_ltm": sum(counts.values()),
                 }
             except Exception as e:
-                logger.error(f"Error getting lifecycle stats: {e}")
+                logger.error("Error getting lifecycle stats: %s", e)
                 return {"error": str(e)}
 
         # =====================================================================
@@ -354,10 +639,11 @@ class MemoVaultMCPServer:
                 Confirmation message
             """
             try:
-                self.vault.update_profile(field, value)
+                await asyncio.to_thread(self.vault.update_profile, field, value)
+                self._invalidate_cache()
                 return f"Profile field '{field}' updated successfully"
             except Exception as e:
-                logger.error(f"Error updating profile: {e}")
+                logger.error("Error updating profile: %s", e)
                 return f"Error updating profile: {str(e)}"
 
         @self.mcp.tool()
@@ -368,9 +654,9 @@ class MemoVaultMCPServer:
                 Dictionary with all profile fields
             """
             try:
-                return self.vault.get_profile()
+                return await asyncio.to_thread(self.vault.get_profile)
             except Exception as e:
-                logger.error(f"Error getting profile: {e}")
+                logger.error("Error getting profile: %s", e)
                 return {"error": str(e)}
 
         # =====================================================================
@@ -388,12 +674,13 @@ class MemoVaultMCPServer:
                 The session summary or a message if nothing to summarize
             """
             try:
-                summary = self.vault.end_session()
+                summary = await asyncio.to_thread(self.vault.end_session)
+                self._invalidate_cache()
                 if summary:
                     return f"Session ended. Summary stored:\n{summary}"
                 return "No chat history to summarize"
             except Exception as e:
-                logger.error(f"Error ending session: {e}")
+                logger.error("Error ending session: %s", e)
                 return f"Error ending session: {str(e)}"
 
         @self.mcp.tool()
@@ -410,19 +697,27 @@ class MemoVaultMCPServer:
                 Dictionary with profile, recap, and relevant facts
             """
             try:
-                context = self.vault.get_session_context(
-                    query=first_message, top_k=5
+                memories = None
+                if first_message:
+                    # Reuses cached query embeddings and batches with other searches
+                    query_vector = await self._embed_query(first_message)
+                    memories = await self.coalescer.search(
+                        first_message, 5, query_vector=query_vector
+                    )
+
+                # One context build; the formatted view is derived from it
+                context = await asyncio.to_thread(
+                    self.vault.get_session_context, top_k=5, memories=memories
                 )
+                formatted = self.vault.format_session_context(context)
                 return {
                     "profile": context["profile"],
                     "recap": context["recap"],
                     "relevant_facts": context["relevant_facts"],
-                    "formatted": self.vault.get_formatted_session_context(
-                        query=first_message, top_k=5
-                    ),
+                    "formatted": formatted,
                 }
             except Exception as e:
-                logger.error(f"Error starting session: {e}")
+                logger.error("Error starting session: %s", e)
                 return {"error": str(e)}
 
         # =====================================================================
@@ -440,22 +735,133 @@ class MemoVaultMCPServer:
                 threshold: Similarity threshold (0.0-1.0) for considering
                           memories as duplicates (default: 0.85)
 
+            Consolidation runs in the background; poll consolidation_status
+            with the returned job_id. While a job is running, calling this
+            again returns that job instead of starting another one.
+
             Returns:
-                Statistics about the consolidation
+                The consolidation job (job_id, status and progress)
             """
             try:
-                stats = self.vault.consolidate_memories(
-                    similarity_threshold=threshold
-                )
-                return {
-                    "status": "completed",
-                    "merged_groups": stats["merged_groups"],
-                    "total_removed": stats["total_removed"],
+                for job in self._jobs.values():
+                    if job["status"] == "running":
+                        return dict(job)
+
+                job = {
+                    "job_id": uuid.uuid4().hex,
+                    "status": "running",
+                    "processed": 0,
+                    "total": 0,
+                    "merged_groups": 0,
+                    "total_removed": 0,
                 }
+                self._jobs[job["job_id"]] = job
+                # Forget the oldest finished jobs
+                while len(self._jobs) > MAX_JOBS:
+                    del self._jobs[next(iter(self._jobs))]
+
+                task = asyncio.create_task(self._run_consolidation(job, threshold))
+                # Keep a reference so the task is not garbage collected mid-flight
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                return dict(job)
             except Exception as e:
-                logger.error(f"Error consolidating memories: {e}")
+                logger.error("Error consolidating memories: %s", e)
                 return {"error": str(e)}
 
+        @self.mcp.tool()
+        async def consolidation_status(job_id: str) -> dict[str, Any]:
+            """Get the progress of a consolidate_memories job.
+
+            Args:
+                job_id: Job ID returned by consolidate_memories
+
+            Returns:
+                The job's status (running, completed or failed) and progress
+            """
+            job = self._jobs.get(job_id)
+            if job is None:
+                return {"error": "Unknown job_id"}
+            return dict(job)
+
+    async def _run_consolidation(self, job: dict[str, Any], threshold: float) -> None:
+        """Run a consolidation job on the worker pool, recording progress in job."""
+
+        def progress(processed: int, total: int, merged_groups: int) -> None:
+            job.update(processed=processed, total=total, merged_groups=merged_groups)
+
+        try:
+            stats = await asyncio.to_thread(
+                self.vault.consolidate_memories,
+                similarity_threshold=threshold,
+                progress_fn=progress,
+            )
+            job.update(status="completed", **stats)
+        except Exception as e:
+            logger.error("Error consolidating memories: %s", e)
+            job.update(status="failed", error=str(e))
+        finally:
+            self._invalidate_cache()
+
+    def _setup_routes(self):
+        """Set up extra HTTP routes (served by the http/sse transports)."""
+
+        @self.mcp.custom_route("/batch", methods=["POST"])
+        async def batch(request: Request) -> JSONResponse:
+            """Run several tool calls concurrently.
+
+            The body is a JSON list of {"tool": name, "arguments": {...}}
+            objects; results are returned in the same order. Queries of
+            search calls are embedded together in one embedder call.
+            """
+            try:
+                calls = await request.json()
+            except Exception:
+                return JSONResponse({"error": "Body must be JSON"}, status_code=400)
+            if not isinstance(calls, list) or not all(
+                isinstance(c, dict) and isinstance(c.get("tool"), str) for c in calls
+            ):
+                return JSONResponse(
+                    {"error": 'Body must be a list of {"tool": ..., "arguments": {...}}'},
+                    status_code=400,
+                )
+            if len(calls) > MAX_BATCH_SIZE:
+                return JSONResponse(
+                    {"error": f"Batch too large: {len(calls)} calls (max {MAX_BATCH_SIZE})"},
+                    status_code=400,
+                )
+
+            queries = [
+                c["arguments"]["query"]
+                for c in calls
+                if c["tool"] == "search_memories"
+                and isinstance(c.get("arguments"), dict)
+                and isinstance(c["arguments"].get("query"), str)
+            ]
+            try:
+                await asyncio.to_thread(self.qcache.prime, queries)
+            except Exception as e:
+                # Tools fall back to embedding their own queries
+                logger.warning("Batch embedding failed: %s", e)
+
+            async def dispatch(call: dict[str, Any]) -> dict[str, Any]:
+                try:
+                    result = await self.mcp.call_tool(call["tool"], call.get("arguments") or {})
+                except Exception as e:
+                    logger.error("Error in batch call to %s: %s", call["tool"], e)
+                    return {"tool": call["tool"], "error": str(e)}
+                if result.structured_content is not None:
+                    output = result.structured_content
+                    # Scalar returns are wrapped as {"result": value} by FastMCP
+                    if set(output) == {"result"}:
+                        output = output["result"]
+                else:
+                    output = "".join(getattr(block, "text", "") for block in result.content)
+                return {"tool": call["tool"], "result": output}
+
+            results = await asyncio.gather(*(dispatch(call) for call in calls))
+            return JSONResponse(results)
+
     def run(self, transport: str = "stdio", **kwargs):
         """Run the MCP server.
 
@@ -464,15 +870,17 @@ class MemoVaultMCPServer:
             **kwargs: Additional arguments for HTTP/SSE transport (host, port)
         """
         if transport == "stdio":
-            self.mcp.run(transport="stdio", show_banner=False)
-        elif transport == "http":
-            host = kwargs.get("host", "localhost")
-            port = kwargs.get("port", 8000)
-            asyncio.run(self.mcp.run_http_async(host=host, port=port))
-        elif transport == "sse":
+            asyncio.run(_serve(self.mcp.run_stdio_async(show_banner=False)))
+        elif transport in ("http", "sse"):
             host = kwargs.get("host", "localhost")
             port = kwargs.get("port", 8000)
-            self.mcp.run(transport="sse", host=host, port=port)
+            server = _serve(self.mcp.run_http_async(transport=transport, host=host, port=port))
+            # uvloop's event loop is markedly faster for many concurrent
+            # embedder/LLM requests; fall back to asyncio where unavailable
+            if uvloop is not None:
+                uvloop.run(server)
+            else:
+                asyncio.run(server)
         else:
             raise ValueError(f"Unsupported transport: {transport}")
 
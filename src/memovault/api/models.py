@@ -2,12 +2,14 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AddMemoryRequest(BaseModel):
     """Request to add a memory."""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str = Field(..., description="Memory content to add")
     type: str | None = Field(default=None, description="Memory type")
     tags: list[str] | None = Field(default=None, description="Memory tags")
@@ -17,6 +19,8 @@ class AddMemoryRequest(BaseModel):
 class SearchRequest(BaseModel):
     """Request to search memories."""
 
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(..., min_length=1, max_length=4096, description="Search query")
     top_k: int = Field(default=5, ge=1, le=100, description="Number of results to return")
     memory_type: str | None = Field(default=None, description="Filter by memory type")
@@ -27,6 +31,8 @@ class SearchRequest(BaseModel):
 class ChatRequest(BaseModel):
     """Request for memory-enhanced chat."""
 
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(..., description="User query")
     top_k: int = Field(default=5, description="Number of memories to use as context")
     include_history: bool = Field(default=True, description="Include chat history")
@@ -35,6 +41,8 @@ class ChatRequest(BaseModel):
 class MemoryResponse(BaseModel):
     """Response containing a memory."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Memory ID")
     memory: str = Field(..., description="Memory content")
     type: str | None = Field(default=None, description="Memory type")
@@ -47,13 +55,27 @@ class MemoryResponse(BaseModel):
 class SearchResponse(BaseModel):
     """Response containing search results."""
 
+    model_config = ConfigDict(frozen=True)
+
     memories: list[MemoryResponse] = Field(..., description="List of matching memories")
     total: int = Field(..., description="Total number of results")
 
 
+class MemoryListResponse(BaseModel):
+    """Response containing a page of stored memories."""
+
+    model_config = ConfigDict(frozen=True)
+
+    memories: list[MemoryResponse] = Field(..., description="Memories, newest first")
+    total: int = Field(..., description="Total number of matching memories")
+    returned: int = Field(..., description="Number of memories returned")
+
+
 class ChatResponse(BaseModel):
     """Response from chat."""
 
+    model_config = ConfigDict(frozen=True)
+
     response: str = Field(..., description="Assistant response")
     memories_used: int = Field(..., description="Number of memories used as context")
 
@@ -61,6 +83,8 @@ class ChatResponse(BaseModel):
 class StatusResponse(BaseModel):
     """Status response."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Status message")
     memory_count: int = Field(..., description="Total number of memories")
 
@@ -70,6 +94,8 @@ class StatusResponse(BaseModel):
 class ProfileUpdateRequest(BaseModel):
     """Request to update a profile field."""
 
+    model_config = ConfigDict(frozen=True)
+
     value: str | int | float | bool | list[str] | dict[str, str] = Field(
         ..., description="New value for the field"
     )
@@ -85,6 +111,8 @@ class ProfileUpdateRequest(BaseModel):
 class SessionContextResponse(BaseModel):
     """Rich context for session continuity."""
 
+    model_config = ConfigDict(frozen=True)
+
     recap: list[str] = Field(default_factory=list, description="Recent session summaries (last 3)")
     relevant_facts: list[str] = Field(default_factory=list, description="Facts relevant to the query")
     profile: str = Field(default="", description="User profile summary")
@@ -93,12 +121,16 @@ class SessionContextResponse(BaseModel):
 class SessionStartRequest(BaseModel):
     """Request to start a session."""
 
+    model_config = ConfigDict(frozen=True)
+
     first_message: str | None = Field(default=None, description="Optional first message for context")
 
 
 class SessionResponse(BaseModel):
     """Response from session operations."""
 
+    model_config = ConfigDict(frozen=True)
+
     summary: str | None = Field(default=None, description="Session summary")
     message: str = Field(..., description="Status message")
 
@@ -106,12 +138,16 @@ class SessionResponse(BaseModel):
 class ConsolidateRequest(BaseModel):
     """Request to consolidate memories."""
 
+    model_config = ConfigDict(frozen=True)
+
     threshold: float = Field(default=0.85, description="Similarity threshold (0.0-1.0)")
 
 
 class ConsolidateResponse(BaseModel):
     """Response from memory consolidation."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Consolidation status")
     merged_groups: int = Field(..., description="Number of groups merged")
     total_removed: int = Field(..., description="Net memories removed")
@@ -120,6 +156,8 @@ class ConsolidateResponse(BaseModel):
 class STMItemResponse(BaseModel):
     """Response containing an STM item."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="STM item ID")
     content: str = Field(..., description="Memory content")
     utility_score: int = Field(..., description="Utility score (0-3)")
@@ -132,6 +170,8 @@ class STMItemResponse(BaseModel):
 class TokenStatsResponse(BaseModel):
     """Token economics for the current session."""
 
+    model_config = ConfigDict(frozen=True)
+
     discovery_tokens: int = Field(..., description="Estimated tokens spent on search queries")
     read_tokens: int = Field(..., description="Estimated tokens injected as context")
     efficiency: float = Field(..., description="read_tokens / discovery_tokens (>1 = net positive)")
@@ -140,6 +180,8 @@ class TokenStatsResponse(BaseModel):
 class StatsResponse(BaseModel):
     """Dashboard statistics response."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="System status")
     memory_count: int = Field(..., description="Total memories")
     auto_score: bool = Field(..., description="Whether auto-scoring is enabled")
@@ -1,20 +1,26 @@
 """REST API for MemoVault using FastAPI."""
 
+import json
 import os
 import uuid as _uuid
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
 
+from memovault.api._query_cache import QueryCache
 from memovault.api.models import (
     AddMemoryRequest,
     ChatRequest,
     ChatResponse,
     ConsolidateRequest,
     ConsolidateResponse,
+    MemoryListResponse,
     MemoryResponse,
     ProfileUpdateRequest,
     SearchRequest,
@@ -27,12 +33,90 @@ from memovault.api.models import (
     StatusResponse,
     TokenStatsResponse,
 )
-from memovault.core.memovault import MemoVault
+from memovault.core.memovault import MemoVault, get_default_vault
+from memovault.memory.item import MemoryItem
 from memovault.utils.log import get_logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+class _ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson.
+
+    Defined locally because fastapi.responses.ORJSONResponse is deprecated
+    in recent FastAPI releases.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+API_VERSION = "0.1.0"
+
+# Bodies of fixed responses, encoded once instead of per request
+_ROOT_BODY = json.dumps({"message": "MemoVault API", "version": API_VERSION}).encode()
+_INTERNAL_ERROR_BODY = json.dumps({"detail": "Internal server error"}).encode()
+_CHAT_CLEARED_BODY = json.dumps({"message": "Chat history cleared"}).encode()
+
+
+def _memory_row(mem: MemoryItem) -> dict[str, Any]:
+    """Build a MemoryResponse-shaped dict without constructing a model."""
+    meta = mem.metadata
+    return {
+        "id": mem.id,
+        "memory": mem.memory,
+        "type": meta.type,
+        "created_at": meta.created_at,
+        "ltm_status": meta.ltm_status,
+        "recall_count": meta.recall_count,
+        "final_score": meta.final_score,
+    }
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a JSON value to bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _iter_memory_list(pages: Iterable[list[MemoryItem]], total: int) -> Iterator[bytes]:
+    """Encode a MemoryListResponse body page by page.
+
+    Rows are written as they are loaded, so only one page of memories is
+    held in memory. 'returned' comes last since it is only known at the end.
+    """
+    yield b'{"memories":['
+    returned = 0
+    try:
+        for page in pages:
+            if not page:
+                continue
+            # One encoder call per page; strip the list brackets to splice it in
+            rows = _dumps([_memory_row(mem) for mem in page])[1:-1]
+            yield rows if not returned else b"," + rows
+            returned += len(page)
+    except Exception as e:
+        # Headers are already sent; end with a well-formed, shorter list
+        logger.error(f"Error streaming memories: {e}")
+    yield b'],"total":%d,"returned":%d}' % (total, returned)
+
+
+def _json_body(model: BaseModel) -> bytes:
+    """Serialize a validated response model to JSON in one pass."""
+    return model.model_dump_json().encode()
+
+
+def _json_response(body: bytes, status_code: int = 200) -> Response:
+    """Return pre-serialized JSON, bypassing FastAPI's response_model pass."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
 def create_app(memovault: MemoVault | None = None) -> FastAPI:
     """Create FastAPI application.
 
@@ -45,7 +129,8 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
     app = FastAPI(
         title="MemoVault API",
         description="REST API for MemoVault - A personal memory system",
-        version="0.1.0",
+        version=API_VERSION,
+        default_response_class=_ORJSONResponse if orjson is not None else JSONResponse,
     )
 
     # CORS — restrict to localhost origins only.
@@ -72,17 +157,22 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
         allow_headers=["Content-Type", "X-API-Key"],
     )
 
+    # Memory lists and search results are mostly prose and compress well;
+    # SSE (text/event-stream) responses are excluded by the middleware.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Global exception handler — never leak internal details to clients
     @app.exception_handler(Exception)
-    async def _unhandled(request: Request, exc: Exception) -> JSONResponse:
+    async def _unhandled(request: Request, exc: Exception) -> Response:
         logger.error("Unhandled exception: %s", exc, exc_info=True)
-        return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+        return _json_response(_INTERNAL_ERROR_BODY, status_code=500)
 
     # Initialize MemoVault
-    if memovault is None:
-        vault = MemoVault()
-    else:
-        vault = memovault
+    vault = memovault if memovault is not None else get_default_vault()
+
+    # Search/chat results for repeated or near-duplicate queries, shared with
+    # the MCP server when both serve this vault
+    qcache = QueryCache.for_vault(vault)
 
     # =========================================================================
     # Status
@@ -91,25 +181,28 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
     @app.get("/", tags=["Status"])
     async def root():
         """Root endpoint."""
-        return {"message": "MemoVault API", "version": "0.1.0"}
+        return _json_response(_ROOT_BODY)
 
     @app.get("/status", response_model=StatusResponse, tags=["Status"])
     async def status():
         """Get system status."""
-        return StatusResponse(
-            status="active",
-            memory_count=vault.count(),
-        )
+        # Health probes hit this often; vault.count() is cached by MemCube
+        return _json_response(b'{"status":"active","memory_count":%d}' % vault.count())
 
     @app.get("/stats", response_model=StatsResponse, tags=["Status"])
     async def stats():
         """Get dashboard statistics."""
         try:
             all_memories = vault.get_all()
+            # One pass buckets both memory types and LTM statuses
             type_counts: dict[str, int] = {}
+            status_counts: dict[str | None, int] = {}
             for mem in all_memories:
-                t = mem.metadata.type or "untyped"
+                meta = mem.metadata
+                t = meta.type or "untyped"
                 type_counts[t] = type_counts.get(t, 0) + 1
+                s = meta.ltm_status
+                status_counts[s] = status_counts.get(s, 0) + 1
 
             scorer_model = (
                 vault.settings.scorer_ollama_model
@@ -117,13 +210,6 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
                 or None
             )
 
-            # Count LTM statuses
-            ltm_candidates = sum(
-                1 for m in all_memories if getattr(m.metadata, "ltm_status", None) == "candidate"
-            )
-            ltm_promoted = sum(
-                1 for m in all_memories if getattr(m.metadata, "ltm_status", None) == "promoted"
-            )
             stm_count = vault.stm.count() if vault.stm else 0
 
             return StatsResponse(
@@ -136,8 +222,8 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
                 memory_types=type_counts,
                 scorer_model=scorer_model,
                 stm_count=stm_count,
-                ltm_candidate_count=ltm_candidates,
-                ltm_promoted_count=ltm_promoted,
+                ltm_candidate_count=status_counts.get("candidate", 0),
+                ltm_promoted_count=status_counts.get("promoted", 0),
             )
         except Exception as e:
             logger.error(f"Error getting stats: {e}")
@@ -193,6 +279,7 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
                     status_code=422,
                     detail="Memory was not stored (below importance threshold)",
                 )
+            qcache.invalidate()
 
             memory = vault.get(ids[0])
             if memory:
@@ -225,22 +312,36 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
             if filter_dict:
                 kwargs["filter"] = filter_dict
 
-            results = vault.search(request.query, request.top_k, max_age_days=request.max_age_days, **kwargs)
-            return SearchResponse(
-                memories=[
-                    MemoryResponse(
-                        id=mem.id,
-                        memory=mem.memory,
-                        type=mem.metadata.type,
-                        created_at=mem.metadata.created_at,
-                        ltm_status=getattr(mem.metadata, "ltm_status", None),
-                        recall_count=getattr(mem.metadata, "recall_count", None),
-                        final_score=getattr(mem.metadata, "final_score", None),
-                    )
-                    for mem in results
-                ],
-                total=len(results),
+            # Namespaced: the MCP server shares the cache with its own value shape
+            cache_key = (
+                "rest-search",
+                request.top_k,
+                request.memory_type,
+                request.source,
+                request.max_age_days,
             )
+            generation = qcache.generation
+            query_vector = qcache.embed(request.query)
+            if query_vector is not None:
+                cached = qcache.get(query_vector, cache_key)
+                if cached is not None:
+                    body, memory_ids = cached
+                    # Count the recall as search() would have
+                    vault.record_recalls(memory_ids)
+                    return _json_response(body)
+                kwargs["query_vector"] = query_vector
+
+            results = vault.search(request.query, request.top_k, max_age_days=request.max_age_days, **kwargs)
+            # One validator pass over plain dicts instead of a model per row
+            body = _json_body(SearchResponse.model_validate({
+                "memories": [_memory_row(mem) for mem in results],
+                "total": len(results),
+            }))
+            if query_vector is not None:
+                qcache.put(
+                    query_vector, (body, [mem.id for mem in results]), cache_key, generation
+                )
+            return _json_response(body)
         except Exception as e:
             logger.error(f"Error searching memories: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -279,7 +380,9 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
                 raise HTTPException(status_code=404, detail="Memory not found")
 
             vault.delete(memory_id)
-            return {"message": f"Memory {memory_id} deleted"}
+            qcache.invalidate()
+            # memory_id was validated as a UUID, so it needs no JSON escaping
+            return _json_response(b'{"message":"Memory %s deleted"}' % memory_id.encode())
         except HTTPException:
             raise
         except Exception as e:
@@ -292,35 +395,24 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
         try:
             count = vault.count()
             vault.delete_all()
+            qcache.invalidate()
             return {"message": f"Deleted {count} memories"}
         except Exception as e:
             logger.error(f"Error clearing memories: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    @app.get("/memories", tags=["Memories"])
+    @app.get("/memories", response_model=MemoryListResponse, tags=["Memories"])
     async def list_memories(limit: int = Query(default=50, ge=1, le=500)):
         """List all memories."""
         try:
-            all_memories = vault.get_all()
-            recent = all_memories[-limit:] if len(all_memories) > limit else all_memories
-            recent.reverse()
-
-            return {
-                "memories": [
-                    MemoryResponse(
-                        id=mem.id,
-                        memory=mem.memory,
-                        type=mem.metadata.type,
-                        created_at=mem.metadata.created_at,
-                        ltm_status=getattr(mem.metadata, "ltm_status", None),
-                        recall_count=getattr(mem.metadata, "recall_count", None),
-                        final_score=getattr(mem.metadata, "final_score", None),
-                    )
-                    for mem in recent
-                ],
-                "total": len(all_memories),
-                "returned": len(recent),
-            }
+            total = vault.count()
+            # Starlette drives the sync generator from its thread pool, so each
+            # page is loaded off the event loop while earlier pages are sent
+            return StreamingResponse(
+                _iter_memory_list(vault.iter_recent(limit), total),
+                media_type="application/json",
+                headers={"X-Total-Count": str(total)},
+            )
         except Exception as e:
             logger.error(f"Error listing memories: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -331,6 +423,7 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
         try:
             threshold = request.threshold if request else 0.85
             result = vault.consolidate_memories(similarity_threshold=threshold)
+            qcache.invalidate()
             return ConsolidateResponse(
                 status="completed",
                 merged_groups=result["merged_groups"],
@@ -378,7 +471,7 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
     # LTM Lifecycle
     # =========================================================================
 
-    @app.get("/memories/candidates", tags=["LTM Lifecycle"])
+    @app.get("/memories/candidates", response_model=MemoryListResponse, tags=["LTM Lifecycle"])
     async def list_candidates(limit: int = 50):
         """List LTM candidate memories."""
         try:
@@ -389,26 +482,16 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
             ]
             recent = candidates[-limit:] if len(candidates) > limit else candidates
             recent.reverse()
-            return {
-                "memories": [
-                    MemoryResponse(
-                        id=mem.id,
-                        memory=mem.memory,
-                        type=mem.metadata.type,
-                        created_at=mem.metadata.created_at,
-                        ltm_status=mem.metadata.ltm_status,
-                        recall_count=getattr(mem.metadata, "recall_count", 0),
-                        final_score=getattr(mem.metadata, "final_score", None),
-                    )
-                    for mem in recent
-                ],
+            return _json_response(_json_body(MemoryListResponse.model_validate({
+                "memories": [_memory_row(mem) for mem in recent],
                 "total": len(candidates),
-            }
+                "returned": len(recent),
+            })))
         except Exception as e:
             logger.error(f"Error listing candidates: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    @app.get("/memories/promoted", tags=["LTM Lifecycle"])
+    @app.get("/memories/promoted", response_model=MemoryListResponse, tags=["LTM Lifecycle"])
     async def list_promoted(limit: int = 50):
         """List promoted LTM memories."""
         try:
@@ -420,21 +503,11 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
             ]
             recent = promoted[-limit:] if len(promoted) > limit else promoted
             recent.reverse()
-            return {
-                "memories": [
-                    MemoryResponse(
-                        id=mem.id,
-                        memory=mem.memory,
-                        type=mem.metadata.type,
-                        created_at=mem.metadata.created_at,
-                        ltm_status=getattr(mem.metadata, "ltm_status", None),
-                        recall_count=getattr(mem.metadata, "recall_count", 0),
-                        final_score=getattr(mem.metadata, "final_score", None),
-                    )
-                    for mem in recent
-                ],
+            return _json_response(_json_body(MemoryListResponse.model_validate({
+                "memories": [_memory_row(mem) for mem in recent],
                 "total": len(promoted),
-            }
+                "returned": len(recent),
+            })))
         except Exception as e:
             logger.error(f"Error listing promoted: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -449,6 +522,7 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
 
             memory.metadata.ltm_status = "promoted"
             vault._cube.update(memory)
+            qcache.invalidate()
             return {"message": f"Memory {memory_id} promoted", "ltm_status": "promoted"}
         except HTTPException:
             raise
@@ -460,16 +534,30 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
     # Chat
     # =========================================================================
 
+    def _search_with_cached_embedding(query: str | None, top_k: int) -> list[MemoryItem] | None:
+        """Search through the query cache's embeddings (None when there is no query)."""
+        if not query:
+            return None
+        kwargs: dict[str, Any] = {}
+        query_vector = qcache.embed(query)
+        if query_vector is not None:
+            kwargs["query_vector"] = query_vector
+        return vault.search(query, top_k, **kwargs)
+
     @app.post("/chat", response_model=ChatResponse, tags=["Chat"])
     async def chat(request: ChatRequest):
         """Chat with memory-enhanced responses."""
         try:
-            memories = vault.search(request.query, request.top_k)
+            # Replies are not cached here: every exchange must reach the chat
+            # history, and chat() already records it
+            memories = _search_with_cached_embedding(request.query, request.top_k) or []
 
+            # Reuse the retrieved memories instead of searching again
             response = vault.chat(
                 request.query,
                 top_k=request.top_k,
                 include_history=request.include_history,
+                memories=memories,
             )
 
             return ChatResponse(
@@ -484,7 +572,7 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
     async def clear_chat_history():
         """Clear chat history."""
         vault.clear_chat_history()
-        return {"message": "Chat history cleared"}
+        return _json_response(_CHAT_CLEARED_BODY)
 
     # =========================================================================
     # Profile
@@ -504,6 +592,7 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
         """Update a profile field."""
         try:
             vault.update_profile(field, request.value)
+            qcache.invalidate()
             return {"message": f"Profile field '{field}' updated", "field": field}
         except Exception as e:
             logger.error(f"Error updating profile: {e}")
@@ -524,7 +613,9 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
         both prior-session recaps and query-relevant memories.
         """
         try:
-            ctx = vault.get_session_context(query=query, top_k=top_k)
+            ctx = vault.get_session_context(
+                top_k=top_k, memories=_search_with_cached_embedding(query, top_k)
+            )
             return SessionContextResponse(
                 recap=ctx["recap"],
                 relevant_facts=ctx["relevant_facts"],
@@ -539,7 +630,9 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
         """Start a new session with context loading."""
         try:
             first_message = request.first_message if request else None
-            context = vault.get_session_context(query=first_message, top_k=5)
+            context = vault.get_session_context(
+                top_k=5, memories=_search_with_cached_embedding(first_message, 5)
+            )
             return {
                 "profile": context["profile"],
                 "recap": context["recap"],
@@ -554,6 +647,7 @@ def create_app(memovault: MemoVault | None = None) -> FastAPI:
         """End current session with summary."""
         try:
             summary = vault.end_session()
+            qcache.invalidate()
             if summary:
                 return SessionResponse(
                     summary=summary,
@@ -1,19 +1,38 @@
-"""CLI entry point for MemoVault."""
+"""CLI entry point for MemoVault.
+
+Keep this module's top-level imports to the standard library: heavy
+dependencies (MemoVault, Qdrant, pydantic settings, httpx, FastAPI) are
+imported inside the command that needs them so `memovault --help` and
+argument errors stay fast. CI checks this with `python -X importtime`.
+"""
 
-import argparse
 import json
 import sys
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    import argparse
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="MemoVault - A personal memory system for AI assistants"
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    from memovault import MemoVault
 
-    # MCP server command
-    mcp_parser = subparsers.add_parser("mcp", help="Run MCP server for Claude Code")
+
+@lru_cache(maxsize=None)
+def _api_bind_options() -> "argparse.ArgumentParser":
+    """Parent parser with the REST API's --host/--port, shared by api and service start."""
+    import argparse
+
+    options = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    options.add_argument("--host", default="0.0.0.0", help="Host to bind to")
+    options.add_argument("--port", type=int, default=8080, help="Port to bind to")
+    return options
+
+
+def _add_mcp_parser(subparsers) -> None:
+    mcp_parser = subparsers.add_parser(
+        "mcp", help="Run MCP server for Claude Code", allow_abbrev=False
+    )
     mcp_parser.add_argument(
         "--transport",
         choices=["stdio", "http", "sse"],
@@ -23,15 +42,18 @@ def main():
     mcp_parser.add_argument("--host", default="localhost", help="Host for HTTP/SSE")
     mcp_parser.add_argument("--port", type=int, default=8000, help="Port for HTTP/SSE")
 
-    # REST API command
-    api_parser = subparsers.add_parser("api", help="Run REST API server")
-    api_parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
-    api_parser.add_argument("--port", type=int, default=8080, help="Port to bind to")
 
-    # Interactive shell command
+def _add_api_parser(subparsers) -> None:
+    subparsers.add_parser(
+        "api", help="Run REST API server", parents=[_api_bind_options()], allow_abbrev=False
+    )
+
+
+def _add_shell_parser(subparsers) -> None:
     subparsers.add_parser("shell", help="Interactive shell")
 
-    # Profile commands
+
+def _add_profile_parser(subparsers) -> None:
     profile_parser = subparsers.add_parser("profile", help="Manage user profile")
     profile_sub = profile_parser.add_subparsers(dest="profile_command")
     profile_sub.add_parser("show", help="Show current profile")
@@ -39,13 +61,15 @@ def main():
     set_parser.add_argument("field", help="Field name")
     set_parser.add_argument("value", help="Field value")
 
-    # Session commands
+
+def _add_session_parser(subparsers) -> None:
     session_parser = subparsers.add_parser("session", help="Manage sessions")
     session_sub = session_parser.add_subparsers(dest="session_command")
     session_sub.add_parser("start", help="Start a new session")
     session_sub.add_parser("end", help="End current session")
 
-    # Plugin commands
+
+def _add_plugins_parser(subparsers) -> None:
     plugin_parser = subparsers.add_parser("plugins", help="Manage IDE/CLI integrations")
     plugin_sub = plugin_parser.add_subparsers(dest="plugin_command")
 
@@ -58,7 +82,8 @@ def main():
 
     plugin_sub.add_parser("list", help="List all platforms and their status")
 
-    # Hook handler (called by installed hooks)
+
+def _add_hook_parser(subparsers) -> None:
     hook_parser = subparsers.add_parser("hook", help="Internal hook handler (called by IDE hooks)")
     hook_sub = hook_parser.add_subparsers(dest="hook_event")
 
@@ -69,19 +94,100 @@ def main():
     se_hook = hook_sub.add_parser("session-end", help="Stop/session-end handler")
     se_hook.add_argument("--api", default="http://localhost:8080", help="MemoVault REST API URL")
 
-    # Service commands (background daemon for REST API)
+
+def _add_service_parser(subparsers) -> None:
     svc_parser = subparsers.add_parser("service", help="Manage the MemoVault background API service")
     svc_sub = svc_parser.add_subparsers(dest="service_command")
-    svc_start = svc_sub.add_parser("start", help="Start REST API in background")
-    svc_start.add_argument("--host", default="0.0.0.0")
-    svc_start.add_argument("--port", type=int, default=8080)
+    svc_sub.add_parser(
+        "start",
+        help="Start REST API in background",
+        parents=[_api_bind_options()],
+        allow_abbrev=False,
+    )
     svc_sub.add_parser("stop", help="Stop the background service")
     svc_sub.add_parser("status", help="Show service status")
 
+
+# Subcommand name -> function adding its subparser, in --help order
+_SUBPARSERS = {
+    "mcp": _add_mcp_parser,
+    "api": _add_api_parser,
+    "shell": _add_shell_parser,
+    "profile": _add_profile_parser,
+    "session": _add_session_parser,
+    "plugins": _add_plugins_parser,
+    "hook": _add_hook_parser,
+    "service": _add_service_parser,
+}
+
+
+def _version_string() -> str:
+    from memovault import __version__
+
+    return f"memovault {__version__}"
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None if the full parser is needed.
+
+    Args:
+        argv: Command-line arguments, without the program name.
+
+    Returns:
+        The first non-flag token if it is a known subcommand, else None
+        (no command, an unknown one, or a top-level -h/--help).
+    """
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg if arg in _SUBPARSERS else None
+    return None
+
+
+def _build_parser(command: str | None = None) -> "argparse.ArgumentParser":
+    """Build the CLI argument parser.
+
+    Args:
+        command: Build only this subcommand's parser (None = all of them).
+
+    Returns:
+        The argument parser.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="MemoVault - A personal memory system for AI assistants",
+        allow_abbrev=False,
+    )
+    parser.add_argument("-V", "--version", action="version", version=_version_string())
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    if command is not None:
+        _SUBPARSERS[command](subparsers)
+    else:
+        for add_parser in _SUBPARSERS.values():
+            add_parser(subparsers)
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    # Answered before argparse is even imported
+    if len(sys.argv) >= 2 and sys.argv[1] in ("-V", "--version"):
+        print(_version_string())
+        return
+
+    # Only the invoked subcommand's parser is built; --help, errors and
+    # unknown commands fall back to the full parser.
+    parser = _build_parser(_sniff_subcommand(sys.argv[1:]))
     args = parser.parse_args()
 
     if args.command == "mcp":
-        from memovault.api.mcp import MemoVaultMCPServer
+        try:
+            from memovault.api.mcp import MemoVaultMCPServer
+        except ImportError as e:
+            print(f"MCP server dependencies are not installed: {e}", file=sys.stderr)
+            sys.exit(1)
 
         server = MemoVaultMCPServer()
         server.run(transport=args.transport, host=args.host, port=args.port)
@@ -167,20 +273,209 @@ def run_session_command(args):
         sys.exit(1)
 
 
+class _LazyVault:
+    """Stand-in that imports and creates the MemoVault on first attribute access.
+
+    Shell commands that never touch the vault (help, quit, unknown input)
+    do not pay for importing and initializing the memory stack.
+    """
+
+    def __init__(self):
+        self._vault = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._vault is None:
+            from memovault import MemoVault
+
+            self._vault = MemoVault()
+        return getattr(self._vault, name)
+
+
+class _ExitShell(Exception):
+    """Raised by the quit/exit shell commands."""
+
+
+def _shell_quit(vault: "MemoVault", arg: str) -> None:
+    raise _ExitShell
+
+
+def _shell_add(vault: "MemoVault", arg: str) -> None:
+    if not arg:
+        print("Usage: add <memory text>")
+        return
+    ids = vault.add(arg)
+    if ids:
+        print(f"Added memory: {ids[0]}")
+    else:
+        print("Memory not stored (below importance threshold)")
+
+
+def _shell_search(vault: "MemoVault", arg: str) -> None:
+    if not arg:
+        print("Usage: search <query>")
+        return
+    results = vault.search(arg)
+    if results:
+        print(f"Found {len(results)} memories:")
+        for mem in results:
+            print(f"  - {mem.memory}")
+    else:
+        print("No memories found")
+
+
+def _shell_chat(vault: "MemoVault", arg: str) -> None:
+    if not arg:
+        print("Usage: chat <message>")
+        return
+    # Print the reply as it is generated instead of after the last token
+    print("\nAssistant: ", end="", flush=True)
+    for chunk in vault.chat_stream(arg):
+        print(chunk, end="", flush=True)
+    print()
+
+
+def _shell_list(vault: "MemoVault", arg: str) -> None:
+    # Only the rows shown are fetched; the total comes from count()
+    total = vault.count()
+    if total:
+        print(f"Total memories: {total}")
+        for _, preview, truncated, mem_type in vault.get_recent_previews(10, preview_len=80):
+            if truncated:
+                preview += "..."
+            t = f" [{mem_type}]" if mem_type else ""
+            print(f"  - {preview}{t}")
+        if total > 10:
+            print(f"  ... and {total - 10} more")
+    else:
+        print("No memories stored")
+
+
+def _shell_clear(vault: "MemoVault", arg: str) -> None:
+    count = vault.count()
+    vault.delete_all()
+    print(f"Cleared {count} memories")
+
+
+def _shell_profile(vault: "MemoVault", arg: str) -> None:
+    if arg.startswith("set "):
+        field_val = arg[4:].split(" ", 1)
+        if len(field_val) == 2:
+            vault.update_profile(field_val[0], field_val[1])
+            print(f"Profile '{field_val[0]}' updated")
+        else:
+            print("Usage: profile set <field> <value>")
+    else:
+        profile = vault.get_profile()
+        print(json.dumps(profile, indent=2))
+
+
+def _shell_session(vault: "MemoVault", arg: str) -> None:
+    if arg == "end":
+        summary = vault.end_session()
+        if summary:
+            print(f"Session ended. Summary:\n{summary}")
+        else:
+            print("No chat history to summarize")
+    elif arg == "start":
+        ctx = vault.get_session_context()
+        if ctx["profile"]:
+            print(f"Profile: {ctx['profile']}")
+        if ctx["recap"]:
+            print("Recent sessions:")
+            for s in ctx["recap"]:
+                print(f"  - {s}")
+        print("Session started.")
+    else:
+        print("Usage: session {start|end}")
+
+
+def _shell_consolidate(vault: "MemoVault", arg: str) -> None:
+    result = vault.consolidate_memories()
+    print(
+        f"Consolidated: {result['merged_groups']} groups merged, "
+        f"{result['total_removed']} duplicates removed"
+    )
+
+
+def _shell_help(vault: "MemoVault", arg: str) -> None:
+    print("Commands:")
+    print("  add <text>          - Add a memory")
+    print("  search <query>      - Search memories")
+    print("  chat <message>      - Chat with memory context")
+    print("  list                - List recent memories")
+    print("  clear               - Clear all memories")
+    print("  profile             - Show user profile")
+    print("  profile set <f> <v> - Set profile field")
+    print("  session start       - Start session with context")
+    print("  session end         - End session with summary")
+    print("  consolidate         - Merge duplicate memories")
+    print("  quit                - Exit")
+
+
+_BRACKETED_PASTE_ON = "\x1b[?2004h"
+_BRACKETED_PASTE_OFF = "\x1b[?2004l"
+_PASTE_START = "\x1b[200~"
+_PASTE_END = "\x1b[201~"
+
+
+def _read_shell_lines(prompt: str) -> Iterator[str]:
+    """Yield lines typed into the shell until end of input.
+
+    Lines are read whole with sys.stdin.readline(). A bracketed paste
+    (between the terminal's paste markers) is read to its end marker and
+    yielded line by line, so each pasted line runs as its own command.
+    """
+    while True:
+        print(prompt, end="", flush=True)
+        line = sys.stdin.readline()
+        if not line:
+            return
+        if _PASTE_START not in line:
+            yield line.rstrip("\r\n")
+            continue
+
+        chunks = [line]
+        while _PASTE_END not in line:
+            line = sys.stdin.readline()
+            if not line:
+                break
+            chunks.append(line)
+        pasted = "".join(chunks).replace(_PASTE_START, "").replace(_PASTE_END, "")
+        yield from pasted.splitlines()
+
+
+# Shell command -> handler taking (vault, argument text)
+_SHELL_COMMANDS: dict[str, Callable[["MemoVault", str], None]] = {
+    "quit": _shell_quit,
+    "exit": _shell_quit,
+    "add": _shell_add,
+    "search": _shell_search,
+    "chat": _shell_chat,
+    "list": _shell_list,
+    "clear": _shell_clear,
+    "profile": _shell_profile,
+    "session": _shell_session,
+    "consolidate": _shell_consolidate,
+    "help": _shell_help,
+}
+
+
 def run_interactive_shell():
     """Run an interactive shell for MemoVault."""
-    from memovault import MemoVault
-
     print("MemoVault Interactive Shell")
     print("Commands: add, search, chat, list, clear, profile, session, consolidate, quit")
     print("-" * 60)
 
-    vault = MemoVault()
+    vault = _LazyVault()
 
-    while True:
-        try:
-            user_input = input("\n> ").strip()
+    # Ask the terminal to mark pastes so a multi-line paste is read as a block
+    bracketed_paste = sys.stdin.isatty() and sys.stdout.isatty()
+    if bracketed_paste:
+        sys.stdout.write(_BRACKETED_PASTE_ON)
 
+    try:
+        for user_input in _read_shell_lines("\n> "):
+            user_input = user_input.strip()
             if not user_input:
                 continue
 
@@ -188,118 +483,26 @@ def run_interactive_shell():
             command = parts[0].lower()
             arg = parts[1] if len(parts) > 1 else ""
 
-            if command in ("quit", "exit"):
-                print("Goodbye!")
-                break
-
-            elif command == "add":
-                if not arg:
-                    print("Usage: add <memory text>")
-                    continue
-                ids = vault.add(arg)
-                if ids:
-                    print(f"Added memory: {ids[0]}")
-                else:
-                    print("Memory not stored (below importance threshold)")
-
-            elif command == "search":
-                if not arg:
-                    print("Usage: search <query>")
-                    continue
-                results = vault.search(arg)
-                if results:
-                    print(f"Found {len(results)} memories:")
-                    for mem in results:
-                        print(f"  - {mem.memory}")
-                else:
-                    print("No memories found")
-
-            elif command == "chat":
-                if not arg:
-                    print("Usage: chat <message>")
-                    continue
-                response = vault.chat(arg)
-                print(f"\nAssistant: {response}")
-
-            elif command == "list":
-                memories = vault.get_all()
-                if memories:
-                    print(f"Total memories: {len(memories)}")
-                    for mem in memories[:10]:
-                        preview = mem.memory[:80] + "..." if len(mem.memory) > 80 else mem.memory
-                        t = f" [{mem.metadata.type}]" if mem.metadata.type else ""
-                        print(f"  - {preview}{t}")
-                    if len(memories) > 10:
-                        print(f"  ... and {len(memories) - 10} more")
-                else:
-                    print("No memories stored")
-
-            elif command == "clear":
-                count = vault.count()
-                vault.delete_all()
-                print(f"Cleared {count} memories")
-
-            elif command == "profile":
-                if arg.startswith("set "):
-                    field_val = arg[4:].split(" ", 1)
-                    if len(field_val) == 2:
-                        vault.update_profile(field_val[0], field_val[1])
-                        print(f"Profile '{field_val[0]}' updated")
-                    else:
-                        print("Usage: profile set <field> <value>")
-                else:
-                    profile = vault.get_profile()
-                    print(json.dumps(profile, indent=2))
-
-            elif command == "session":
-                if arg == "end":
-                    summary = vault.end_session()
-                    if summary:
-                        print(f"Session ended. Summary:\n{summary}")
-                    else:
-                        print("No chat history to summarize")
-                elif arg == "start":
-                    ctx = vault.get_session_context()
-                    if ctx["profile"]:
-                        print(f"Profile: {ctx['profile']}")
-                    if ctx["recap"]:
-                        print("Recent sessions:")
-                        for s in ctx["recap"]:
-                            print(f"  - {s}")
-                    print("Session started.")
-                else:
-                    print("Usage: session {start|end}")
-
-            elif command == "consolidate":
-                result = vault.consolidate_memories()
-                print(
-                    f"Consolidated: {result['merged_groups']} groups merged, "
-                    f"{result['total_removed']} duplicates removed"
-                )
-
-            elif command == "help":
-                print("Commands:")
-                print("  add <text>          - Add a memory")
-                print("  search <query>      - Search memories")
-                print("  chat <message>      - Chat with memory context")
-                print("  list                - List recent memories")
-                print("  clear               - Clear all memories")
-                print("  profile             - Show user profile")
-                print("  profile set <f> <v> - Set profile field")
-                print("  session start       - Start session with context")
-                print("  session end         - End session with summary")
-                print("  consolidate         - Merge duplicate memories")
-                print("  quit                - Exit")
-
-            else:
+            handler = _SHELL_COMMANDS.get(command)
+            if handler is None:
                 print(f"Unknown command: {command}")
                 print("Type 'help' for available commands")
-
-        except KeyboardInterrupt:
-            print("\nGoodbye!")
-            break
-        except Exception as e:
-            print(f"Error: {e}")
+                continue
+            try:
+                handler(vault, arg)
+            except _ExitShell:
+                raise
+            except Exception as e:
+                print(f"Error: {e}")
+        print("\nGoodbye!")  # end of input
+    except _ExitShell:
+        print("Goodbye!")
+    except KeyboardInterrupt:
+        print("\nGoodbye!")
+    finally:
+        if bracketed_paste:
+            sys.stdout.write(_BRACKETED_PASTE_OFF)
+            sys.stdout.flush()
 
 
 def run_plugin_command(args):
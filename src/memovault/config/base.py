@@ -2,10 +2,15 @@
 
 import json
 import os
-from typing import Any
+from typing import Any, get_args
 
 from pydantic import BaseModel, ConfigDict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 
 class BaseConfig(BaseModel):
     """Base configuration class.
@@ -14,23 +19,87 @@ class BaseConfig(BaseModel):
     Uses Pydantic's ConfigDict to enforce strict validation.
     """
 
+    # Strict everywhere, including configs built internally by from_settings():
+    # lax mode is not measurably faster to construct, and the same classes
+    # validate user-supplied JSON. Choice fields (backends, metrics) stay
+    # Literal rather than Enum: strict mode rejects plain strings for Enum
+    # fields, and Literal checks are not slower to validate.
     model_config = ConfigDict(extra="forbid", strict=True)
 
     @classmethod
-    def from_json_file(cls, json_path: str) -> "BaseConfig":
-        """Load configuration from a JSON file."""
+    def from_json_file(cls, json_path: str, *, trusted: bool = False) -> "BaseConfig":
+        """Load configuration from a JSON file.
+
+        Args:
+            json_path: Path to the JSON file.
+            trusted: Skip validation, for files this package wrote itself.
+                WARN: trusted=True bypasses validation; never use it for
+                user-supplied files. Data that does not fit the config
+                classes is still validated.
+
+        Returns:
+            The loaded configuration.
+        """
         with open(json_path, encoding="utf-8") as f:
             data = json.load(f)
+        if trusted:
+            try:
+                return cls._construct_tree(data)
+            except ValueError:
+                pass  # e.g. written by another version; validate instead
         return cls.model_validate(data)
 
+    @classmethod
+    def _construct_tree(cls, data: dict[str, Any]) -> "BaseConfig":
+        """Build a config and its nested configs without validation.
+
+        Raises:
+            ValueError: If the data does not fit the config classes.
+        """
+        if not _fits(cls, data):
+            raise ValueError(f"Data does not fit {cls.__name__}")
+
+        values = {}
+        for name, value in data.items():
+            if isinstance(value, dict):
+                annotation = cls.model_fields[name].annotation
+                candidates = [c for c in _config_classes(annotation) if _fits(c, value)]
+                if candidates:
+                    # Union members: the narrowest class that holds every key
+                    nested = min(candidates, key=lambda c: len(c.model_fields))
+                    value = nested._construct_tree(value)
+                elif _config_classes(annotation):
+                    raise ValueError(f"Field {name!r} of {cls.__name__} does not fit")
+            values[name] = value
+        return cls.model_construct(**values)
+
     def to_json_file(self, json_path: str) -> None:
         """Dump configuration to a JSON file."""
         dir_path = os.path.dirname(json_path)
         if dir_path:
             os.makedirs(dir_path, exist_ok=True)
+        if orjson is not None:
+            data = orjson.dumps(self.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+            with open(json_path, "wb") as f:
+                f.write(data)
+            return
         with open(json_path, "w", encoding="utf-8") as f:
             f.write(self.model_dump_json(indent=2))
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key."""
         return getattr(self, key, default)
+
+
+def _config_classes(annotation: Any) -> list[type[BaseConfig]]:
+    """Return the config classes named by a field annotation (X, X | None, X | Y)."""
+    args = get_args(annotation) or (annotation,)
+    return [arg for arg in args if isinstance(arg, type) and issubclass(arg, BaseConfig)]
+
+
+def _fits(config_cls: type[BaseConfig], data: dict[str, Any]) -> bool:
+    """Check that data has only known fields and every required one."""
+    fields = config_cls.model_fields
+    return data.keys() <= fields.keys() and all(
+        name in data for name, field in fields.items() if field.is_required()
+    )
@@ -1,11 +1,15 @@
 """Embedder configuration classes."""
 
+from pathlib import Path
 from typing import Any, Literal
 
 from pydantic import Field
 
 from memovault.config.base import BaseConfig
 
+# Embedding cache database created in data_dir
+EMBEDDING_CACHE_FILE = "embeddings.sqlite3"
+
 
 class BaseEmbedderConfig(BaseConfig):
     """Base configuration class for embedding models."""
@@ -18,6 +22,14 @@ class BaseEmbedderConfig(BaseConfig):
         default=8192,
         description="Maximum number of tokens per text. Texts exceeding this limit will be truncated.",
     )
+    normalize: bool = Field(
+        default=True,
+        description="L2-normalize embeddings so cosine similarity reduces to a dot product",
+    )
+    cache_path: str | None = Field(
+        default=None,
+        description="SQLite file caching embeddings by text (None disables the cache)",
+    )
 
 
 class OpenAIEmbedderConfig(BaseEmbedderConfig):
@@ -27,6 +39,10 @@ class OpenAIEmbedderConfig(BaseEmbedderConfig):
     api_base: str = Field(
         default="https://api.openai.com/v1", description="Base URL for OpenAI API"
     )
+    batch_size: int = Field(default=256, ge=1, description="Texts per embeddings request")
+    max_concurrency: int = Field(
+        default=4, ge=1, description="Maximum embeddings requests in flight at once"
+    )
 
 
 class OllamaEmbedderConfig(BaseEmbedderConfig):
@@ -44,6 +60,10 @@ class SentenceTransformerConfig(BaseEmbedderConfig):
         default=True,
         description="Whether to trust remote code when loading the model",
     )
+    batch_size: int = Field(default=64, ge=1, description="Texts per forward pass")
+    half_precision: bool = Field(
+        default=True, description="Run the model in float16 when it is loaded on a CUDA device"
+    )
 
 
 class EmbedderConfig(BaseConfig):
@@ -59,20 +79,29 @@ class EmbedderConfig(BaseConfig):
     @classmethod
     def from_settings(cls, settings: Any) -> "EmbedderConfig":
         """Create Embedder config from settings."""
+        cache_path = (
+            str(Path(settings.data_dir) / EMBEDDING_CACHE_FILE) if settings.embed_cache else None
+        )
         if settings.embedder_backend == "openai":
             config = OpenAIEmbedderConfig(
                 model_name_or_path=settings.embedder_openai_model,
                 api_key=settings.openai_api_key,
                 api_base=settings.openai_api_base,
                 embedding_dims=settings.embedder_openai_dims,
+                normalize=settings.embedder_normalize,
+                cache_path=cache_path,
             )
         elif settings.embedder_backend == "ollama":
             config = OllamaEmbedderConfig(
                 model_name_or_path=settings.embedder_ollama_model,
                 api_base=settings.ollama_api_base,
+                normalize=settings.embedder_normalize,
+                cache_path=cache_path,
             )
         else:  # sentence_transformer
             config = SentenceTransformerConfig(
                 model_name_or_path=settings.embedder_st_model,
+                normalize=settings.embedder_normalize,
+                cache_path=cache_path,
             )
         return cls(backend=settings.embedder_backend, config=config)
@@ -54,15 +54,22 @@ class MemoryConfig(BaseConfig):
     )
 
     @classmethod
-    def from_settings(cls, settings: Any) -> "MemoryConfig":
-        """Create Memory config from settings."""
+    def from_settings(cls, settings: Any, llm_config: LLMConfig | None = None) -> "MemoryConfig":
+        """Create Memory config from settings.
+
+        Args:
+            settings: MemoVault settings.
+            llm_config: Already-built LLM config from the same settings, reused
+                for the extractor instead of building an identical one.
+        """
+        extractor_llm = llm_config or LLMConfig.from_settings(settings)
         if settings.memory_backend == "simple":
             config = SimpleMemoryConfig(
-                extractor_llm=LLMConfig.from_settings(settings),
+                extractor_llm=extractor_llm,
             )
         else:  # vector
             config = VectorMemoryConfig(
-                extractor_llm=LLMConfig.from_settings(settings),
+                extractor_llm=extractor_llm,
                 vector_db=QdrantConfig.from_settings(settings),
                 embedder=EmbedderConfig.from_settings(settings),
             )
@@ -1,5 +1,7 @@
 """Environment-based settings for MemoVault."""
 
+import hashlib
+import json
 import os
 from functools import lru_cache
 from pathlib import Path
@@ -37,6 +39,11 @@ class Settings(BaseSettings):
     embedder_openai_dims: int = Field(default=1536)
     embedder_ollama_model: str = Field(default="nomic-embed-text:latest")
     embedder_st_model: str = Field(default="all-MiniLM-L6-v2")
+    embedder_normalize: bool = Field(default=True)
+    embed_cache: bool = Field(
+        default=True,
+        description="Persist embeddings in data_dir so unchanged text is not re-embedded",
+    )
 
     # Memory Settings
     memory_backend: Literal["vector", "simple"] = Field(default="vector")
@@ -48,8 +55,18 @@ class Settings(BaseSettings):
     qdrant_port: int | None = Field(default=None)
     qdrant_url: str | None = Field(default=None)
     qdrant_api_key: str | None = Field(default=None)
+    qdrant_prefer_grpc: bool = Field(default=True)
+    qdrant_grpc_port: int | None = Field(default=None)
+    qdrant_read_consistency: Literal["all", "majority", "quorum"] | None = Field(default=None)
+    qdrant_io_workers: int = Field(default=4, ge=1)
     qdrant_collection: str = Field(default="memovault_memories")
     qdrant_vector_dim: int = Field(default=1536)
+    hnsw_ef: int | None = Field(default=None)
+    hnsw_m: int = Field(default=16, ge=4)
+    hnsw_ef_construct: int = Field(default=100, ge=4)
+    embed_dtype: Literal["fp32", "int8", "binary"] = Field(default="fp32")
+    quantization_oversampling: float = Field(default=2.0, ge=1.0)
+    qdrant_on_disk: bool = Field(default=False)
 
     # Storage Settings
     data_dir: str = Field(default="./memovault_data")
@@ -59,6 +76,9 @@ class Settings(BaseSettings):
     # Set MEMOVAULT_API_HOST=0.0.0.0 explicitly to expose on the network.
     api_host: str = Field(default="127.0.0.1")
     api_port: int = Field(default=8080)
+    max_inflight: int = Field(
+        default=64, ge=1, description="Maximum MCP tool calls running at once"
+    )
 
     # Intelligence Layer
     auto_score: bool = Field(default=True)
@@ -79,6 +99,30 @@ class Settings(BaseSettings):
     promotion_recall_threshold: int = Field(
         default=3, description="Recall count required to promote candidate to LTM"
     )
+    chat_history_max_turns: int = Field(
+        default=100,
+        ge=0,
+        description="Chat turns kept in history and sent to the LLM (0 = unlimited)",
+    )
+
+    # Semantic query cache
+    semcache_tau: float = Field(
+        default=0.97, description="Cosine similarity required for a semantic cache hit"
+    )
+    semcache_size: int = Field(
+        default=256, description="Maximum entries held by the semantic query cache"
+    )
+    semcache_ttl: float = Field(
+        default=600.0, description="Seconds a cached query result stays valid (0 = no expiry)"
+    )
+    chat_cache: bool = Field(
+        default=True,
+        description="Reuse MemoVault.chat replies for near-duplicate queries (vector backend)",
+    )
+    search_batch_window_ms: float = Field(
+        default=5.0,
+        description="Window for batching concurrent MCP searches into one call (0 = off)",
+    )
 
     # Logging
     log_level: str = Field(default="INFO")
@@ -94,19 +138,88 @@ class Settings(BaseSettings):
     @property
     def data_path(self) -> Path:
         """Get the data directory as a Path object."""
-        path = Path(self.data_dir)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return _ensure_dir(self.data_dir)
 
     @property
     def qdrant_data_path(self) -> Path:
         """Get the Qdrant data directory as a Path object."""
-        path = Path(self.qdrant_path)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return _ensure_dir(self.qdrant_path)
+
+
+@lru_cache(maxsize=8)
+def _ensure_dir(path_str: str) -> Path:
+    """Create a directory once per process and return it as a Path."""
+    path = Path(path_str)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# Bump when the on-disk settings cache format changes
+SETTINGS_CACHE_VERSION = 1
+
+
+def _settings_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "memovault" / "settings.json"
+
+
+def _settings_cache_key() -> str:
+    """Hash everything the settings are loaded from.
+
+    Covers the .env file (path, mtime and size), every MEMOVAULT_*
+    environment variable and the Settings field names.
+    """
+    env_file = Path(Settings.model_config["env_file"]).absolute()
+    try:
+        stat = env_file.stat()
+        env_stamp = f"{env_file}:{stat.st_mtime_ns}:{stat.st_size}"
+    except OSError:
+        env_stamp = f"{env_file}:missing"
+
+    digest = hashlib.blake2b(digest_size=16)
+    fields = ",".join(Settings.model_fields)
+    digest.update(f"{SETTINGS_CACHE_VERSION}\0{fields}\0{env_stamp}".encode())
+    for name, value in sorted(os.environ.items()):
+        if name.upper().startswith("MEMOVAULT_"):
+            digest.update(f"\0{name}={value}".encode())
+    return digest.hexdigest()
+
+
+def _write_settings_cache(path: Path, key: str, settings: Settings) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        # The settings hold API keys, so keep the file private to the user
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "values": settings.model_dump(mode="json")}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the cache is only an optimization
 
 
 @lru_cache()
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get cached settings instance.
+
+    The validated values are also cached on disk, keyed by the .env file
+    and the MEMOVAULT_* environment, so short-lived CLI processes skip
+    .env parsing and validation when nothing changed. Set
+    MEMOVAULT_SETTINGS_CACHE=0 in the environment to always load and
+    validate through pydantic-settings.
+    """
+    if os.environ.get("MEMOVAULT_SETTINGS_CACHE", "1") == "0":
+        return Settings()
+
+    path = _settings_cache_path()
+    key = _settings_cache_key()
+    try:
+        cached = json.loads(path.read_bytes())
+        if cached["key"] == key:
+            return Settings.model_construct(**cached["values"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    settings = Settings()
+    _write_settings_cache(path, key, settings)
+    return settings
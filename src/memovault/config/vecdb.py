@@ -16,6 +16,44 @@ class QdrantConfig(BaseConfig):
         default="cosine",
         description="Distance metric for vector similarity calculation",
     )
+    hnsw_ef: int | None = Field(
+        default=None,
+        description="HNSW beam width used at search time (None = collection default)",
+    )
+    hnsw_m: int = Field(
+        default=16, ge=4, description="HNSW links per node in new collections"
+    )
+    hnsw_ef_construct: int = Field(
+        default=100, ge=4, description="HNSW beam width used while building the index"
+    )
+    embed_dtype: Literal["fp32", "int8", "binary"] = Field(
+        default="fp32",
+        description=(
+            "Storage precision for indexed vectors "
+            "(int8 = scalar, binary = 1-bit quantization)"
+        ),
+    )
+    quantization_oversampling: float = Field(
+        default=2.0,
+        ge=1.0,
+        description="Candidates fetched per result from a quantized index before rescoring",
+    )
+    on_disk: bool = Field(
+        default=False,
+        description="Keep vectors and payloads in memory-mapped files instead of RAM",
+    )
+    read_consistency: Literal["all", "majority", "quorum"] | None = Field(
+        default=None,
+        description=(
+            "Replicas that must agree on fetched points in a cluster "
+            "(None = any single replica, the fastest)"
+        ),
+    )
+    io_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Threads for concurrent server requests (upsert batches, scroll prefetch)",
+    )
 
     # Connection options (mutually exclusive patterns)
     host: str | None = Field(default=None, description="Host for Qdrant server")
@@ -23,6 +61,12 @@ class QdrantConfig(BaseConfig):
     path: str | None = Field(default=None, description="Path for local Qdrant storage")
     url: str | None = Field(default=None, description="Qdrant Cloud/remote endpoint URL")
     api_key: str | None = Field(default=None, description="Qdrant Cloud API key")
+    prefer_grpc: bool = Field(
+        default=True, description="Use gRPC instead of HTTP/JSON for server requests"
+    )
+    grpc_port: int | None = Field(
+        default=None, description="gRPC port of the Qdrant server (None = 6334)"
+    )
 
     @classmethod
     def from_settings(cls, settings: Any) -> "QdrantConfig":
@@ -31,14 +75,30 @@ class QdrantConfig(BaseConfig):
             return cls(
                 collection_name=settings.qdrant_collection,
                 vector_dimension=settings.qdrant_vector_dim,
+                hnsw_ef=settings.hnsw_ef,
+                hnsw_m=settings.hnsw_m,
+                hnsw_ef_construct=settings.hnsw_ef_construct,
+                embed_dtype=settings.embed_dtype,
+                quantization_oversampling=settings.quantization_oversampling,
+                on_disk=settings.qdrant_on_disk,
                 path=settings.qdrant_path,
             )
         else:  # server mode
             return cls(
                 collection_name=settings.qdrant_collection,
                 vector_dimension=settings.qdrant_vector_dim,
+                hnsw_ef=settings.hnsw_ef,
+                hnsw_m=settings.hnsw_m,
+                hnsw_ef_construct=settings.hnsw_ef_construct,
+                embed_dtype=settings.embed_dtype,
+                quantization_oversampling=settings.quantization_oversampling,
+                on_disk=settings.qdrant_on_disk,
                 host=settings.qdrant_host,
                 port=settings.qdrant_port,
                 url=settings.qdrant_url,
                 api_key=settings.qdrant_api_key,
+                read_consistency=settings.qdrant_read_consistency,
+                prefer_grpc=settings.qdrant_prefer_grpc,
+                grpc_port=settings.qdrant_grpc_port,
+                io_workers=settings.qdrant_io_workers,
             )
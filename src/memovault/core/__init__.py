@@ -2,6 +2,6 @@
 
 from memovault.core.chat_history import ChatHistory
 from memovault.core.mem_cube import MemCube
-from memovault.core.memovault import MemoVault
+from memovault.core.memovault import MemoVault, get_default_vault
 
-__all__ = ["MemoVault", "MemCube", "ChatHistory"]
+__all__ = ["MemoVault", "MemCube", "ChatHistory", "get_default_vault"]
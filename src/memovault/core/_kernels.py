@@ -0,0 +1,62 @@
+"""Numeric kernels for similarity scoring.
+
+Uses numba when it is installed (``pip install memovault[fast]``) and
+falls back to NumPy otherwise.
+
+Search itself never scans embeddings in Python: VectorMemory delegates
+scoring and top-k to Qdrant (HNSW, optionally quantized), and
+SimpleMemory ranks with BM25. The in-process scans are the semantic
+cache (dot_scores below) and consolidation, which compares whole tiles
+with one BLAS matrix product.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+
+if HAS_NUMBA:
+
+    # Serial on purpose: cache-sized matrices are too small to amortize a
+    # thread pool, and numba's parallel layer can hang interpreter exit when
+    # first launched from a worker thread (as asyncio.to_thread does).
+    @njit(fastmath=True, cache=True)
+    def _dot_scores_jit(matrix, query):
+        n, d = matrix.shape
+        out = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            acc = np.float32(0.0)
+            for j in range(d):
+                acc += matrix[i, j] * query[j]
+            out[i] = acc
+        return out
+
+
+def dot_scores(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Return row-wise dot products ``matrix @ query`` as float32.
+
+    With L2-normalized inputs this is the cosine similarity of every row.
+
+    Args:
+        matrix: 2-D array of shape (n, d).
+        query: 1-D array of shape (d,).
+
+    Returns:
+        1-D float32 array of shape (n,).
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    if HAS_NUMBA:
+        return _dot_scores_jit(matrix, query)
+    return matrix @ query
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation so the first real lookup is not slowed down."""
+    if HAS_NUMBA:
+        dot_scores(np.zeros((1, 1), dtype=np.float32), np.zeros(1, dtype=np.float32))
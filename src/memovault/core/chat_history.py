@@ -1,8 +1,11 @@
 """Chat history tracking for MemoVault with JSON persistence."""
 
 import json
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 from memovault.utils.log import get_logger
@@ -14,14 +17,23 @@ CHAT_HISTORY_FILENAME = "chat_history.json"
 
 @dataclass
 class ChatHistory:
-    """Manages chat history for a session with optional disk persistence."""
+    """Manages chat history for a session with optional disk persistence.
+
+    With max_messages set, messages are kept in a bounded deque and the
+    oldest ones are dropped, so the history (and every prompt built from
+    it) stops growing in long sessions.
+    """
 
     data_dir: str | Path | None = None
     session_id: str | None = None
     created_at: datetime = field(default_factory=datetime.now)
-    messages: list[dict[str, str]] = field(default_factory=list)
+    messages: list[dict[str, str]] | deque[dict[str, str]] = field(default_factory=list)
+    max_messages: int | None = None
 
     def __post_init__(self) -> None:
+        self.messages = self._new_messages(self.messages)
+        # (created_at, its ISO string), reused by to_dict() on every save
+        self._created_at_iso: tuple[datetime, str] | None = None
         if self.data_dir is not None:
             self._path = Path(self.data_dir) / CHAT_HISTORY_FILENAME
             self._path.parent.mkdir(parents=True, exist_ok=True)
@@ -29,6 +41,14 @@ class ChatHistory:
         else:
             self._path = None
 
+    def _new_messages(
+        self, messages: Iterable[dict[str, str]] = ()
+    ) -> list[dict[str, str]] | deque[dict[str, str]]:
+        """Create the message container, bounded when max_messages is set."""
+        if self.max_messages:
+            return deque(messages, maxlen=self.max_messages)
+        return list(messages)
+
     @property
     def total_messages(self) -> int:
         """Get total number of messages."""
@@ -39,14 +59,14 @@ class ChatHistory:
         if self._path and self._path.exists():
             try:
                 data = json.loads(self._path.read_text(encoding="utf-8"))
-                self.messages = data.get("messages", [])
+                self.messages = self._new_messages(data.get("messages", []))
                 self.session_id = data.get("session_id")
                 if data.get("created_at"):
                     self.created_at = datetime.fromisoformat(data["created_at"])
                 logger.info(f"Chat history loaded: {len(self.messages)} messages")
             except Exception as e:
                 logger.warning(f"Failed to load chat history: {e}")
-                self.messages = []
+                self.messages = self._new_messages()
 
     def _save(self) -> None:
         """Persist chat history to disk."""
@@ -75,30 +95,42 @@ class ChatHistory:
         """Add an assistant message."""
         self.add_message("assistant", content)
 
-    def get_messages(self, limit: int | None = None) -> list[dict[str, str]]:
+    def get_messages(self, limit: int | None = None, copy: bool = True) -> list[dict[str, str]]:
         """Get messages from history.
 
         Args:
             limit: Maximum number of recent messages to return.
+            copy: Return a new list. With copy=False the full history is
+                returned as-is (a list or bounded deque) and must be treated
+                as read-only.
 
         Returns:
             List of messages.
         """
         if limit is None:
-            return self.messages.copy()
-        return self.messages[-limit:]
+            return list(self.messages) if copy else self.messages
+        if limit <= 0:
+            return []
+        return list(islice(self.messages, max(len(self.messages) - limit, 0), None))
 
     def clear(self) -> None:
         """Clear all messages."""
-        self.messages = []
+        self.messages = self._new_messages()
         self.created_at = datetime.now()
         self._save()
 
+    def _created_at_str(self) -> str:
+        """ISO string of created_at, recomputed only when created_at is replaced."""
+        cached = self._created_at_iso
+        if cached is None or cached[0] is not self.created_at:
+            cached = self._created_at_iso = (self.created_at, self.created_at.isoformat())
+        return cached[1]
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
             "session_id": self.session_id,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self._created_at_str(),
             "total_messages": self.total_messages,
-            "messages": self.messages,
+            "messages": list(self.messages),
         }
@@ -1,8 +1,11 @@
 """Memory consolidation — find and merge near-duplicate memories."""
 
 import json
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
+
 from memovault.llm.base import BaseLLM
 from memovault.memory.item import MemoryItem
 from memovault.utils.log import get_logger
@@ -10,6 +13,12 @@ from memovault.utils.prompts import CONSOLIDATION_PROMPT
 
 logger = get_logger(__name__)
 
+# Memories embedded and compared per matrix product
+TILE_SIZE = 512
+
+# Most similar memories considered for one merge group
+MAX_GROUP_NEIGHBOURS = 10
+
 
 class MemoryConsolidator:
     """Finds near-duplicate memories and merges them using the LLM."""
@@ -24,6 +33,9 @@ class MemoryConsolidator:
         add_fn: Any,
         delete_fn: Any,
         similarity_threshold: float = 0.85,
+        embed_fn: Callable[[list[str]], np.ndarray | list[list[float]] | None] | None = None,
+        progress_fn: Callable[[int, int, int], None] | None = None,
+        vectors: np.ndarray | None = None,
     ) -> dict[str, Any]:
         """Find and merge near-duplicate memories.
 
@@ -33,6 +45,13 @@ class MemoryConsolidator:
             add_fn: Callable to add a MemoryItem (raw, bypasses scoring).
             delete_fn: Callable to delete memory IDs.
             similarity_threshold: Minimum similarity to consider duplicates.
+            embed_fn: Optional batch embedder. When it returns vectors,
+                duplicates are found with tiled matrix products instead of
+                one search per memory.
+            progress_fn: Optional callback receiving (processed, total,
+                merged_groups) after each memory.
+            vectors: Optional stored embeddings of get_all_fn's memories, one
+                row each in the same order; used instead of embed_fn.
 
         Returns:
             Stats dict with merged_groups and total_removed counts.
@@ -41,16 +60,25 @@ class MemoryConsolidator:
         if len(all_memories) < 2:
             return {"merged_groups": 0, "total_removed": 0}
 
+        neighbours = self._find_neighbours(
+            all_memories, embed_fn, similarity_threshold, vectors
+        )
+
         seen_ids: set[str] = set()
         merged_groups = 0
         total_removed = 0
+        total = len(all_memories)
 
-        for mem in all_memories:
+        for i, mem in enumerate(all_memories):
+            if progress_fn is not None and i:
+                progress_fn(i, total, merged_groups)
             if mem.id in seen_ids:
                 continue
 
-            # Search for similar memories
-            similar = search_fn(mem.memory, top_k=10)
+            if neighbours is not None:
+                similar = [all_memories[j] for j in neighbours[i]]
+            else:
+                similar = search_fn(mem.memory, top_k=MAX_GROUP_NEIGHBOURS)
             # Filter to those above threshold (and not self)
             group = [
                 s for s in similar
@@ -82,12 +110,57 @@ class MemoryConsolidator:
             merged_groups += 1
             total_removed += len(ids_to_delete) - 1  # net reduction
 
+        if progress_fn is not None:
+            progress_fn(total, total, merged_groups)
         logger.info(
             f"Consolidation complete: {merged_groups} groups merged, "
             f"{total_removed} memories removed"
         )
         return {"merged_groups": merged_groups, "total_removed": total_removed}
 
+    @staticmethod
+    def _find_neighbours(
+        memories: list[MemoryItem],
+        embed_fn: Callable[[list[str]], np.ndarray | list[list[float]] | None] | None,
+        similarity_threshold: float,
+        vectors: np.ndarray | None = None,
+    ) -> list[np.ndarray] | None:
+        """Return, per memory, the indices of its most similar other memories.
+
+        Memories are embedded and compared TILE_SIZE rows at a time, so each
+        tile costs one embedder call and one BLAS matrix product. Stored
+        vectors, when given, replace the embedder calls. Returns None when
+        no embeddings are available.
+        """
+        if vectors is not None and len(vectors) == len(memories):
+            matrix = np.array(vectors, dtype=np.float32)
+        elif embed_fn is None:
+            return None
+        else:
+            texts = [m.memory for m in memories]
+            chunks = []
+            for start in range(0, len(texts), TILE_SIZE):
+                tile = embed_fn(texts[start:start + TILE_SIZE])
+                if tile is None:
+                    return None
+                chunks.append(np.asarray(tile, dtype=np.float32))
+            matrix = np.concatenate(chunks)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.maximum(norms, 1e-12)
+
+        neighbours: list[np.ndarray] = []
+        for start in range(0, len(matrix), TILE_SIZE):
+            sims = matrix[start:start + TILE_SIZE] @ matrix.T
+            for row, row_sims in enumerate(sims):
+                row_sims[start + row] = -np.inf  # never match itself
+                candidates = np.flatnonzero(row_sims >= similarity_threshold)
+                if len(candidates) > MAX_GROUP_NEIGHBOURS:
+                    top = np.argpartition(-row_sims[candidates], MAX_GROUP_NEIGHBOURS)
+                    candidates = candidates[top[:MAX_GROUP_NEIGHBOURS]]
+                # Most similar first, like search results
+                neighbours.append(candidates[np.argsort(-row_sims[candidates])])
+        return neighbours
+
     def _merge(self, items: list[MemoryItem]) -> str | None:
         """Use the LLM to merge a group of similar memories into one."""
         numbered = "\n".join(
@@ -1,7 +1,9 @@
 """Memory container (MemCube) for MemoVault."""
 
-import json
 import os
+import threading
+import time
+from collections.abc import Iterator
 from typing import Any
 
 from memovault.config.memory import MemoryConfig
@@ -12,6 +14,10 @@ from memovault.utils.log import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds a cached count is trusted before re-reading the backend, so writes
+# from other processes sharing the store (e.g. a Qdrant server) show up
+COUNT_TTL = 1.0
+
 
 class MemCube:
     """Memory container that wraps a text memory implementation.
@@ -27,13 +33,25 @@ class MemCube:
             config: Memory configuration.
         """
         self.config = config
-        self._memory: BaseTextMemory = MemoryFactory.from_config(config)
+        # Built on first use, so creating a cube never connects to the
+        # vector DB or loads an embedding model by itself
+        self._memory: BaseTextMemory | None = None
+        self._memory_lock = threading.Lock()
+        # Cached memory count; None means it must be re-read from the backend
+        self._count: int | None = None
+        self._count_expires = 0.0
         logger.info(f"MemCube initialized with {config.backend} backend")
 
     @property
     def memory(self) -> BaseTextMemory:
-        """Get the underlying memory implementation."""
-        return self._memory
+        """Get the underlying memory implementation, creating it on first access."""
+        memory = self._memory
+        if memory is None:
+            with self._memory_lock:
+                if self._memory is None:
+                    self._memory = MemoryFactory.from_config(self.config)
+                memory = self._memory
+        return memory
 
     def add(self, memories: list[MemoryItem | dict[str, Any] | str]) -> list[str]:
         """Add memories to the cube.
@@ -44,17 +62,25 @@ class MemCube:
         Returns:
             List of memory IDs that were added.
         """
-        # Convert strings to MemoryItem
-        items = []
-        for mem in memories:
-            if isinstance(mem, str):
-                items.append(MemoryItem(memory=mem))
-            elif isinstance(mem, dict):
-                items.append(MemoryItem(**mem))
-            else:
-                items.append(mem)
-
-        return self._memory.add(items)
+        if all(isinstance(mem, MemoryItem) for mem in memories):
+            # Internal callers already pass MemoryItems
+            items = list(memories)
+        else:
+            # Convert strings and dicts to MemoryItem
+            items = []
+            for mem in memories:
+                if isinstance(mem, str):
+                    items.append(MemoryItem(memory=mem))
+                elif isinstance(mem, dict):
+                    items.append(MemoryItem(**mem))
+                else:
+                    items.append(mem)
+
+        ids = self.memory.add(items)
+        # Re-added IDs would make an increment drift (and += races with
+        # concurrent adds); re-read instead
+        self._count = None
+        return ids
 
     def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
         """Search for relevant memories.
@@ -67,7 +93,22 @@ class MemCube:
         Returns:
             List of matching memories.
         """
-        return self._memory.search(query, top_k, **kwargs)
+        return self.memory.search(query, top_k, **kwargs)
+
+    def search_batch(
+        self, queries: list[str], top_k: int = 5, **kwargs
+    ) -> list[list[MemoryItem]]:
+        """Search for several queries at once.
+
+        Args:
+            queries: Search queries.
+            top_k: Number of results to return per query.
+            **kwargs: Additional search parameters.
+
+        Returns:
+            One list of matching memories per query.
+        """
+        return self.memory.search_batch(queries, top_k, **kwargs)
 
     def get(self, memory_id: str) -> MemoryItem | None:
         """Get a memory by ID.
@@ -78,7 +119,18 @@ class MemCube:
         Returns:
             The memory item, or None if not found.
         """
-        return self._memory.get(memory_id)
+        return self.memory.get(memory_id)
+
+    def get_many(self, memory_ids: list[str]) -> list[MemoryItem]:
+        """Get several memories by ID, skipping IDs that are not found.
+
+        Args:
+            memory_ids: The memory IDs.
+
+        Returns:
+            The memory items that exist.
+        """
+        return self.memory.get_many(memory_ids)
 
     def get_all(self) -> list[MemoryItem]:
         """Get all memories.
@@ -86,7 +138,41 @@ class MemCube:
         Returns:
             List of all memories.
         """
-        return self._memory.get_all()
+        return self.memory.get_all()
+
+    def get_recent(self, limit: int) -> list[MemoryItem]:
+        """Get the most recently added memories, newest first.
+
+        Args:
+            limit: Maximum number of memories to return.
+
+        Returns:
+            List of recent memories.
+        """
+        return self.memory.get_recent(limit)
+
+    def iter_recent(self, limit: int, page_size: int = 256) -> Iterator[list[MemoryItem]]:
+        """Yield the most recently added memories, newest first, in pages.
+
+        Args:
+            limit: Maximum number of memories to yield in total.
+            page_size: Maximum number of memories per page.
+        """
+        return self.memory.iter_recent(limit, page_size)
+
+    def get_recent_previews(
+        self, limit: int, preview_len: int = 100
+    ) -> list[tuple[str, str, bool, str | None]]:
+        """Get (id, preview, truncated, type) tuples for the most recent memories.
+
+        Args:
+            limit: Maximum number of memories to return.
+            preview_len: Maximum characters of memory text to keep.
+
+        Returns:
+            List of preview tuples, newest first.
+        """
+        return self.memory.get_recent_previews(limit, preview_len)
 
     def update(self, memory_id: str, memory: MemoryItem | dict[str, Any] | str) -> None:
         """Update a memory.
@@ -97,7 +183,16 @@ class MemCube:
         """
         if isinstance(memory, str):
             memory = MemoryItem(memory=memory)
-        self._memory.update(memory_id, memory)
+        self.memory.update(memory_id, memory)
+
+    def update_many(self, pairs: list[tuple[str, MemoryItem | dict[str, Any]]]) -> None:
+        """Update several memories in as few backend calls as possible.
+
+        Args:
+            pairs: (memory ID, updated memory) pairs.
+        """
+        if pairs:
+            self.memory.update_many(pairs)
 
     def delete(self, memory_id: str | list[str]) -> None:
         """Delete memories.
@@ -107,19 +202,38 @@ class MemCube:
         """
         if isinstance(memory_id, str):
             memory_id = [memory_id]
-        self._memory.delete(memory_id)
+        self.memory.delete(memory_id)
+        # IDs that did not exist would make a decrement drift; re-read instead
+        self._count = None
 
     def delete_all(self) -> None:
         """Delete all memories."""
-        self._memory.delete_all()
+        self.memory.delete_all()
+        self._count = 0
+
+    def count_by_ltm_status(self) -> dict[str | None, int]:
+        """Count memories per ltm_status (None for legacy memories).
+
+        Returns:
+            Mapping of ltm_status to count.
+        """
+        return self.memory.count_by_ltm_status()
 
     def count(self) -> int:
         """Count total memories.
 
+        The backend is queried at most once per COUNT_TTL seconds and after
+        every add/delete, so frequent polling between writes costs attribute
+        reads rather than backend calls.
+
         Returns:
             Number of memories.
         """
-        return self._memory.count()
+        now = time.monotonic()
+        if self._count is None or now >= self._count_expires:
+            self._count = self.memory.count()
+            self._count_expires = now + COUNT_TTL
+        return self._count
 
     def load(self, path: str) -> None:
         """Load memories from disk.
@@ -127,23 +241,23 @@ class MemCube:
         Args:
             path: Directory path to load from.
         """
-        self._memory.load(path)
+        self.memory.load(path)
+        self._count = None
 
-    def dump(self, path: str) -> None:
+    def dump(self, path: str, pretty: bool = False) -> None:
         """Dump memories to disk.
 
         Args:
             path: Directory path to dump to.
+            pretty: Write indented JSON for human-edited exports.
         """
         os.makedirs(path, exist_ok=True)
 
         # Save config
-        config_path = os.path.join(path, "config.json")
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(self.config.model_dump(), f, indent=2)
+        self.config.to_json_file(os.path.join(path, "config.json"))
 
         # Save memories
-        self._memory.dump(path)
+        self.memory.dump(path, pretty=pretty)
         logger.info(f"MemCube dumped to {path}")
 
     @classmethod
@@ -158,10 +272,8 @@ class MemCube:
         """
         config_path = os.path.join(path, "config.json")
 
-        with open(config_path, encoding="utf-8") as f:
-            config_data = json.load(f)
-
-        config = MemoryConfig.model_validate(config_data)
+        # Written by dump(), so there is no need to validate it again
+        config = MemoryConfig.from_json_file(config_path, trusted=True)
         cube = cls(config)
         cube.load(path)
 
@@ -1,11 +1,18 @@
 """Main MemoVault class - the primary interface for the memory system."""
 
 import hashlib
+import io
 import json
+import string
+import threading
 import time
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 from memovault.config.llm import LLMConfig
 from memovault.config.memory import MemoryConfig
 from memovault.config.settings import Settings, get_settings
@@ -15,11 +22,12 @@ from memovault.core.decay import apply_decay_to_results
 from memovault.core.mem_cube import MemCube
 from memovault.core.profile import ProfileManager
 from memovault.core.scorer import MemoryScorer
+from memovault.core.semantic_cache import SemanticCache
 from memovault.core.session import SessionManager
 from memovault.core.stm_scorer import STMScorer
 from memovault.core.stm_store import STMStore
 from memovault.llm.factory import LLMFactory
-from memovault.memory.item import MemoryItem
+from memovault.memory.item import MemoryItem, MemoryMetadata
 from memovault.utils.log import get_logger
 from memovault.utils.prompts import (
     CHAT_CONTINUATION_SYSTEM_PROMPT,
@@ -31,6 +39,24 @@ from memovault.utils.prompts import (
 logger = get_logger(__name__)
 
 
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a str.format template into (literal text, field name) pairs once."""
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(template))
+
+
+def _render(parts: tuple[tuple[str, str | None], ...], **fields: str) -> str:
+    """Fill a compiled template by concatenation, skipping the format parser."""
+    return "".join([literal + fields[field] if field else literal for literal, field in parts])
+
+
+# Runs chat-turn work that can overlap with the memory search
+_CHAT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="memovault-chat")
+
+# The built-in chat prompts are rendered on every turn
+_CHAT_INIT_PARTS = _compile_template(CHAT_INIT_SYSTEM_PROMPT)
+_CHAT_CONTINUATION_PARTS = _compile_template(CHAT_CONTINUATION_SYSTEM_PROMPT)
+
+
 class MemoVault:
     """MemoVault - A personal memory system with STM/LTM architecture.
 
@@ -55,20 +81,26 @@ class MemoVault:
         self.settings = settings or get_settings()
         self.settings.validate_credentials()
 
+        # Initialize LLM config (also used for the memory extractor)
+        if llm_config:
+            self._llm_config = llm_config
+        else:
+            self._llm_config = LLMConfig.from_settings(self.settings)
+
         # Initialize memory
         if memory_config:
             self._memory_config = memory_config
-        else:
+        elif llm_config:
+            # A caller-supplied LLM config does not come from settings
             self._memory_config = MemoryConfig.from_settings(self.settings)
+        else:
+            self._memory_config = MemoryConfig.from_settings(
+                self.settings, llm_config=self._llm_config
+            )
 
         self._cube = MemCube(self._memory_config)
 
         # Initialize LLM
-        if llm_config:
-            self._llm_config = llm_config
-        else:
-            self._llm_config = LLMConfig.from_settings(self.settings)
-
         self._llm = LLMFactory.from_config(self._llm_config)
 
         # Fast LLM for scoring/consolidation (falls back to main LLM)
@@ -83,7 +115,7 @@ class MemoVault:
             self._fast_llm = self._llm
 
         # Chat history
-        self._chat_history = ChatHistory(data_dir=self.settings.data_dir)
+        self._chat_history = self._make_chat_history(self.settings)
 
         # Intelligence layer
         self._profile = ProfileManager(data_dir=self.settings.data_dir)
@@ -112,6 +144,10 @@ class MemoVault:
         # Dual-stage context: track chat turn count
         self._chat_turn: int = 0
 
+        # Replies of chat() for near-duplicate queries; cleared on every write
+        self._chat_cache = self._make_chat_cache(self.settings)
+        self._chat_cache_lock = threading.Lock()
+
         # Token economics: rough char-based estimation (4 chars ≈ 1 token)
         self._CHARS_PER_TOKEN: int = 4
         self._discovery_tokens: int = 0  # tokens spent on search queries
@@ -139,6 +175,8 @@ class MemoVault:
         Returns:
             List of memory IDs that were added.
         """
+        self._invalidate_chat_cache()
+
         # Normalize input to list
         items = self._normalize_input(content, metadata)
 
@@ -158,6 +196,12 @@ class MemoVault:
         elif isinstance(content, MemoryItem):
             return [content]
         elif isinstance(content, list):
+            if len(content) > 1 and all(type(item) is str for item in content):
+                # Validate the shared metadata (and its timestamps) once; each
+                # item still gets its own copy of any list/dict values
+                shared = MemoryMetadata(**metadata).model_dump()
+                return [MemoryItem(memory=text, metadata=shared) for text in content]
+
             items = []
             for item in content:
                 if isinstance(item, str):
@@ -173,6 +217,9 @@ class MemoVault:
     def _add_scored(self, items: list[MemoryItem]) -> list[str]:
         """Dual routing: STM utility scoring + LTM candidate scoring."""
         added_ids: list[str] = []
+        # LTM candidates are written in one batch so the embedder sees a
+        # single request instead of one round-trip per item.
+        ltm_batch: list[MemoryItem] = []
 
         for item in items:
             # Step 1: STM scoring + storage
@@ -196,7 +243,8 @@ class MemoVault:
                 result = self._scorer.score(item.memory)
                 mem_type = result.get("type", "fact")
 
-                if self._scorer.should_store(result, mem_type, self._cube.count()):
+                current_count = self._cube.count() + len(ltm_batch)
+                if self._scorer.should_store(result, mem_type, current_count):
                     item.metadata.ltm_status = "candidate"
                     item.metadata.ltm_scores = result["scores"]
                     item.metadata.final_score = result["final_score"]
@@ -205,14 +253,16 @@ class MemoVault:
                     item.metadata.recall_count = 0
                     if result.get("summary"):
                         item.memory = result["summary"]
-                    ltm_ids = self._cube.add([item])
-                    added_ids.extend(ltm_ids)
+                    ltm_batch.append(item)
                 else:
                     logger.debug(
                         f"Below LTM threshold (score={result.get('final_score')}): "
                         f"{item.memory[:60]}"
                     )
 
+        if ltm_batch:
+            added_ids.extend(self._cube.add(ltm_batch))
+
         return added_ids
 
     def _ltm_is_duplicate(self, content: str) -> bool:
@@ -252,7 +302,37 @@ class MemoVault:
         """
         # Overfetch from LTM to account for decay/age filtering
         ltm_results = self._cube.search(query, top_k * 2, **kwargs)
+        return self._rank_results(ltm_results, top_k, max_age_days)
 
+    def batch_search(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        max_age_days: int | None = None,
+        **kwargs,
+    ) -> list[list[MemoryItem]]:
+        """Search for several queries with one embedding pass and one DB request.
+
+        Args:
+            queries: Search queries.
+            top_k: Number of results to return per query.
+            max_age_days: Hard cutoff applied to every query (see search()).
+            **kwargs: Additional search parameters passed to the backend
+                (e.g. filter, query_vectors).
+
+        Returns:
+            One list of matching memories per query, in query order.
+        """
+        batches = self._cube.search_batch(queries, top_k * 2, **kwargs)
+        return [self._rank_results(results, top_k, max_age_days) for results in batches]
+
+    def _rank_results(
+        self,
+        ltm_results: list[MemoryItem],
+        top_k: int,
+        max_age_days: int | None,
+    ) -> list[MemoryItem]:
+        """Apply decay and age filtering, then record recalls for the top_k."""
         # Apply half-life decay
         ltm_results = apply_decay_to_results(ltm_results)
 
@@ -265,15 +345,36 @@ class MemoVault:
             ]
 
         ltm_results = ltm_results[:top_k]
+        self._record_recalls(ltm_results)
+        return ltm_results
+
+    def record_recalls(self, memory_ids: list[str]) -> None:
+        """Count memories as recalled without searching for them.
+
+        For results served from a cache: a repeated query then still
+        increments recall_count, and can promote candidates, exactly as a
+        fresh search() would.
+
+        Args:
+            memory_ids: IDs of the memories returned for the query.
+        """
+        if memory_ids:
+            self._record_recalls(self._cube.get_many(memory_ids))
 
-        # Increment recall_count and check for promotion
-        for mem in ltm_results:
+    def _record_recalls(self, memories: list[MemoryItem]) -> None:
+        """Increment recall_count, promote candidates and persist the changes."""
+        for mem in memories:
             self._increment_recall(mem)
 
-        return ltm_results
+        # Persist all recall updates in one backend call (one embedder request)
+        if memories:
+            try:
+                self._cube.update_many([(mem.id, mem) for mem in memories])
+            except Exception as e:
+                logger.warning(f"Failed to update recall count: {e}")
 
     def _increment_recall(self, mem: MemoryItem) -> None:
-        """Increment recall_count and auto-promote if threshold reached."""
+        """Increment recall_count and auto-promote if threshold reached (in memory only)."""
         current_count = mem.metadata.recall_count or 0
         new_count = current_count + 1
 
@@ -290,11 +391,32 @@ class MemoVault:
             mem.metadata.importance_score = mem.metadata.final_score
             logger.info(f"Memory promoted to LTM: {mem.id}")
 
-        # Persist the update
-        try:
-            self._cube.update(mem.id, mem)
-        except Exception as e:
-            logger.warning(f"Failed to update recall count: {e}")
+    def embed_query(self, query: str) -> list[float] | None:
+        """Embed a query with the backend's embedder.
+
+        Returns None when the memory backend has no embedder (simple backend).
+        """
+        embedder = getattr(self._cube.memory, "embedder", None)
+        if embedder is None:
+            return None
+        return embedder.embed_one(query)
+
+    def embed_queries(self, queries: list[str]) -> list[list[float]] | None:
+        """Embed several queries in one embedder call.
+
+        Returns None when the memory backend has no embedder (simple backend).
+        """
+        embedder = getattr(self._cube.memory, "embedder", None)
+        if embedder is None:
+            return None
+        return embedder.embed(queries)
+
+    def _embed_matrix(self, texts: list[str]) -> np.ndarray | None:
+        """Embed texts into one float32 matrix (None without an embedder)."""
+        embedder = getattr(self._cube.memory, "embedder", None)
+        if embedder is None:
+            return None
+        return embedder.embed_ndarray(texts)
 
     def get(self, memory_id: str) -> MemoryItem | None:
         """Get a specific memory by ID."""
@@ -310,24 +432,51 @@ class MemoVault:
             self._ensure_ltm_status(mem)
         return mems
 
+    def get_recent(self, limit: int) -> list[MemoryItem]:
+        """Get the most recently added memories, newest first."""
+        mems = self._cube.get_recent(limit)
+        for mem in mems:
+            self._ensure_ltm_status(mem)
+        return mems
+
+    def iter_recent(self, limit: int, page_size: int = 256) -> Iterator[list[MemoryItem]]:
+        """Yield the most recently added memories, newest first, in pages."""
+        for page in self._cube.iter_recent(limit, page_size):
+            for mem in page:
+                self._ensure_ltm_status(mem)
+            yield page
+
+    def get_recent_previews(
+        self, limit: int, preview_len: int = 100
+    ) -> list[tuple[str, str, bool, str | None]]:
+        """Get (id, preview, truncated, type) tuples for the most recent memories."""
+        return self._cube.get_recent_previews(limit, preview_len)
+
     def update(self, memory_id: str, content: str | MemoryItem, **metadata: Any) -> None:
         """Update a memory."""
         if isinstance(content, str):
             content = MemoryItem(memory=content, metadata=metadata)
         self._cube.update(memory_id, content)
+        self._invalidate_chat_cache()
 
     def delete(self, memory_id: str | list[str]) -> None:
         """Delete memories."""
         self._cube.delete(memory_id)
+        self._invalidate_chat_cache()
 
     def delete_all(self) -> None:
         """Delete all memories."""
         self._cube.delete_all()
+        self._invalidate_chat_cache()
 
     def count(self) -> int:
         """Count total LTM memories."""
         return self._cube.count()
 
+    def count_by_ltm_status(self) -> dict[str | None, int]:
+        """Count LTM memories per stored ltm_status (None for legacy memories)."""
+        return self._cube.count_by_ltm_status()
+
     @staticmethod
     def _ensure_ltm_status(mem: MemoryItem) -> None:
         """Backward compat: old memories without ltm_status are treated as promoted."""
@@ -353,11 +502,134 @@ class MemoVault:
         top_k: int = 5,
         system_prompt: str | None = None,
         include_history: bool = True,
+        memories: list[MemoryItem] | None = None,
     ) -> str:
         """Chat with memory-enhanced responses.
 
         Builds context with separate LTM memories section and
         STM session constraints section (selective injection).
+        Pass memories already retrieved for this query to skip the search.
+
+        With the chat cache enabled (vector backend), a query similar enough
+        to an earlier one reuses its reply without searching or calling the
+        LLM, as long as no memory was written in between. Turns that send
+        chat history or STM constraints to the LLM are never cached.
+        """
+        return "".join(
+            self._chat_chunks(query, top_k, system_prompt, include_history, memories, False)
+        )
+
+    def chat_stream(
+        self,
+        query: str,
+        top_k: int = 5,
+        system_prompt: str | None = None,
+        include_history: bool = True,
+        memories: list[MemoryItem] | None = None,
+    ) -> Generator[str, None, None]:
+        """Chat with memory-enhanced responses, yielding text as it is generated.
+
+        Same context building and reply cache as chat(); the exchange is
+        recorded in chat history once the stream is exhausted. Backends
+        without native streaming yield the full reply as a single chunk.
+        """
+        yield from self._chat_chunks(
+            query, top_k, system_prompt, include_history, memories, True
+        )
+
+    def _chat_chunks(
+        self,
+        query: str,
+        top_k: int,
+        system_prompt: str | None,
+        include_history: bool,
+        memories: list[MemoryItem] | None,
+        stream: bool,
+    ) -> Generator[str, None, None]:
+        """Shared body of chat() and chat_stream().
+
+        Non-streaming calls use a single generate() request, which avoids
+        the per-chunk overhead of a streamed response.
+        """
+        cache_key = self._chat_cache_key(top_k, system_prompt, include_history, memories)
+        query_vector = None
+        if cache_key is not None:
+            query_vector = self.embed_query(query)
+            if query_vector is not None:
+                with self._chat_cache_lock:
+                    cached = self._chat_cache.get(query_vector, cache_key)
+                if cached is not None:
+                    response, memory_ids = cached
+                    # Same turn and recall bookkeeping as _prepare_chat()
+                    if self._stm:
+                        self._stm.increment_turn()
+                    self._chat_turn += 1
+                    self.record_recalls(memory_ids)
+                    self._finish_chat(query, response, len(memory_ids))
+                    yield response
+                    return
+
+        # Reuse the embedding for the search
+        messages, memories = self._prepare_chat(
+            query, top_k, system_prompt, include_history, memories, query_vector
+        )
+
+        # Generate response
+        if stream:
+            buffer = io.StringIO()
+            for chunk in self._llm.generate_stream(messages):
+                buffer.write(chunk)
+                yield chunk
+            response = buffer.getvalue()
+        else:
+            response = self._llm.generate(messages)
+            yield response
+
+        if query_vector is not None:
+            with self._chat_cache_lock:
+                self._chat_cache.put(
+                    query_vector, (response, [mem.id for mem in memories]), cache_key
+                )
+
+        self._finish_chat(query, response, len(memories))
+
+    def _chat_cache_key(
+        self,
+        top_k: int,
+        system_prompt: str | None,
+        include_history: bool,
+        memories: list[MemoryItem] | None,
+    ) -> tuple[Any, ...] | None:
+        """Return the reply cache key for a chat turn, or None if it must not be cached.
+
+        A reply is only reused when its prompt depends on nothing but the
+        query, the retrieved memories and the profile: turns that send
+        earlier messages or STM constraints to the LLM are never cached.
+        """
+        if self._chat_cache is None or memories is not None:
+            return None
+        if include_history and self._chat_history.total_messages:
+            return None
+        if self._stm and self._stm.get_context_items():
+            return None
+        # The built-in prompt differs between the first and later turns
+        first_turn = self._chat_turn == 0 if system_prompt is None else None
+        return (top_k, system_prompt, first_turn)
+
+    def _prepare_chat(
+        self,
+        query: str,
+        top_k: int,
+        system_prompt: str | None,
+        include_history: bool,
+        memories: list[MemoryItem] | None = None,
+        query_vector: list[float] | None = None,
+    ) -> tuple[list[dict[str, str]], list[MemoryItem]]:
+        """Retrieve memories and build the LLM messages for a chat turn.
+
+        The STM context selection (a fast-LLM call) does not depend on the
+        retrieved memories, so it runs on a worker thread while the memory
+        search runs here.
         """
         # Increment STM turn counter
         if self._stm:
@@ -366,12 +638,25 @@ class MemoVault:
         # Track discovery tokens (cost of the search query)
         self._discovery_tokens += len(query) // self._CHARS_PER_TOKEN
 
+        # Start STM selection (selective injection) before searching
+        stm_future = None
+        if self._stm:
+            stm_context_items = self._stm.get_context_items()
+            if stm_context_items:
+                stm_future = _CHAT_EXECUTOR.submit(
+                    self._build_stm_context, query, stm_context_items
+                )
+
         # Search for relevant LTM memories
-        memories = self.search(query, top_k)
+        if memories is None:
+            kwargs = {"query_vector": query_vector} if query_vector is not None else {}
+            memories = self.search(query, top_k, **kwargs)
 
         # Build memories section (LTM).
         # Wrapped in XML delimiters so the LLM distinguishes stored data from
         # instructions — mitigates prompt injection via crafted memory content.
+        # Rebuilt every turn on purpose: the same memories already give a
+        # byte-identical prompt prefix.
         if memories:
             memory_lines = [f"- {mem.memory}" for mem in memories]
             memories_section = (
@@ -383,12 +668,8 @@ class MemoVault:
         else:
             memories_section = ""
 
-        # Build STM section (selective injection)
-        stm_section = ""
-        if self._stm:
-            stm_context_items = self._stm.get_context_items()
-            if stm_context_items:
-                stm_section = self._build_stm_context(query, stm_context_items)
+        # Collect the STM section
+        stm_section = stm_future.result() if stm_future is not None else ""
 
         # Build profile section — same XML wrapping as memories.
         profile_text = self._profile.to_context_string()
@@ -407,13 +688,15 @@ class MemoVault:
                 stm_section=stm_section,
             )
         elif self._chat_turn == 1:
-            system_content = CHAT_INIT_SYSTEM_PROMPT.format(
+            system_content = _render(
+                _CHAT_INIT_PARTS,
                 memories_section=memories_section,
                 profile_section=profile_section,
                 stm_section=stm_section,
             )
         else:
-            system_content = CHAT_CONTINUATION_SYSTEM_PROMPT.format(
+            system_content = _render(
+                _CHAT_CONTINUATION_PARTS,
                 memories_section=memories_section,
                 stm_section=stm_section,
             )
@@ -421,23 +704,48 @@ class MemoVault:
         # Track read tokens (context injected into this turn's prompt)
         self._read_tokens += len(system_content) // self._CHARS_PER_TOKEN
 
-        # Build messages
-        messages = [{"role": "system", "content": system_content}]
+        # Build messages in a single allocation
+        history = self._chat_history.get_messages(copy=False) if include_history else ()
+        messages = [
+            {"role": "system", "content": system_content},
+            *history,
+            {"role": "user", "content": query},
+        ]
+        return messages, memories
 
-        if include_history:
-            messages.extend(self._chat_history.get_messages())
+    @staticmethod
+    def _make_chat_history(settings: Settings) -> ChatHistory:
+        """Create the persisted chat history, bounded by chat_history_max_turns."""
+        max_turns = settings.chat_history_max_turns
+        return ChatHistory(
+            data_dir=settings.data_dir,
+            # One user and one assistant message per turn
+            max_messages=2 * max_turns if max_turns else None,
+        )
 
-        messages.append({"role": "user", "content": query})
+    @staticmethod
+    def _make_chat_cache(settings: Settings) -> SemanticCache | None:
+        """Create the chat reply cache, or None when it is disabled."""
+        if not settings.chat_cache:
+            return None
+        return SemanticCache(
+            threshold=settings.semcache_tau,
+            max_entries=settings.semcache_size,
+            ttl=settings.semcache_ttl or None,
+        )
 
-        # Generate response
-        response = self._llm.generate(messages)
+    def _invalidate_chat_cache(self) -> None:
+        """Drop cached chat replies after the memories change."""
+        if self._chat_cache is not None:
+            with self._chat_cache_lock:
+                self._chat_cache.clear()
 
-        # Update chat history
+    def _finish_chat(self, query: str, response: str, memory_count: int) -> None:
+        """Record a completed chat exchange in the history."""
         self._chat_history.add_user_message(query)
         self._chat_history.add_assistant_message(response)
 
-        logger.debug(f"Chat response generated with {len(memories)} memories as context")
-        return response
+        logger.debug(f"Chat response generated with {memory_count} memories as context")
 
     def _build_stm_context(self, query: str, stm_items: list) -> str:
         """Use fast LLM to select and rewrite STM items as session constraints."""
@@ -483,6 +791,7 @@ class MemoVault:
         """Clear the chat history and reset dual-stage context turn counter."""
         self._chat_history.clear()
         self._chat_turn = 0
+        self._invalidate_chat_cache()
         logger.debug("Chat history cleared")
 
     def get_chat_history(self) -> list[dict[str, str]]:
@@ -523,6 +832,8 @@ class MemoVault:
     def update_profile(self, field: str, value: Any) -> None:
         """Update a user profile field."""
         self._profile.update_field(field, value)
+        # The profile is part of the chat system prompt
+        self._invalidate_chat_cache()
 
     def get_profile(self) -> dict[str, Any]:
         """Get the current user profile as a dict."""
@@ -565,10 +876,12 @@ class MemoVault:
             self._stm.clear()
 
         # Existing session summary logic
-        return self._session.end_session(
+        summary = self._session.end_session(
             chat_history=self._chat_history,
             add_fn=self._add_raw,
         )
+        self._invalidate_chat_cache()
+        return summary
 
     def get_recent_summaries(self, n: int = 3) -> list[MemoryItem]:
         """Retrieve recent session summaries."""
@@ -578,14 +891,28 @@ class MemoVault:
         )
 
     def get_session_context(
-        self, query: str | None = None, top_k: int = 5
+        self,
+        query: str | None = None,
+        top_k: int = 5,
+        memories: list[MemoryItem] | None = None,
     ) -> dict[str, Any]:
-        """Build structured context for session start."""
+        """Build structured context for session start.
+
+        Args:
+            query: Optional prompt used to find relevant facts.
+            top_k: Number of relevant facts to retrieve.
+            memories: Already-retrieved relevant memories; skips the search.
+
+        Returns:
+            Dictionary with profile, recap and relevant_facts.
+        """
         profile_text = self._profile.to_context_string()
         summaries = self.get_recent_summaries(n=3)
         recap = [s.memory for s in summaries]
         relevant_facts: list[str] = []
-        if query:
+        if memories is not None:
+            relevant_facts = [m.memory for m in memories]
+        elif query:
             results = self.search(query, top_k=top_k)
             relevant_facts = [r.memory for r in results]
 
@@ -596,11 +923,19 @@ class MemoVault:
         }
 
     def get_formatted_session_context(
-        self, query: str | None = None, top_k: int = 5
+        self,
+        query: str | None = None,
+        top_k: int = 5,
+        memories: list[MemoryItem] | None = None,
     ) -> str:
         """Build a formatted context string for session start."""
-        ctx = self.get_session_context(query=query, top_k=top_k)
+        return self.format_session_context(
+            self.get_session_context(query=query, top_k=top_k, memories=memories)
+        )
 
+    @staticmethod
+    def format_session_context(ctx: dict[str, Any]) -> str:
+        """Format a get_session_context() result as a prompt string."""
         profile_section = ""
         if ctx["profile"]:
             profile_section = f"## Profile\n{ctx['profile']}"
@@ -626,29 +961,56 @@ class MemoVault:
     # =========================================================================
 
     def consolidate_memories(
-        self, similarity_threshold: float = 0.85
+        self,
+        similarity_threshold: float = 0.85,
+        progress_fn: Callable[[int, int, int], None] | None = None,
     ) -> dict[str, Any]:
-        """Find and merge near-duplicate memories."""
-        return self._consolidator.consolidate(
-            get_all_fn=self.get_all,
-            search_fn=self.search,
-            add_fn=self._add_raw,
-            delete_fn=self.delete,
-            similarity_threshold=similarity_threshold,
-        )
+        """Find and merge near-duplicate memories.
+
+        Args:
+            similarity_threshold: Minimum similarity to consider duplicates.
+            progress_fn: Optional callback receiving (processed, total,
+                merged_groups) as memories are checked.
+
+        Returns:
+            Stats dict with merged_groups and total_removed counts.
+        """
+        get_all_fn = self.get_all
+        vectors = None
+        # Compare the stored embeddings instead of re-embedding every memory
+        get_all_with_vectors = getattr(self._cube.memory, "get_all_with_vectors", None)
+        try:
+            if get_all_with_vectors is not None:
+                memories, vectors = get_all_with_vectors()
+                for mem in memories:
+                    self._ensure_ltm_status(mem)
+                get_all_fn = lambda: memories  # noqa: E731
+            return self._consolidator.consolidate(
+                get_all_fn=get_all_fn,
+                search_fn=self.search,
+                add_fn=self._add_raw,
+                delete_fn=self.delete,
+                similarity_threshold=similarity_threshold,
+                embed_fn=self._embed_matrix,
+                progress_fn=progress_fn,
+                vectors=vectors,
+            )
+        finally:
+            self._invalidate_chat_cache()
 
     # =========================================================================
     # Persistence
     # =========================================================================
 
-    def dump(self, path: str) -> None:
-        """Save memories to disk."""
-        self._cube.dump(path)
+    def dump(self, path: str, pretty: bool = False) -> None:
+        """Save memories to disk (``pretty`` indents the JSON for hand editing)."""
+        self._cube.dump(path, pretty=pretty)
         logger.info(f"MemoVault saved to {path}")
 
     def load(self, path: str) -> None:
         """Load memories from disk."""
         self._cube.load(path)
+        self._invalidate_chat_cache()
         logger.info(f"MemoVault loaded from {path}")
 
     @classmethod
@@ -666,7 +1028,7 @@ class MemoVault:
         instance._fast_llm = (
             LLMFactory.from_config(scorer_config) if scorer_config else instance._llm
         )
-        instance._chat_history = ChatHistory(data_dir=instance.settings.data_dir)
+        instance._chat_history = cls._make_chat_history(instance.settings)
         instance._profile = ProfileManager(data_dir=instance.settings.data_dir)
         instance._session = SessionManager(llm=instance._llm)
         instance._consolidator = MemoryConsolidator(llm=instance._fast_llm)
@@ -684,6 +1046,9 @@ class MemoVault:
             instance._stm = None
             instance._stm_scorer = None
 
+        instance._chat_cache = cls._make_chat_cache(instance.settings)
+        instance._chat_cache_lock = threading.Lock()
+
         logger.info(f"MemoVault loaded from {path}")
         return instance
 
@@ -695,3 +1060,29 @@ class MemoVault:
     def cube(self) -> MemCube:
         """Get the underlying MemCube."""
         return self._cube
+
+
+# Process-wide vault shared by the MCP server and REST API, so embedder
+# weights and DB/LLM clients are loaded once rather than per server/app
+_DEFAULT_VAULT: MemoVault | None = None
+_DEFAULT_VAULT_LOCK = threading.Lock()
+
+
+def get_default_vault() -> MemoVault:
+    """Return the shared MemoVault, creating and warming it on first use.
+
+    Returns:
+        The process-wide MemoVault instance.
+    """
+    global _DEFAULT_VAULT
+    if _DEFAULT_VAULT is None:
+        with _DEFAULT_VAULT_LOCK:
+            if _DEFAULT_VAULT is None:
+                vault = MemoVault()
+                # Pay model load / first-call cost now, not on the first query
+                try:
+                    vault.embed_query("warm-up")
+                except Exception as e:
+                    logger.debug(f"Embedder warm-up skipped: {e}")
+                _DEFAULT_VAULT = vault
+    return _DEFAULT_VAULT
@@ -0,0 +1,193 @@
+"""Semantic query cache keyed on query embeddings."""
+
+import time
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+
+from memovault.core._kernels import dot_scores, warm_up
+from memovault.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Bucket:
+    """Entries sharing one exact-match key, stored as parallel arrays.
+
+    Vectors live in one contiguous float32 matrix (grown by doubling) so a
+    lookup is a single matrix-vector product with no per-entry gathering.
+    """
+
+    def __init__(self, dim: int, capacity: int = 16):
+        self.vecs = np.empty((capacity, dim), dtype=np.float32)
+        self.values: list[Any] = []
+        self.stamps: list[int] = []
+        self.born: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def dim(self) -> int:
+        return self.vecs.shape[1]
+
+    def append(self, unit: np.ndarray, value: Any, stamp: int, born: float) -> None:
+        n = len(self.values)
+        if n == self.vecs.shape[0]:
+            grown = np.empty((n * 2, self.dim), dtype=np.float32)
+            grown[:n] = self.vecs
+            self.vecs = grown
+        self.vecs[n] = unit
+        self.values.append(value)
+        self.stamps.append(stamp)
+        self.born.append(born)
+
+    def remove(self, row: int) -> None:
+        """Remove a row by moving the last row into its slot."""
+        last = len(self.values) - 1
+        if row != last:
+            self.vecs[row] = self.vecs[last]
+            self.values[row] = self.values[last]
+            self.stamps[row] = self.stamps[last]
+            self.born[row] = self.born[last]
+        self.values.pop()
+        self.stamps.pop()
+        self.born.pop()
+
+
+class SemanticCache:
+    """Small in-process LRU cache matched by cosine similarity.
+
+    Entries are grouped by an exact-match key (e.g. tool name, top_k and
+    filters) and looked up by comparing the normalized query embedding
+    against every cached embedding in that group with a single matmul.
+    A lookup hits when the best similarity is >= threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.97,
+        max_entries: int = 256,
+        ttl: float | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit.
+            max_entries: Maximum number of cached entries (LRU eviction).
+            ttl: Seconds an entry stays valid (None = until evicted).
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._buckets: dict[Hashable, _Bucket] = {}
+        self._size = 0
+        self._clock = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        warm_up()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(vector: list[float] | np.ndarray) -> np.ndarray | None:
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm == 0:
+            return None
+        # Embedders normalize by default, so most vectors are already unit length
+        if abs(norm - 1.0) < 1e-5:
+            return vec
+        return vec / norm
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get(self, vector: list[float] | np.ndarray, key: Hashable = None) -> Any | None:
+        """Return the cached value for a similar query, or None on a miss.
+
+        Args:
+            vector: Query embedding.
+            key: Exact-match key the cached entry must share.
+
+        Returns:
+            The cached value, or None.
+        """
+        bucket = self._buckets.get(key)
+        if bucket and self.ttl is not None:
+            self._expire(key, bucket)
+            bucket = self._buckets.get(key)
+        unit = self._normalize(vector)
+        if not bucket or unit is None or unit.shape[0] != bucket.dim:
+            self.misses += 1
+            return None
+
+        sims = dot_scores(bucket.vecs[: len(bucket)], unit)
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            self.misses += 1
+            return None
+
+        bucket.stamps[best] = self._tick()
+        self.hits += 1
+        return bucket.values[best]
+
+    def put(self, vector: list[float] | np.ndarray, value: Any, key: Hashable = None) -> None:
+        """Store a value for a query embedding.
+
+        Args:
+            vector: Query embedding.
+            value: Value to cache.
+            key: Exact-match key for later lookups.
+        """
+        unit = self._normalize(vector)
+        if unit is None:
+            return
+
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.dim != unit.shape[0]:
+            if bucket is not None:
+                self._size -= len(bucket)
+            bucket = self._buckets[key] = _Bucket(unit.shape[0])
+        bucket.append(unit, value, self._tick(), time.monotonic())
+        self._size += 1
+
+        while self._size > self.max_entries:
+            self._evict_oldest()
+            self.evictions += 1
+
+    def _expire(self, key: Hashable, bucket: _Bucket) -> None:
+        """Drop entries of a bucket older than the TTL."""
+        cutoff = time.monotonic() - self.ttl
+        # Highest rows first, so swap-removal only ever moves live rows
+        for row in range(len(bucket) - 1, -1, -1):
+            if bucket.born[row] < cutoff:
+                bucket.remove(row)
+                self._size -= 1
+        if not bucket:
+            del self._buckets[key]
+
+    def _evict_oldest(self) -> None:
+        """Evict the least recently used entry across all buckets."""
+        oldest_key, oldest_row, oldest_stamp = None, -1, None
+        for key, bucket in self._buckets.items():
+            row = int(np.argmin(bucket.stamps))
+            if oldest_stamp is None or bucket.stamps[row] < oldest_stamp:
+                oldest_key, oldest_row, oldest_stamp = key, row, bucket.stamps[row]
+
+        bucket = self._buckets[oldest_key]
+        bucket.remove(oldest_row)
+        if not bucket:
+            del self._buckets[oldest_key]
+        self._size -= 1
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        if self._size:
+            logger.debug(f"Semantic cache cleared ({self._size} entries)")
+        self._buckets.clear()
+        self._size = 0
@@ -66,7 +66,8 @@ class SessionManager:
         Returns:
             The summary string, or None if there was nothing to summarize.
         """
-        messages = chat_history.get_messages()
+        # clear() below replaces the list rather than emptying it, so no copy
+        messages = chat_history.get_messages(copy=False)
         if not messages:
             return None
 
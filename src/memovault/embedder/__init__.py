@@ -1,8 +1,26 @@
 """Embedder module for MemoVault."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from memovault.embedder.base import BaseEmbedder
 from memovault.embedder.factory import EmbedderFactory
-from memovault.embedder.ollama import OllamaEmbedder
-from memovault.embedder.openai import OpenAIEmbedder
+
+if TYPE_CHECKING:
+    from memovault.embedder.ollama import OllamaEmbedder
+    from memovault.embedder.openai import OpenAIEmbedder
+
+# Backends are imported on first access so only the SDK in use is loaded
+_LAZY = {
+    "OllamaEmbedder": "memovault.embedder.ollama",
+    "OpenAIEmbedder": "memovault.embedder.openai",
+}
 
 __all__ = ["BaseEmbedder", "OpenAIEmbedder", "OllamaEmbedder", "EmbedderFactory"]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
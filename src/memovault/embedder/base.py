@@ -1,8 +1,17 @@
 """Base embedder class for MemoVault."""
 
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
+
+from memovault.embedder.cache import EmbeddingCache
+
+# Guards lazy creation of per-embedder caches
+_CACHE_LOCK = threading.Lock()
+
 
 class BaseEmbedder(ABC):
     """Base class for all embedding models."""
@@ -33,6 +42,107 @@ class BaseEmbedder(ABC):
         """
         return self.embed([text])[0]
 
+    def embed_ndarray(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings as one float32 matrix.
+
+        Skips building a Python float per dimension, so callers that do
+        matrix math on the result should prefer it over embed().
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            Array of shape (len(texts), dims).
+        """
+        return self._as_matrix(self.embed(texts))
+
+    @staticmethod
+    def _as_matrix(embeddings: Any) -> np.ndarray:
+        """Convert 2-D array-like embeddings to a C-contiguous float32 matrix.
+
+        Row-major float32 lets matrix products against it go straight to
+        BLAS without a conversion copy.
+        """
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if matrix.size == 0:
+            return np.empty((len(matrix), 0), dtype=np.float32)
+        return matrix
+
+    def _embedding_cache(self) -> EmbeddingCache | None:
+        """Return the persistent cache configured by config.cache_path, if any."""
+        path = getattr(self.config, "cache_path", None)
+        if not path:
+            return None
+        cache = self.__dict__.get("_cache")
+        if cache is None:
+            with _CACHE_LOCK:
+                cache = self.__dict__.get("_cache")
+                if cache is None:
+                    config = self.config
+                    # Everything besides the text that changes the vector
+                    namespace = (
+                        f"{type(self).__name__}:{config.model_name_or_path}:"
+                        f"{config.embedding_dims}:{config.normalize}:{config.max_tokens}"
+                    )
+                    cache = self._cache = EmbeddingCache(path, namespace)
+        return cache
+
+    def _embed_cached(self, texts: list[str], compute: Callable[[list[str]], Any]) -> np.ndarray:
+        """Embed texts, calling compute only for texts not in the persistent cache.
+
+        Args:
+            texts: Texts to embed.
+            compute: Embeds a list of texts with the model (2-D array-like).
+
+        Returns:
+            Float32 matrix with one row per text, in the order of texts.
+        """
+        cache = self._embedding_cache()
+        if cache is None or not texts:
+            return self._as_matrix(compute(texts))
+
+        vectors, misses = cache.lookup(texts)
+        if not misses:
+            return np.stack(vectors)
+
+        missing = [texts[i] for i in misses]
+        computed = self._as_matrix(compute(missing))
+        cache.store(missing, computed)
+        if len(misses) == len(texts):
+            return computed
+
+        matrix = np.empty((len(texts), computed.shape[1]), dtype=np.float32)
+        matrix[misses] = computed
+        for i, vector in enumerate(vectors):
+            if vector is not None:
+                matrix[i] = vector
+        return matrix
+
+    def _normalize(self, embeddings: Any) -> list[list[float]]:
+        """L2-normalize embeddings when the config asks for it.
+
+        Unit-length vectors make cosine similarity a plain dot product, so
+        stores and caches never have to divide by norms at query time.
+
+        Args:
+            embeddings: 2-D array-like of embeddings.
+
+        Returns:
+            List of (normalized) embeddings.
+        """
+        if not getattr(self.config, "normalize", False):
+            return embeddings.tolist() if isinstance(embeddings, np.ndarray) else embeddings
+        return self._normalize_matrix(embeddings).tolist()
+
+    def _normalize_matrix(self, embeddings: Any) -> np.ndarray:
+        """Like _normalize, but return a float32 matrix instead of lists."""
+        matrix = self._as_matrix(embeddings)
+        if matrix.size and getattr(self.config, "normalize", False):
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            # Divide out of place: the input may be a caller-owned array
+            matrix = matrix / np.maximum(norms, 1e-12)
+        return matrix
+
     def _truncate_texts(self, texts: list[str], max_tokens: int | None = None) -> list[str]:
         """Truncate texts to fit within max_tokens limit.
 
@@ -49,4 +159,5 @@ class BaseEmbedder(ABC):
         # Simple character-based truncation (approximation)
         # Most models use ~4 chars per token on average
         max_chars = max_tokens * 4
+        # Untouched strings are returned as-is, not copied
         return [text[:max_chars] if len(text) > max_chars else text for text in texts]
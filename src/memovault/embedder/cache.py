@@ -0,0 +1,113 @@
+"""Persistent embedding cache backed by SQLite."""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from memovault.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Keys per SELECT ... IN (...) statement (below SQLite's variable limit)
+LOOKUP_CHUNK = 500
+
+
+class EmbeddingCache:
+    """Content-addressed store of embeddings, shared across processes.
+
+    Vectors are keyed by a hash of the text and the embedder settings that
+    affect the result (model, dimensions, normalization, truncation), and
+    stored as float32, so a cached vector is bit-identical to a fresh one.
+    The database runs in WAL mode so the MCP server and REST API can share
+    one file.
+    """
+
+    def __init__(self, path: str | Path, namespace: str):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (created if missing).
+            namespace: Embedder settings folded into every key.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace.encode()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, text: str) -> bytes:
+        digest = hashlib.blake2b(self.namespace, digest_size=16)
+        digest.update(b"\0")
+        digest.update(text.encode())
+        return digest.digest()
+
+    def lookup(self, texts: list[str]) -> tuple[list[np.ndarray | None], list[int]]:
+        """Look up cached embeddings.
+
+        Args:
+            texts: Texts to look up.
+
+        Returns:
+            (vectors, misses): vectors[i] is the cached embedding of texts[i]
+            or None, and misses lists the indices without one.
+        """
+        keys = [self._key(text) for text in texts]
+        found: dict[bytes, bytes] = {}
+        unique = list(dict.fromkeys(keys))
+        try:
+            with self._lock:
+                for start in range(0, len(unique), LOOKUP_CHUNK):
+                    chunk = unique[start : start + LOOKUP_CHUNK]
+                    rows = self._conn.execute(
+                        "SELECT key, vector FROM embeddings WHERE key IN "
+                        f"({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                    found.update(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read embedding cache: {e}")
+
+        vectors: list[list[float] | None] = []
+        misses: list[int] = []
+        for i, key in enumerate(keys):
+            blob = found.get(key)
+            if blob is None:
+                vectors.append(None)
+                misses.append(i)
+            else:
+                vectors.append(np.frombuffer(blob, dtype=np.float32))
+        return vectors, misses
+
+    def store(self, texts: list[str], vectors: list[list[float]] | np.ndarray) -> None:
+        """Cache embeddings of texts.
+
+        Args:
+            texts: Embedded texts.
+            vectors: Their embeddings, in the same order.
+        """
+        rows = [
+            (self._key(text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            # The cache is only an optimization; never fail an embed over it
+            logger.warning(f"Failed to write embedding cache: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -7,13 +7,14 @@ from memovault.config.embedder import (
     SentenceTransformerConfig,
 )
 from memovault.embedder.base import BaseEmbedder
-from memovault.embedder.ollama import OllamaEmbedder
-from memovault.embedder.openai import OpenAIEmbedder
-from memovault.embedder.sentence_transformer import SentenceTransformerEmbedder
 
 
 class EmbedderFactory:
-    """Factory class for creating Embedder instances."""
+    """Factory class for creating Embedder instances.
+
+    Backends are imported inside their branch, so only the selected
+    backend's SDK is loaded.
+    """
 
     @staticmethod
     def from_config(config: EmbedderConfig) -> BaseEmbedder:
@@ -31,16 +32,22 @@ class EmbedderFactory:
         if config.backend == "openai":
             if not isinstance(config.config, OpenAIEmbedderConfig):
                 raise ValueError("OpenAI backend requires OpenAIEmbedderConfig")
+            from memovault.embedder.openai import OpenAIEmbedder
+
             return OpenAIEmbedder(config.config)
         elif config.backend == "ollama":
             if not isinstance(config.config, OllamaEmbedderConfig):
                 raise ValueError("Ollama backend requires OllamaEmbedderConfig")
+            from memovault.embedder.ollama import OllamaEmbedder
+
             return OllamaEmbedder(config.config)
         elif config.backend == "sentence_transformer":
             if not isinstance(config.config, SentenceTransformerConfig):
                 raise ValueError(
                     "Sentence Transformer backend requires SentenceTransformerConfig"
                 )
+            from memovault.embedder.sentence_transformer import SentenceTransformerEmbedder
+
             return SentenceTransformerEmbedder(config.config)
         else:
             raise ValueError(f"Unsupported embedder backend: {config.backend}")
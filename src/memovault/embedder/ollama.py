@@ -1,10 +1,17 @@
 """Ollama embedder implementation for MemoVault."""
 
-from ollama import Client
+import numpy as np
 
 from memovault.config.embedder import OllamaEmbedderConfig
 from memovault.embedder.base import BaseEmbedder
+from memovault.utils.clients import get_ollama_client, get_ollama_http_client
 from memovault.utils.log import get_logger
+from memovault.utils.ollama_models import forget_models, list_local_models
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
 
 logger = get_logger(__name__)
 
@@ -19,7 +26,8 @@ class OllamaEmbedder(BaseEmbedder):
             config: Ollama embedder configuration.
         """
         self.config = config
-        self.client = Client(host=config.api_base)
+        self.client = get_ollama_client(config.api_base)
+        self.http = get_ollama_http_client(config.api_base)
 
         # Default model if not specified
         if not self.config.model_name_or_path:
@@ -29,10 +37,9 @@ class OllamaEmbedder(BaseEmbedder):
         self._ensure_model_exists()
         logger.info(f"Ollama Embedder initialized with model: {config.model_name_or_path}")
 
-    def _list_models(self) -> list[str]:
-        """List all models available in the Ollama client."""
-        local_models = self.client.list()["models"]
-        return [model.model for model in local_models]
+    def _list_models(self) -> frozenset[str]:
+        """List all models available in the Ollama client (cached per host)."""
+        return list_local_models(self.client, self.config.api_base)
 
     def _ensure_model_exists(self):
         """Ensure the specified model exists locally. If not, pull it."""
@@ -43,6 +50,7 @@ class OllamaEmbedder(BaseEmbedder):
                     f"Model {self.config.model_name_or_path} not found locally. Pulling..."
                 )
                 self.client.pull(self.config.model_name_or_path)
+                forget_models(self.config.api_base)
         except Exception as e:
             logger.warning(f"Could not verify model existence: {e}")
 
@@ -55,15 +63,37 @@ class OllamaEmbedder(BaseEmbedder):
         Returns:
             List of embeddings.
         """
+        return self.embed_ndarray(texts).tolist()
+
+    def embed_ndarray(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings as one float32 matrix of shape (len(texts), dims)."""
+        return self._embed_cached(texts, self._embed_uncached)
+
+    def _embed_uncached(self, texts: list[str]) -> np.ndarray:
+        """Embed texts with the model, bypassing the embedding cache."""
         # Truncate texts if needed
         texts = self._truncate_texts(texts, self.config.max_tokens)
 
         # Handle empty input
         if not texts:
-            return []
-
-        response = self.client.embed(
-            model=self.config.model_name_or_path,
-            input=texts,
+            return np.empty((0, 0), dtype=np.float32)
+
+        return self._normalize_matrix(self._request_embeddings(texts))
+
+    def _request_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Call /api/embed and return the raw embedding lists."""
+        # The SDK validates every float into a pydantic model; with orjson the
+        # raw response is parsed directly, which is several times faster
+        if orjson is None:
+            response = self.client.embed(
+                model=self.config.model_name_or_path,
+                input=texts,
+            )
+            return response.embeddings
+
+        response = self.http.post(
+            "/api/embed",
+            json={"model": self.config.model_name_or_path, "input": texts},
         )
-        return response.embeddings
+        response.raise_for_status()
+        return orjson.loads(response.content)["embeddings"]
@@ -1,9 +1,20 @@
 """OpenAI embedder implementation for MemoVault."""
 
+import base64
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import openai
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from memovault.config.embedder import OpenAIEmbedderConfig
 from memovault.embedder.base import BaseEmbedder
+from memovault.utils.clients import get_openai_client
 from memovault.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -19,10 +30,7 @@ class OpenAIEmbedder(BaseEmbedder):
             config: OpenAI embedder configuration.
         """
         self.config = config
-        self.client = openai.Client(
-            api_key=config.api_key,
-            base_url=config.api_base,
-        )
+        self.client = get_openai_client(config.api_key, config.api_base)
         logger.info(f"OpenAI Embedder initialized with model: {config.model_name_or_path}")
 
     def embed(self, texts: list[str]) -> list[list[float]]:
@@ -34,17 +42,46 @@ class OpenAIEmbedder(BaseEmbedder):
         Returns:
             List of embeddings.
         """
+        return self.embed_ndarray(texts).tolist()
+
+    def embed_ndarray(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings as one float32 matrix of shape (len(texts), dims)."""
+        return self._embed_cached(texts, self._embed_uncached)
+
+    def _embed_uncached(self, texts: list[str]) -> np.ndarray:
+        """Embed texts with the model, bypassing the embedding cache."""
         # Truncate texts if needed
         texts = self._truncate_texts(texts, self.config.max_tokens)
 
         # Handle empty input
         if not texts:
-            return []
+            return np.empty((0, 0), dtype=np.float32)
 
-        # Build request parameters
+        batch_size = self.config.batch_size
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) == 1:
+            return self._normalize_matrix(self._create(batches[0]))
+
+        # Requests are I/O bound, so threads overlap them on the shared client
+        workers = min(self.config.max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as pool:
+            results = list(pool.map(self._create, batches))
+        return self._normalize_matrix(np.concatenate(results))
+
+    @retry(
+        retry=retry_if_exception_type(openai.RateLimitError),
+        wait=wait_random_exponential(multiplier=0.5, max=20),
+        stop=stop_after_attempt(6),
+        reraise=True,
+    )
+    def _create(self, texts: list[str]) -> np.ndarray:
+        """Embed one request-sized batch, backing off on rate limits."""
+        # Build request parameters. Asking for base64 explicitly makes the SDK
+        # hand back the raw strings, which decode straight into the matrix.
         params = {
             "model": self.config.model_name_or_path,
             "input": texts,
+            "encoding_format": "base64",
         }
 
         # Add dimensions if specified and model supports it
@@ -55,4 +92,14 @@ class OpenAIEmbedder(BaseEmbedder):
 
         # Sort by index to ensure correct order
         embeddings_data = sorted(response.data, key=lambda x: x.index)
-        return [item.embedding for item in embeddings_data]
+        rows = [item.embedding for item in embeddings_data]
+        if not rows or not isinstance(rows[0], str):
+            # Compatible servers may ignore encoding_format and send floats
+            return self._as_matrix(rows)
+
+        first = np.frombuffer(base64.b64decode(rows[0]), dtype=np.float32)
+        matrix = np.empty((len(rows), first.shape[0]), dtype=np.float32)
+        matrix[0] = first
+        for i, row in enumerate(rows[1:], 1):
+            matrix[i] = np.frombuffer(base64.b64decode(row), dtype=np.float32)
+        return matrix
@@ -1,5 +1,7 @@
 """Sentence Transformer embedder implementation for MemoVault."""
 
+import numpy as np
+
 from memovault.config.embedder import SentenceTransformerConfig
 from memovault.embedder.base import BaseEmbedder
 from memovault.utils.log import get_logger
@@ -34,11 +36,18 @@ class SentenceTransformerEmbedder(BaseEmbedder):
                     "Install it with: pip install memovault[local]"
                 )
 
-            self._model = SentenceTransformer(
+            model = SentenceTransformer(
                 self.config.model_name_or_path,
                 trust_remote_code=self.config.trust_remote_code,
             )
-            logger.info(f"Loaded Sentence Transformer model: {self.config.model_name_or_path}")
+            # Inference is memory-bound on GPU; float16 halves the bytes moved
+            if self.config.half_precision and model.device.type == "cuda":
+                model.half()
+            self._model = model
+            logger.info(
+                f"Loaded Sentence Transformer model: {self.config.model_name_or_path} "
+                f"on {model.device}"
+            )
         return self._model
 
     def embed(self, texts: list[str]) -> list[list[float]]:
@@ -50,12 +59,26 @@ class SentenceTransformerEmbedder(BaseEmbedder):
         Returns:
             List of embeddings.
         """
+        return self.embed_ndarray(texts).tolist()
+
+    def embed_ndarray(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings as one float32 matrix of shape (len(texts), dims)."""
+        return self._embed_cached(texts, self._embed_uncached)
+
+    def _embed_uncached(self, texts: list[str]) -> np.ndarray:
+        """Embed texts with the model, bypassing the embedding cache."""
         # Truncate texts if needed
         texts = self._truncate_texts(texts, self.config.max_tokens)
 
         # Handle empty input
         if not texts:
-            return []
+            return np.empty((0, 0), dtype=np.float32)
 
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
-        return embeddings.tolist()
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.config.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=self.config.normalize,
+            show_progress_bar=False,
+        )
+        return embeddings.astype(np.float32, copy=False)
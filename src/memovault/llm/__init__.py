@@ -1,8 +1,26 @@
 """LLM module for MemoVault."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from memovault.llm.base import BaseLLM
 from memovault.llm.factory import LLMFactory
-from memovault.llm.ollama import OllamaLLM
-from memovault.llm.openai import OpenAILLM
+
+if TYPE_CHECKING:
+    from memovault.llm.ollama import OllamaLLM
+    from memovault.llm.openai import OpenAILLM
+
+# Backends are imported on first access so only the SDK in use is loaded
+_LAZY = {
+    "OllamaLLM": "memovault.llm.ollama",
+    "OpenAILLM": "memovault.llm.openai",
+}
 
 __all__ = ["BaseLLM", "OpenAILLM", "OllamaLLM", "LLMFactory"]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -2,12 +2,14 @@
 
 from memovault.config.llm import LLMConfig, OllamaLLMConfig, OpenAILLMConfig
 from memovault.llm.base import BaseLLM
-from memovault.llm.ollama import OllamaLLM
-from memovault.llm.openai import OpenAILLM
 
 
 class LLMFactory:
-    """Factory class for creating LLM instances."""
+    """Factory class for creating LLM instances.
+
+    Backends are imported inside their branch, so only the selected
+    backend's SDK is loaded.
+    """
 
     @staticmethod
     def from_config(config: LLMConfig) -> BaseLLM:
@@ -25,10 +27,14 @@ class LLMFactory:
         if config.backend == "openai":
             if not isinstance(config.config, OpenAILLMConfig):
                 raise ValueError("OpenAI backend requires OpenAILLMConfig")
+            from memovault.llm.openai import OpenAILLM
+
             return OpenAILLM(config.config)
         elif config.backend == "ollama":
             if not isinstance(config.config, OllamaLLMConfig):
                 raise ValueError("Ollama backend requires OllamaLLMConfig")
+            from memovault.llm.ollama import OllamaLLM
+
             return OllamaLLM(config.config)
         else:
             raise ValueError(f"Unsupported LLM backend: {config.backend}")
@@ -2,11 +2,11 @@
 
 from collections.abc import Generator
 
-from ollama import Client
-
 from memovault.config.llm import OllamaLLMConfig
 from memovault.llm.base import BaseLLM
+from memovault.utils.clients import get_ollama_client
 from memovault.utils.log import get_logger
+from memovault.utils.ollama_models import forget_models, list_local_models
 
 logger = get_logger(__name__)
 
@@ -21,7 +21,7 @@ class OllamaLLM(BaseLLM):
             config: Ollama LLM configuration.
         """
         self.config = config
-        self.client = Client(host=config.api_base)
+        self.client = get_ollama_client(config.api_base)
 
         # Default model if not specified
         if not self.config.model_name_or_path:
@@ -31,10 +31,9 @@ class OllamaLLM(BaseLLM):
         self._ensure_model_exists()
         logger.info(f"Ollama LLM initialized with model: {config.model_name_or_path}")
 
-    def _list_models(self) -> list[str]:
-        """List all models available in the Ollama client."""
-        local_models = self.client.list()["models"]
-        return [model.model for model in local_models]
+    def _list_models(self) -> frozenset[str]:
+        """List all models available in the Ollama client (cached per host)."""
+        return list_local_models(self.client, self.config.api_base)
 
     def _ensure_model_exists(self):
         """Ensure the specified model exists locally. If not, pull it."""
@@ -45,6 +44,7 @@ class OllamaLLM(BaseLLM):
                     f"Model {self.config.model_name_or_path} not found locally. Pulling..."
                 )
                 self.client.pull(self.config.model_name_or_path)
+                forget_models(self.config.api_base)
         except Exception as e:
             logger.warning(f"Could not verify model existence: {e}")
 
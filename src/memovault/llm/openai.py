@@ -2,10 +2,9 @@
 
 from collections.abc import Generator
 
-import openai
-
 from memovault.config.llm import OpenAILLMConfig
 from memovault.llm.base import BaseLLM
+from memovault.utils.clients import get_openai_client
 from memovault.utils.log import get_logger
 
 logger = get_logger(__name__)
@@ -21,10 +20,7 @@ class OpenAILLM(BaseLLM):
             config: OpenAI LLM configuration.
         """
         self.config = config
-        self.client = openai.Client(
-            api_key=config.api_key,
-            base_url=config.api_base,
-        )
+        self.client = get_openai_client(config.api_key, config.api_base)
         logger.info(f"OpenAI LLM initialized with model: {config.model_name_or_path}")
 
     def generate(self, messages: list[dict[str, str]], **kwargs) -> str:
@@ -1,10 +1,20 @@
 """Memory module for MemoVault."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from memovault.memory.base import BaseTextMemory
 from memovault.memory.factory import MemoryFactory
 from memovault.memory.item import MemoryItem, MemoryMetadata
 from memovault.memory.simple import SimpleMemory
-from memovault.memory.vector import VectorMemory
+
+if TYPE_CHECKING:
+    from memovault.memory.vector import VectorMemory
+
+# Backends are imported on first access so only the SDK in use is loaded
+_LAZY = {
+    "VectorMemory": "memovault.memory.vector",
+}
 
 __all__ = [
     "BaseTextMemory",
@@ -14,3 +24,10 @@ __all__ = [
     "VectorMemory",
     "MemoryFactory",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -1,6 +1,8 @@
 """Base memory class for MemoVault."""
 
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterator
 from typing import Any
 
 from memovault.memory.item import MemoryItem
@@ -37,6 +39,21 @@ class BaseTextMemory(ABC):
             List of matching memories.
         """
 
+    def search_batch(
+        self, queries: list[str], top_k: int = 5, **kwargs
+    ) -> list[list[MemoryItem]]:
+        """Search for several queries at once.
+
+        Args:
+            queries: Search queries.
+            top_k: Number of results to return per query.
+            **kwargs: Additional search parameters applied to every query.
+
+        Returns:
+            One list of matching memories per query.
+        """
+        return [self.search(query, top_k, **kwargs) for query in queries]
+
     @abstractmethod
     def get(self, memory_id: str) -> MemoryItem | None:
         """Get a memory by ID.
@@ -48,6 +65,18 @@ class BaseTextMemory(ABC):
             The memory item, or None if not found.
         """
 
+    def get_many(self, memory_ids: list[str]) -> list[MemoryItem]:
+        """Get several memories by ID, skipping IDs that are not found.
+
+        Args:
+            memory_ids: The memory IDs.
+
+        Returns:
+            The memory items that exist.
+        """
+        memories = (self.get(memory_id) for memory_id in memory_ids)
+        return [memory for memory in memories if memory is not None]
+
     @abstractmethod
     def get_all(self) -> list[MemoryItem]:
         """Get all memories.
@@ -56,6 +85,54 @@ class BaseTextMemory(ABC):
             List of all memories.
         """
 
+    @abstractmethod
+    def get_recent(self, limit: int) -> list[MemoryItem]:
+        """Get the most recently added memories, newest first.
+
+        Args:
+            limit: Maximum number of memories to return.
+
+        Returns:
+            List of recent memories.
+        """
+
+    def iter_recent(self, limit: int, page_size: int = 256) -> Iterator[list[MemoryItem]]:
+        """Yield the most recently added memories, newest first, in pages.
+
+        Backends override this to load one page at a time.
+
+        Args:
+            limit: Maximum number of memories to yield in total.
+            page_size: Maximum number of memories per page.
+        """
+        memories = self.get_recent(limit)
+        for start in range(0, len(memories), page_size):
+            yield memories[start:start + page_size]
+
+    def get_recent_previews(
+        self, limit: int, preview_len: int = 100
+    ) -> list[tuple[str, str, bool, str | None]]:
+        """Get lightweight previews of the most recent memories, newest first.
+
+        Backends override this to avoid loading full memory text and metadata.
+
+        Args:
+            limit: Maximum number of memories to return.
+            preview_len: Maximum characters of memory text to keep.
+
+        Returns:
+            List of (id, preview, truncated, type) tuples.
+        """
+        return [
+            (
+                mem.id,
+                mem.memory[:preview_len],
+                len(mem.memory) > preview_len,
+                mem.metadata.type,
+            )
+            for mem in self.get_recent(limit)
+        ]
+
     @abstractmethod
     def update(self, memory_id: str, memory: MemoryItem | dict[str, Any]) -> None:
         """Update a memory.
@@ -65,6 +142,18 @@ class BaseTextMemory(ABC):
             memory: The updated memory.
         """
 
+    def update_many(self, pairs: list[tuple[str, MemoryItem | dict[str, Any]]]) -> None:
+        """Update several memories.
+
+        Backends that can batch embedding or storage calls override this;
+        the default updates one memory at a time.
+
+        Args:
+            pairs: (memory ID, updated memory) pairs.
+        """
+        for memory_id, memory in pairs:
+            self.update(memory_id, memory)
+
     @abstractmethod
     def delete(self, memory_ids: list[str]) -> None:
         """Delete memories.
@@ -85,6 +174,16 @@ class BaseTextMemory(ABC):
             Number of memories.
         """
 
+    def count_by_ltm_status(self) -> dict[str | None, int]:
+        """Count memories per stored ltm_status.
+
+        Backends override this to count without loading every memory.
+
+        Returns:
+            Mapping of ltm_status (None for legacy memories) to count.
+        """
+        return dict(Counter(mem.metadata.ltm_status for mem in self.get_all()))
+
     @abstractmethod
     def load(self, path: str) -> None:
         """Load memories from disk.
@@ -94,9 +193,10 @@ class BaseTextMemory(ABC):
         """
 
     @abstractmethod
-    def dump(self, path: str) -> None:
+    def dump(self, path: str, pretty: bool = False) -> None:
         """Dump memories to disk.
 
         Args:
             path: Directory path to dump to.
+            pretty: Write indented JSON for human-edited exports.
         """
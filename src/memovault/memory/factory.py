@@ -2,12 +2,14 @@
 
 from memovault.config.memory import MemoryConfig, SimpleMemoryConfig, VectorMemoryConfig
 from memovault.memory.base import BaseTextMemory
-from memovault.memory.simple import SimpleMemory
-from memovault.memory.vector import VectorMemory
 
 
 class MemoryFactory:
-    """Factory class for creating Memory instances."""
+    """Factory class for creating Memory instances.
+
+    Backends are imported inside their branch, so the simple backend never
+    loads Qdrant or an embedder SDK.
+    """
 
     @staticmethod
     def from_config(config: MemoryConfig) -> BaseTextMemory:
@@ -25,10 +27,14 @@ class MemoryFactory:
         if config.backend == "simple":
             if not isinstance(config.config, SimpleMemoryConfig):
                 raise ValueError("Simple backend requires SimpleMemoryConfig")
+            from memovault.memory.simple import SimpleMemory
+
             return SimpleMemory(config.config)
         elif config.backend == "vector":
             if not isinstance(config.config, VectorMemoryConfig):
                 raise ValueError("Vector backend requires VectorMemoryConfig")
+            from memovault.memory.vector import VectorMemory
+
             return VectorMemory(config.config)
         else:
             raise ValueError(f"Unsupported memory backend: {config.backend}")
@@ -4,7 +4,10 @@ import uuid
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+# Validation context marking data read back from a memory backend
+_STORED: dict[str, Any] = {"stored": True}
 
 
 class MemoryMetadata(BaseModel):
@@ -68,23 +71,22 @@ class MemoryItem(BaseModel):
 
     @field_validator("id")
     @classmethod
-    def _validate_id(cls, v: str) -> str:
+    def _validate_id(cls, v: str, info: ValidationInfo) -> str:
         """Validate UUID format."""
-        uuid.UUID(v)
+        if info.context is not _STORED:
+            uuid.UUID(v)
         return v
 
     @field_validator("metadata", mode="before")
     @classmethod
     def _coerce_metadata(cls, v: Any) -> Any:
         """Coerce metadata from dict if needed."""
-        if isinstance(v, MemoryMetadata):
-            return v
-        if isinstance(v, dict):
+        if isinstance(v, dict) and ("id" in v or "memory" in v):
             # Remove top-level fields that belong to MemoryItem
             v = v.copy()
             v.pop("id", None)
             v.pop("memory", None)
-            return MemoryMetadata(**v)
+        # Dicts are validated into MemoryMetadata by pydantic itself
         return v
 
     @classmethod
@@ -92,6 +94,15 @@ class MemoryItem(BaseModel):
         """Create from dictionary."""
         return cls(**data)
 
+    @classmethod
+    def from_stored(cls, data: dict) -> "MemoryItem":
+        """Create from a dict read back from a memory backend.
+
+        Skips re-checking the id's UUID format, which was validated when
+        the memory was stored; all other fields are still validated.
+        """
+        return cls.model_validate(data, context=_STORED)
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return self.model_dump(exclude_none=True)
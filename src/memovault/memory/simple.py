@@ -2,17 +2,29 @@
 
 import json
 import os
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator
 from typing import Any
 
+import numpy as np
 from rank_bm25 import BM25Okapi
 
 from memovault.config.memory import SimpleMemoryConfig
 from memovault.memory.base import BaseTextMemory
 from memovault.memory.item import MemoryItem
+from memovault.utils.jsonfile import read_json, write_json
 from memovault.utils.log import get_logger
 
+try:
+    import bm25s
+except ImportError:  # pragma: no cover - exercised only without bm25s
+    bm25s = None
+
 logger = get_logger(__name__)
 
+# Number of ranked queries SimpleMemory remembers between index rebuilds
+SEARCH_CACHE_SIZE = 256
+
 
 class SimpleMemory(BaseTextMemory):
     """Simple JSON-based memory implementation.
@@ -29,6 +41,14 @@ class SimpleMemory(BaseTextMemory):
         """
         self.config = config
         self.memories: list[dict[str, Any]] = []
+        # Memory id -> position in self.memories
+        self._positions: dict[str, int] = {}
+        # Lowercased tokens of each memory text, parallel to self.memories
+        self._tokens: list[list[str]] = []
+        # BM25 index over self.memories, rebuilt lazily after text changes
+        self._bm25: Any = None
+        # (query tokens, top_k) -> ranked positions, valid for the current index
+        self._ranked: OrderedDict[tuple[tuple[str, ...], int], np.ndarray] = OrderedDict()
         logger.info("SimpleMemory initialized")
 
     def add(self, memories: list[MemoryItem | dict[str, Any]]) -> list[str]:
@@ -40,20 +60,33 @@ class SimpleMemory(BaseTextMemory):
         Returns:
             List of memory IDs that were added.
         """
-        added_ids = []
-        for mem in memories:
-            if isinstance(mem, dict):
-                mem = MemoryItem(**mem)
-
-            memory_dict = mem.model_dump()
+        added = self._extend(
+            (MemoryItem(**mem) if isinstance(mem, dict) else mem).model_dump()
+            for mem in memories
+        )
+        logger.debug("Added %s memories", len(added))
+        return [mem["id"] for mem in added]
 
-            # Check for duplicates
-            if memory_dict["id"] not in [m["id"] for m in self.memories]:
-                self.memories.append(memory_dict)
-                added_ids.append(memory_dict["id"])
-                logger.debug(f"Added memory: {memory_dict['id']}")
+    def _extend(self, memory_dicts: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Store memory dicts whose ids are not stored yet, in one extend.
 
-        return added_ids
+        Returns:
+            The dicts that were stored, in order.
+        """
+        positions = self._positions
+        start = len(self.memories)
+        new: list[dict[str, Any]] = []
+        for mem in memory_dicts:
+            # Skip duplicates, including repeats within the batch
+            if mem["id"] not in positions:
+                positions[mem["id"]] = start + len(new)
+                new.append(mem)
+
+        if new:
+            self.memories.extend(new)
+            self._tokens.extend(mem["memory"].lower().split() for mem in new)
+            self._reset_index()
+        return new
 
     def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
         """Search for memories using BM25 ranking.
@@ -65,26 +98,80 @@ class SimpleMemory(BaseTextMemory):
         Returns:
             List of matching memories ranked by BM25 relevance.
         """
-        if not self.memories:
+        query_tokens = query.lower().split()
+        if not self.memories or top_k <= 0 or not query_tokens:
             return []
 
-        # Tokenize all memories for BM25
-        corpus = [mem["memory"].lower().split() for mem in self.memories]
-        bm25 = BM25Okapi(corpus)
-
-        # Score query against corpus
-        query_tokens = query.lower().split()
+        # A query that is a stored memory id returns that memory directly
+        i = self._positions.get(query.strip())
+        if i is not None:
+            return [MemoryItem.from_stored(self.memories[i])]
+
+        key = (tuple(query_tokens), top_k)
+        ranked = self._ranked.get(key)
+        if ranked is None:
+            ranked = self._rank(query_tokens, top_k)
+            self._ranked[key] = ranked
+            if len(self._ranked) > SEARCH_CACHE_SIZE:
+                self._ranked.popitem(last=False)
+        else:
+            self._ranked.move_to_end(key)
+        # Items are rebuilt on every call so metadata updates show through
+        return [MemoryItem.from_stored(self.memories[i]) for i in ranked]
+
+    def _rank(self, query_tokens: list[str], top_k: int) -> np.ndarray:
+        """Return positions of the top_k memories for a tokenized query."""
+        # Compute document frequencies only after the memory texts changed,
+        # not on every query; texts are tokenized once when stored
+        bm25 = self._bm25
+        if bm25 is None:
+            bm25 = self._bm25 = self._build_index(self._tokens)
+        if bm25 is False:  # no memory has any token
+            return np.empty(0, dtype=np.intp)
+
+        if bm25s is not None:
+            return self._rank_bm25s(bm25, query_tokens, min(top_k, len(self.memories)))
+        return self._rank_okapi(bm25, query_tokens, top_k)
+
+    def _reset_index(self) -> None:
+        """Drop the BM25 index and the rankings computed from it."""
+        self._bm25 = None
+        self._ranked.clear()
+
+    @staticmethod
+    def _build_index(corpus: list[list[str]]) -> Any:
+        """Index tokenized memories with bm25s when installed, else rank_bm25.
+
+        Returns False when the corpus has no tokens at all.
+        """
+        if not any(corpus):
+            return False
+        if bm25s is None:
+            return BM25Okapi(corpus)
+        # Sparse-matrix scoring (memovault[fast]); numpy rather than numba, whose
+        # per-process JIT compile costs more than its faster queries save
+        retriever = bm25s.BM25(backend="numpy")
+        retriever.index(corpus, show_progress=False)
+        return retriever
+
+    @staticmethod
+    def _rank_bm25s(retriever: Any, query_tokens: list[str], top_k: int) -> np.ndarray:
+        """Return indices of the top_k scoring memories from a bm25s index."""
+        docs, scores = retriever.retrieve([query_tokens], k=top_k, show_progress=False)
+        # Results are sorted by score; drop memories sharing no query token
+        return docs[0][scores[0] > 0]
+
+    @staticmethod
+    def _rank_okapi(bm25: BM25Okapi, query_tokens: list[str], top_k: int) -> np.ndarray:
+        """Return indices of the top_k scoring memories from a rank_bm25 index."""
         scores = bm25.get_scores(query_tokens)
 
-        # Pair memories with scores, filter out zero-score results
-        scored = [
-            (mem, score)
-            for mem, score in zip(self.memories, scores)
-            if score > 0
-        ]
-        scored.sort(key=lambda x: x[1], reverse=True)
-
-        return [MemoryItem(**mem) for mem, _ in scored[:top_k]]
+        # Drop zero-score results, then select the top_k without a full sort
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size > top_k:
+            part = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+            candidates = candidates[part]
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
 
     def get(self, memory_id: str) -> MemoryItem | None:
         """Get a memory by ID.
@@ -95,10 +182,8 @@ class SimpleMemory(BaseTextMemory):
         Returns:
             The memory item, or None if not found.
         """
-        for memory in self.memories:
-            if memory["id"] == memory_id:
-                return MemoryItem(**memory)
-        return None
+        i = self._positions.get(memory_id)
+        return MemoryItem.from_stored(self.memories[i]) if i is not None else None
 
     def get_all(self) -> list[MemoryItem]:
         """Get all memories.
@@ -106,7 +191,60 @@ class SimpleMemory(BaseTextMemory):
         Returns:
             List of all memories.
         """
-        return [MemoryItem(**mem) for mem in self.memories]
+        # Fresh items on purpose: callers mutate results (recall counters) before
+        # update(), so cached MemoryItems would alias the store.
+        return [MemoryItem.from_stored(mem) for mem in self.memories]
+
+    def get_recent(self, limit: int) -> list[MemoryItem]:
+        """Get the most recently added memories, newest first.
+
+        Args:
+            limit: Maximum number of memories to return.
+
+        Returns:
+            List of recent memories.
+        """
+        if limit <= 0:
+            return []
+        return [MemoryItem.from_stored(mem) for mem in reversed(self.memories[-limit:])]
+
+    def iter_recent(self, limit: int, page_size: int = 256) -> Iterator[list[MemoryItem]]:
+        """Yield the most recently added memories, newest first, in pages.
+
+        Args:
+            limit: Maximum number of memories to yield in total.
+            page_size: Maximum number of memories per page.
+        """
+        end = len(self.memories)
+        stop = max(end - limit, 0)
+        while end > stop:
+            start = max(end - page_size, stop)
+            yield [MemoryItem.from_stored(mem) for mem in reversed(self.memories[start:end])]
+            end = start
+
+    def get_recent_previews(
+        self, limit: int, preview_len: int = 100
+    ) -> list[tuple[str, str, bool, str | None]]:
+        """Get previews of the most recent memories straight from stored dicts.
+
+        Args:
+            limit: Maximum number of memories to return.
+            preview_len: Maximum characters of memory text to keep.
+
+        Returns:
+            List of (id, preview, truncated, type) tuples.
+        """
+        if limit <= 0:
+            return []
+        return [
+            (
+                mem["id"],
+                mem["memory"][:preview_len],
+                len(mem["memory"]) > preview_len,
+                mem["metadata"].get("type"),
+            )
+            for mem in reversed(self.memories[-limit:])
+        ]
 
     def update(self, memory_id: str, memory: MemoryItem | dict[str, Any]) -> None:
         """Update a memory.
@@ -121,13 +259,17 @@ class SimpleMemory(BaseTextMemory):
         memory.id = memory_id
         memory_dict = memory.model_dump()
 
-        for i, mem in enumerate(self.memories):
-            if mem["id"] == memory_id:
-                self.memories[i] = memory_dict
-                logger.debug(f"Updated memory: {memory_id}")
-                return
+        i = self._positions.get(memory_id)
+        if i is None:
+            logger.warning(f"Memory not found for update: {memory_id}")
+            return
 
-        logger.warning(f"Memory not found for update: {memory_id}")
+        # Metadata-only updates (e.g. recall counts) keep the index
+        if self.memories[i]["memory"] != memory_dict["memory"]:
+            self._tokens[i] = memory_dict["memory"].lower().split()
+            self._reset_index()
+        self.memories[i] = memory_dict
+        logger.debug("Updated memory: %s", memory_id)
 
     def delete(self, memory_ids: list[str]) -> None:
         """Delete memories.
@@ -135,14 +277,22 @@ class SimpleMemory(BaseTextMemory):
         Args:
             memory_ids: List of memory IDs to delete.
         """
-        self.memories = [m for m in self.memories if m["id"] not in memory_ids]
-        logger.debug(f"Deleted {len(memory_ids)} memories")
+        ids = set(memory_ids)
+        kept = [i for i, m in enumerate(self.memories) if m["id"] not in ids]
+        self.memories = [self.memories[i] for i in kept]
+        self._tokens = [self._tokens[i] for i in kept]
+        self._positions = {m["id"]: i for i, m in enumerate(self.memories)}
+        self._reset_index()
+        logger.debug("Deleted %s memories", len(memory_ids))
 
     def delete_all(self) -> None:
         """Delete all memories."""
         count = len(self.memories)
         self.memories = []
-        logger.info(f"Deleted all {count} memories")
+        self._positions = {}
+        self._tokens = []
+        self._reset_index()
+        logger.info("Deleted all %s memories", count)
 
     def count(self) -> int:
         """Count total memories.
@@ -152,6 +302,14 @@ class SimpleMemory(BaseTextMemory):
         """
         return len(self.memories)
 
+    def count_by_ltm_status(self) -> dict[str | None, int]:
+        """Count memories per stored ltm_status straight from stored dicts.
+
+        Returns:
+            Mapping of ltm_status (None for legacy memories) to count.
+        """
+        return dict(Counter(mem["metadata"].get("ltm_status") for mem in self.memories))
+
     def load(self, path: str) -> None:
         """Load memories from disk.
 
@@ -164,36 +322,33 @@ class SimpleMemory(BaseTextMemory):
                 logger.warning(f"Memory file not found: {memory_file}")
                 return
 
-            with open(memory_file, encoding="utf-8") as f:
-                raw_memories = json.load(f)
+            raw_memories = read_json(memory_file)
 
             # Add loaded memories
-            for mem in raw_memories:
-                if mem["id"] not in [m["id"] for m in self.memories]:
-                    self.memories.append(mem)
+            self._extend(raw_memories)
 
-            logger.info(f"Loaded {len(raw_memories)} memories from {memory_file}")
+            logger.info("Loaded %s memories from %s", len(raw_memories), memory_file)
 
         except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON: {e}")
-        except Exception as e:
-            logger.error(f"Error loading memories: {e}")
+            logger.error("Error decoding JSON: %s", e)
+        except OSError as e:
+            logger.error("Error loading memories: %s", e)
 
-    def dump(self, path: str) -> None:
+    def dump(self, path: str, pretty: bool = False) -> None:
         """Dump memories to disk.
 
         Args:
             path: Directory path to dump to.
+            pretty: Write indented JSON for human-edited exports.
         """
         try:
             os.makedirs(path, exist_ok=True)
             memory_file = os.path.join(path, self.config.memory_filename)
 
-            with open(memory_file, "w", encoding="utf-8") as f:
-                json.dump(self.memories, f, indent=2, ensure_ascii=False)
+            write_json(memory_file, self.memories, pretty=pretty)
 
-            logger.info(f"Dumped {len(self.memories)} memories to {memory_file}")
+            logger.info("Dumped %s memories to %s", len(self.memories), memory_file)
 
-        except Exception as e:
-            logger.error(f"Error dumping memories: {e}")
+        except OSError as e:
+            logger.error("Error dumping memories: %s", e)
             raise
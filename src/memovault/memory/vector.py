@@ -2,18 +2,25 @@
 
 import json
 import os
+from collections.abc import Iterator
 from typing import Any
 
+import numpy as np
+
 from memovault.config.memory import VectorMemoryConfig
 from memovault.embedder.factory import EmbedderFactory
 from memovault.memory.base import BaseTextMemory
 from memovault.memory.item import MemoryItem
+from memovault.utils.jsonfile import read_json, write_json
 from memovault.utils.log import get_logger
 from memovault.vecdb.item import VecDBItem
 from memovault.vecdb.qdrant import QdrantVecDB
 
 logger = get_logger(__name__)
 
+# ltm_status values written by MemoVault (legacy memories have none)
+LTM_STATUSES = ("candidate", "promoted")
+
 
 class VectorMemory(BaseTextMemory):
     """Vector-based memory implementation using embeddings and Qdrant.
@@ -53,7 +60,7 @@ class VectorMemory(BaseTextMemory):
 
         # Generate embeddings
         texts = [mem.memory for mem in memory_items]
-        embeddings = self.embedder.embed(texts)
+        embeddings = self.embedder.embed_ndarray(texts)
 
         # Create vector DB items
         vec_items = []
@@ -61,7 +68,7 @@ class VectorMemory(BaseTextMemory):
             vec_items.append(
                 VecDBItem(
                     id=item.id,
-                    vector=embedding,
+                    vector=embedding.tolist(),
                     payload=item.model_dump(),
                 )
             )
@@ -70,7 +77,7 @@ class VectorMemory(BaseTextMemory):
         self.vector_db.add(vec_items)
 
         added_ids = [item.id for item in memory_items]
-        logger.debug(f"Added {len(added_ids)} memories with embeddings")
+        logger.debug("Added %s memories with embeddings", len(added_ids))
         return added_ids
 
     def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
@@ -79,29 +86,50 @@ class VectorMemory(BaseTextMemory):
         Args:
             query: Search query.
             top_k: Number of results to return.
-            **kwargs: Additional search parameters (e.g., filter).
+            **kwargs: Additional search parameters (e.g., filter,
+                query_vector to reuse an already computed embedding).
 
         Returns:
             List of matching memories sorted by relevance.
         """
-        # Generate query embedding
-        query_embedding = self.embedder.embed_one(query)
+        # Generate query embedding unless the caller already has one
+        # (the API query cache passes query_vector); otherwise the embedder's
+        # persistent cache still avoids a network call on repeats
+        query_embedding = kwargs.get("query_vector")
+        if query_embedding is None:
+            query_embedding = self.embedder.embed_one(query)
 
         # Search vector DB
         filter_dict = kwargs.get("filter")
         results = self.vector_db.search(query_embedding, top_k, filter=filter_dict)
+        return self._to_memories(results)
 
-        # Sort by score (higher is better)
-        results = sorted(results, key=lambda x: x.score or 0, reverse=True)
+    def search_batch(
+        self, queries: list[str], top_k: int = 5, **kwargs
+    ) -> list[list[MemoryItem]]:
+        """Search for several queries with one embedder call and one DB request.
 
-        # Convert to MemoryItems
-        memories = []
-        for result in results:
-            if result.payload:
-                mem = MemoryItem(**result.payload)
-                memories.append(mem)
+        Args:
+            queries: Search queries.
+            top_k: Number of results to return per query.
+            **kwargs: Additional search parameters (e.g., filter,
+                query_vectors to reuse already computed embeddings).
+
+        Returns:
+            One list of matching memories per query.
+        """
+        query_embeddings = kwargs.get("query_vectors")
+        if query_embeddings is None:
+            query_embeddings = self.embedder.embed(queries)
+
+        filter_dict = kwargs.get("filter")
+        batches = self.vector_db.search_batch(query_embeddings, top_k, filter=filter_dict)
+        return [self._to_memories(results) for results in batches]
 
-        return memories
+    @staticmethod
+    def _to_memories(results: list) -> list[MemoryItem]:
+        """Convert search results to MemoryItems, keeping Qdrant's best-first order."""
+        return [MemoryItem.from_stored(result.payload) for result in results if result.payload]
 
     def get(self, memory_id: str) -> MemoryItem | None:
         """Get a memory by ID.
@@ -114,22 +142,111 @@ class VectorMemory(BaseTextMemory):
         """
         result = self.vector_db.get_by_id(memory_id)
         if result and result.payload:
-            return MemoryItem(**result.payload)
+            return MemoryItem.from_stored(result.payload)
         return None
 
+    def get_many(self, memory_ids: list[str]) -> list[MemoryItem]:
+        """Get several memories by ID in one vector DB request.
+
+        Args:
+            memory_ids: The memory IDs.
+
+        Returns:
+            The memory items that exist.
+        """
+        return self._to_memories(self.vector_db.get_by_ids(memory_ids))
+
     def get_all(self) -> list[MemoryItem]:
         """Get all memories.
 
         Returns:
             List of all memories.
         """
-        results = self.vector_db.get_all()
         return [
-            MemoryItem(**result.payload)
+            MemoryItem.from_stored(result.payload)
+            for result in self.vector_db.iter_all()
+            if result.payload
+        ]
+
+    def get_all_with_vectors(self) -> tuple[list[MemoryItem], np.ndarray]:
+        """Get all memories with their stored embeddings.
+
+        Returns:
+            The memories and a float32 matrix with one embedding row each.
+        """
+        _, matrix, payloads = self.vector_db.get_all_arrays()
+        keep = [i for i, payload in enumerate(payloads) if payload]
+        if len(keep) < len(payloads):
+            matrix = matrix[keep]
+        return [MemoryItem.from_stored(payloads[i]) for i in keep], matrix
+
+    def get_recent(self, limit: int) -> list[MemoryItem]:
+        """Get the most recently created memories, newest first.
+
+        Args:
+            limit: Maximum number of memories to return.
+
+        Returns:
+            List of recent memories.
+        """
+        if limit <= 0:
+            return []
+        results = self.vector_db.get_recent(limit, order_key="metadata.created_at")
+        return [
+            MemoryItem.from_stored(result.payload)
             for result in results
             if result.payload
         ]
 
+    def iter_recent(self, limit: int, page_size: int = 256) -> Iterator[list[MemoryItem]]:
+        """Yield the most recently created memories, newest first, in pages.
+
+        Each page is a separate ordered scroll, so only one page of payloads
+        is held in memory at a time.
+
+        Args:
+            limit: Maximum number of memories to yield in total.
+            page_size: Maximum number of memories per page.
+        """
+        pages = self.vector_db.iter_recent(
+            limit, order_key="metadata.created_at", page_size=page_size
+        )
+        for page in pages:
+            yield [MemoryItem.from_stored(result.payload) for result in page if result.payload]
+
+    def get_recent_previews(
+        self, limit: int, preview_len: int = 100
+    ) -> list[tuple[str, str, bool, str | None]]:
+        """Get previews of the most recent memories.
+
+        Only the memory text and type are fetched from Qdrant; the rest of
+        the payload and the vector never leave the database.
+
+        Args:
+            limit: Maximum number of memories to return.
+            preview_len: Maximum characters of memory text to keep.
+
+        Returns:
+            List of (id, preview, truncated, type) tuples.
+        """
+        if limit <= 0:
+            return []
+        results = self.vector_db.get_recent(
+            limit,
+            order_key="metadata.created_at",
+            payload_fields=["memory", "metadata.type"],
+        )
+        previews = []
+        for result in results:
+            if not result.payload:
+                continue
+            text = result.payload.get("memory", "")
+            mem_type = (result.payload.get("metadata") or {}).get("type")
+            previews.append(
+                (result.id, text[:preview_len], len(text) > preview_len, mem_type)
+            )
+        return previews
+
     def update(self, memory_id: str, memory: MemoryItem | dict[str, Any]) -> None:
         """Update a memory.
 
@@ -137,22 +254,35 @@ class VectorMemory(BaseTextMemory):
             memory_id: The memory ID to update.
             memory: The updated memory.
         """
-        if isinstance(memory, dict):
-            memory = MemoryItem(**memory)
+        self.update_many([(memory_id, memory)])
 
-        memory.id = memory_id
+    def update_many(self, pairs: list[tuple[str, MemoryItem | dict[str, Any]]]) -> None:
+        """Update several memories with one embedder call and one upsert.
 
-        # Generate new embedding
-        embedding = self.embedder.embed_one(memory.memory)
+        Args:
+            pairs: (memory ID, updated memory) pairs.
+        """
+        if not pairs:
+            return
 
-        # Update in vector DB
-        vec_item = VecDBItem(
-            id=memory_id,
-            vector=embedding,
-            payload=memory.model_dump(),
+        memories = []
+        for memory_id, memory in pairs:
+            if isinstance(memory, dict):
+                memory = MemoryItem(**memory)
+            memory.id = memory_id
+            memories.append(memory)
+
+        # Generate new embeddings
+        embeddings = self.embedder.embed_ndarray([mem.memory for mem in memories])
+
+        # Upsert into the vector DB (replaces vector and payload by id)
+        self.vector_db.add(
+            [
+                VecDBItem(id=mem.id, vector=embedding.tolist(), payload=mem.model_dump())
+                for mem, embedding in zip(memories, embeddings)
+            ]
         )
-        self.vector_db.update(memory_id, vec_item)
-        logger.debug(f"Updated memory: {memory_id}")
+        logger.debug("Updated %s memories", len(memories))
 
     def delete(self, memory_ids: list[str]) -> None:
         """Delete memories.
@@ -162,7 +292,7 @@ class VectorMemory(BaseTextMemory):
         """
         if memory_ids:
             self.vector_db.delete(memory_ids)
-            logger.debug(f"Deleted {len(memory_ids)} memories")
+            logger.debug("Deleted %s memories", len(memory_ids))
 
     def delete_all(self) -> None:
         """Delete all memories."""
@@ -170,13 +300,27 @@ class VectorMemory(BaseTextMemory):
         logger.info("Deleted all memories")
 
     def count(self) -> int:
-        """Count total memories.
+        """Count total memories (the vector DB's fast, approximate count).
 
         Returns:
             Number of memories.
         """
         return self.vector_db.count()
 
+    def count_by_ltm_status(self) -> dict[str | None, int]:
+        """Count memories per ltm_status with filtered vector DB counts.
+
+        Returns:
+            Mapping of ltm_status (None for legacy memories) to count.
+        """
+        # Filtered estimates can be far off, so these are counted exactly
+        counts: dict[str | None, int] = {
+            status: self.vector_db.count(filter={"metadata.ltm_status": status}, exact=True)
+            for status in LTM_STATUSES
+        }
+        counts[None] = self.vector_db.count(filter={"metadata.ltm_status": None}, exact=True)
+        return {status: n for status, n in counts.items() if n}
+
     def load(self, path: str) -> None:
         """Load memories from disk.
 
@@ -189,39 +333,38 @@ class VectorMemory(BaseTextMemory):
                 logger.warning(f"Memory file not found: {memory_file}")
                 return
 
-            with open(memory_file, encoding="utf-8") as f:
-                raw_data = json.load(f)
+            raw_data = read_json(memory_file)
 
-            # Load VecDBItems
-            vec_items = [VecDBItem.from_dict(item) for item in raw_data]
-            self.vector_db.add(vec_items)
+            # Ids were validated before they were dumped
+            loaded = self.vector_db.add_many(
+                VecDBItem.model_construct(**item) for item in raw_data
+            )
 
-            logger.info(f"Loaded {len(vec_items)} memories from {memory_file}")
+            logger.info("Loaded %s memories from %s", loaded, memory_file)
 
         except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON: {e}")
-        except Exception as e:
-            logger.error(f"Error loading memories: {e}")
+            logger.error("Error decoding JSON: %s", e)
+        except OSError as e:
+            logger.error("Error loading memories: %s", e)
 
-    def dump(self, path: str) -> None:
+    def dump(self, path: str, pretty: bool = False) -> None:
         """Dump memories to disk.
 
         Args:
             path: Directory path to dump to.
+            pretty: Write indented JSON for human-edited exports.
         """
         try:
             os.makedirs(path, exist_ok=True)
             memory_file = os.path.join(path, self.config.memory_filename)
 
-            # Get all items from vector DB
-            all_items = self.vector_db.get_all()
-            data = [item.to_dict() for item in all_items]
+            # Stream items from the vector DB; only their dicts are kept
+            data = [item.to_dict() for item in self.vector_db.iter_all(with_vectors=True)]
 
-            with open(memory_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json(memory_file, data, pretty=pretty)
 
-            logger.info(f"Dumped {len(data)} memories to {memory_file}")
+            logger.info("Dumped %s memories to %s", len(data), memory_file)
 
-        except Exception as e:
-            logger.error(f"Error dumping memories: {e}")
+        except OSError as e:
+            logger.error("Error dumping memories: %s", e)
             raise
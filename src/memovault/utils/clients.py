@@ -0,0 +1,47 @@
+"""Process-wide API clients shared by LLM and embedder backends."""
+
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any
+
+# httpx negotiates HTTP/2 only when the h2 package (memovault[fast]) is installed
+HAS_HTTP2 = find_spec("h2") is not None
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str, api_base: str) -> Any:
+    """Return the shared openai.Client for an API key and base URL.
+
+    The LLM, the fast LLM and the embedder usually talk to the same
+    endpoint; sharing one client lets them reuse a single connection pool
+    instead of each paying its own TCP/TLS handshakes. With h2 installed
+    the connection uses HTTP/2, so concurrent requests (e.g. parallel
+    embedding batches) are multiplexed over one TLS connection.
+    """
+    import openai
+
+    kwargs: dict[str, Any] = {}
+    if HAS_HTTP2:
+        # DefaultHttpxClient keeps the SDK's timeouts and pool limits
+        kwargs["http_client"] = openai.DefaultHttpxClient(http2=True)
+    return openai.Client(api_key=api_key, base_url=api_base, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def get_ollama_client(host: str) -> Any:
+    """Return the shared ollama.Client for a host."""
+    from ollama import Client
+
+    return Client(host=host)
+
+
+@lru_cache(maxsize=None)
+def get_ollama_http_client(host: str) -> Any:
+    """Return a shared httpx.Client for raw requests to an Ollama host.
+
+    Used where the ollama SDK's pydantic response models are too slow
+    (large embedding responses). Like the SDK, requests have no timeout.
+    """
+    import httpx
+
+    return httpx.Client(base_url=host, timeout=None)
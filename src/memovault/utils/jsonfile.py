@@ -0,0 +1,54 @@
+"""JSON file helpers for memory persistence."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def read_json(path: str) -> Any:
+    """Read a JSON document from disk.
+
+    Args:
+        path: File to read.
+
+    Returns:
+        The decoded document.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON (orjson's error
+            subclasses it).
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: str, data: Any, pretty: bool = False) -> None:
+    """Write a JSON document to disk.
+
+    The compact form is written straight to bytes with orjson when it is
+    installed. ``pretty`` uses the stdlib encoder with indentation, for
+    exports meant to be read or edited by hand.
+
+    Args:
+        path: File to write.
+        data: JSON-serializable document.
+        pretty: Indent the output instead of writing it compactly.
+    """
+    if pretty:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        return
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
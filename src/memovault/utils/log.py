@@ -1,35 +1,50 @@
 """Logging utilities for MemoVault."""
 
 import logging
+import os
 import sys
-from functools import lru_cache
+
+ROOT_LOGGER = "memovault"
+
+
+def _configure_root() -> None:
+    """Attach the stderr handler and level to the package logger, once.
+
+    Module loggers are its children and propagate their records to it.
+    """
+    root = logging.getLogger(ROOT_LOGGER)
+    if root.handlers:
+        return
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    root.addHandler(handler)
+
+    # Get log level from environment
+    log_level = os.environ.get("MEMOVAULT_LOG_LEVEL", "INFO").upper()
+    root.setLevel(getattr(logging, log_level, logging.INFO))
+
+
+_configure_root()
 
 
-@lru_cache()
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name.
 
+    Names outside the package (e.g. ``__main__`` when a module is run with
+    ``python -m``) are nested under it so they share its handler.
+
     Args:
         name: The name of the logger.
 
     Returns:
-        A configured logger instance.
+        A logger writing through the package's stderr handler.
     """
-    logger = logging.getLogger(name)
-
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
-        logger.addHandler(handler)
-
-        # Get log level from environment
-        import os
-        log_level = os.environ.get("MEMOVAULT_LOG_LEVEL", "INFO").upper()
-        logger.setLevel(getattr(logging, log_level, logging.INFO))
-
-    return logger
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return logging.getLogger(name)
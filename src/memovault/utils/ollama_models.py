@@ -0,0 +1,43 @@
+"""Process-wide cache of the models available on Ollama servers."""
+
+import threading
+import time
+from typing import Any
+
+# Seconds a fetched model list is reused
+MODEL_LIST_TTL = 60.0
+
+_lock = threading.Lock()
+# host -> (expiry time, model names)
+_model_lists: dict[str, tuple[float, frozenset[str]]] = {}
+
+
+def list_local_models(client: Any, host: str) -> frozenset[str]:
+    """Return the names of the models on an Ollama server.
+
+    The list is cached per host for MODEL_LIST_TTL seconds, so an Ollama
+    embedder and LLM created together share a single /api/tags request.
+
+    Args:
+        client: ollama.Client connected to host.
+        host: Server URL, used as the cache key.
+
+    Returns:
+        Set of model names.
+    """
+    now = time.monotonic()
+    with _lock:
+        cached = _model_lists.get(host)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+    models = frozenset(model.model for model in client.list()["models"])
+    with _lock:
+        _model_lists[host] = (now + MODEL_LIST_TTL, models)
+    return models
+
+
+def forget_models(host: str) -> None:
+    """Drop the cached model list of a host (e.g. after pulling a model)."""
+    with _lock:
+        _model_lists.pop(host, None)
@@ -1,7 +1,5 @@
 """Prompt templates for MemoVault."""
 
-from datetime import datetime
-
 CHAT_SYSTEM_PROMPT = """You are a knowledgeable and helpful AI assistant with access to personal memories.
 You have stored memories that help you provide personalized responses.
 Use these memories to understand the user's context, preferences, and past interactions.
@@ -23,9 +21,9 @@ CHAT_CONTINUATION_SYSTEM_PROMPT = """You are a helpful AI assistant with memory
 
 {stm_section}"""
 
-EXTRACTION_PROMPT = f"""You are a memory extractor. Your task is to extract important information from conversations that should be remembered.
+EXTRACTION_PROMPT = """You are a memory extractor. Your task is to extract important information from conversations that should be remembered.
 
-Current date and time: {datetime.now().isoformat()}
+Current date and time: {current_time}
 
 Guidelines:
 - Extract facts, preferences, events, opinions, and important details
@@ -45,7 +43,7 @@ Types can be: "fact", "preference", "event", "opinion", "procedure", "personal"
 Only return the JSON array, no other text.
 
 Conversation to extract from:
-{{messages}}
+{messages}
 
 JSON Output:"""
 
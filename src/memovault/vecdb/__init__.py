@@ -1,7 +1,24 @@
 """Vector database module for MemoVault."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from memovault.vecdb.base import BaseVecDB
 from memovault.vecdb.item import VecDBItem
-from memovault.vecdb.qdrant import QdrantVecDB
+
+if TYPE_CHECKING:
+    from memovault.vecdb.qdrant import QdrantVecDB
+
+# Backends are imported on first access so only the SDK in use is loaded
+_LAZY = {
+    "QdrantVecDB": "memovault.vecdb.qdrant",
+}
 
 __all__ = ["BaseVecDB", "VecDBItem", "QdrantVecDB"]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -1,8 +1,12 @@
 """Base vector database class for MemoVault."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from typing import Any
 
+import numpy as np
+
 from memovault.vecdb.item import VecDBItem
 
 
@@ -39,6 +43,7 @@ class BaseVecDB(ABC):
         query_vector: list[float],
         top_k: int,
         filter: dict[str, Any] | None = None,
+        with_vectors: bool = False,
     ) -> list[VecDBItem]:
         """Search for similar items.
 
@@ -46,31 +51,146 @@ class BaseVecDB(ABC):
             query_vector: Vector to search for.
             top_k: Number of results to return.
             filter: Optional payload filters.
+            with_vectors: Also return the stored vectors.
 
         Returns:
             List of search results with similarity scores.
         """
 
-    @abstractmethod
-    def get_by_id(self, id: str) -> VecDBItem | None:
-        """Get an item by ID."""
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+        with_vectors: bool = False,
+    ) -> list[list[VecDBItem]]:
+        """Search for several query vectors at once.
+
+        Backends that support batched requests should override this to use a
+        single round-trip.
+
+        Args:
+            query_vectors: Vectors to search for.
+            top_k: Number of results to return per vector.
+            filter: Optional payload filters applied to every search.
+            with_vectors: Also return the stored vectors.
+
+        Returns:
+            One list of search results per query vector.
+        """
+        return [
+            self.search(vector, top_k, filter=filter, with_vectors=with_vectors)
+            for vector in query_vectors
+        ]
+
+    # Reads return payloads only unless with_vectors is set, since vectors
+    # are by far the largest part of each item
+
+    def get_by_id(self, id: str, with_vectors: bool = False) -> VecDBItem | None:
+        """Get an item by ID.
+
+        Callers needing several items should use get_by_ids(), which
+        fetches them in one request.
+        """
+        items = self.get_by_ids([id], with_vectors=with_vectors)
+        return items[0] if items else None
 
     @abstractmethod
-    def get_by_ids(self, ids: list[str]) -> list[VecDBItem]:
+    def get_by_ids(self, ids: list[str], with_vectors: bool = False) -> list[VecDBItem]:
         """Get multiple items by their IDs."""
 
     @abstractmethod
-    def get_all(self) -> list[VecDBItem]:
+    def get_all(self, with_vectors: bool = False) -> list[VecDBItem]:
         """Get all items in the collection."""
 
+    def iter_all(self, with_vectors: bool = False) -> Iterator[VecDBItem]:
+        """Yield all items in the collection.
+
+        Backends override this to fetch one page at a time; the default
+        fetches everything with get_all().
+        """
+        yield from self.get_all(with_vectors=with_vectors)
+
+    def get_all_arrays(self) -> tuple[list[str], np.ndarray, list[dict[str, Any]]]:
+        """Get all items as parallel ids, a float32 vector matrix and payloads.
+
+        Backends override this to fill the matrix page by page; the default
+        goes through iter_all().
+        """
+        ids: list[str] = []
+        rows: list[list[float]] = []
+        payloads: list[dict[str, Any]] = []
+        for item in self.iter_all(with_vectors=True):
+            ids.append(item.id)
+            rows.append(item.vector or [])
+            payloads.append(item.payload or {})
+        return ids, np.array(rows, dtype=np.float32), payloads
+
     @abstractmethod
-    def count(self) -> int:
-        """Count items in the collection."""
+    def get_recent(
+        self,
+        limit: int,
+        order_key: str,
+        payload_fields: list[str] | None = None,
+    ) -> list[VecDBItem]:
+        """Get up to limit items ordered by a payload key, descending.
+
+        Args:
+            limit: Maximum number of items to return.
+            order_key: Payload key to order by.
+            payload_fields: Optional payload keys to fetch (default: all).
+        """
+
+    def iter_recent(
+        self, limit: int, order_key: str, page_size: int = 256
+    ) -> Iterator[list[VecDBItem]]:
+        """Yield up to limit items ordered by a payload key, descending, in pages.
+
+        Backends override this to fetch one page per request; the default
+        fetches everything with get_recent().
+
+        Args:
+            limit: Maximum number of items to yield in total.
+            order_key: Payload key to order by.
+            page_size: Maximum number of items per page.
+        """
+        items = self.get_recent(limit, order_key)
+        for start in range(0, len(items), page_size):
+            yield items[start:start + page_size]
+
+    @abstractmethod
+    def count(self, filter: dict[str, Any] | None = None, exact: bool = False) -> int:
+        """Count items in the collection.
+
+        Args:
+            filter: Optional payload filters the items must match.
+            exact: Count every matching item instead of accepting the
+                backend's (cheaper) estimate.
+        """
 
     @abstractmethod
     def add(self, data: list[VecDBItem]) -> None:
         """Add items to the collection."""
 
+    def add_many(self, data: Iterable[VecDBItem], batch_size: int = 512) -> int:
+        """Add a large stream of items in batches of batch_size.
+
+        Backends override this to send batches concurrently; the default
+        calls add() once per batch.
+
+        Args:
+            data: Items to add.
+            batch_size: Maximum number of items per add() call.
+
+        Returns:
+            Number of items added.
+        """
+        count = 0
+        for batch in batched(data, batch_size):
+            self.add(batch)
+            count += len(batch)
+        return count
+
     @abstractmethod
     def update(self, id: str, data: VecDBItem) -> None:
         """Update an item in the collection."""
@@ -82,3 +202,10 @@ class BaseVecDB(ABC):
     @abstractmethod
     def delete_all(self) -> None:
         """Delete all items from the collection."""
+
+
+def batched(items: Iterable[VecDBItem], size: int) -> Iterator[list[VecDBItem]]:
+    """Split items into lists of at most size items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
@@ -38,6 +38,20 @@ class VecDBItem(BaseModel):
         """Create VecDBItem from dictionary."""
         return cls(**data)
 
+    @classmethod
+    def from_point(cls, point: Any) -> "VecDBItem":
+        """Wrap a point returned by the vector database without validation.
+
+        Ids and vectors were checked when the point was stored; validating
+        every float of every returned vector again dominated read paths.
+        """
+        return cls.model_construct(
+            id=point.id,
+            vector=point.vector,
+            payload=point.payload,
+            score=getattr(point, "score", None),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format."""
         return self.model_dump(exclude_none=True)
@@ -1,14 +1,27 @@
 """Qdrant vector database implementation for MemoVault."""
 
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
 from typing import Any
 
+import numpy as np
+from qdrant_client.http import models
+from qdrant_client.http.exceptions import UnexpectedResponse
+
 from memovault.config.vecdb import QdrantConfig
 from memovault.utils.log import get_logger
-from memovault.vecdb.base import BaseVecDB
+from memovault.vecdb.base import BaseVecDB, batched
 from memovault.vecdb.item import VecDBItem
 
 logger = get_logger(__name__)
 
+# Distinct payload filters kept as prebuilt Qdrant Filter objects
+FILTER_CACHE_SIZE = 128
+
+# Points per upsert request; larger add() calls are split into batches
+UPSERT_BATCH_SIZE = 512
+
 
 class QdrantVecDB(BaseVecDB):
     """Qdrant vector database implementation."""
@@ -22,6 +35,19 @@ class QdrantVecDB(BaseVecDB):
         from qdrant_client import QdrantClient
 
         self.config = config
+        # Embedded mode does exact search and ignores indexes/search params
+        self._remote = bool(config.url or (config.host and config.port))
+        # Replicas that must answer point reads (None = server default, one)
+        self._read_consistency = (
+            models.ReadConsistencyType(config.read_consistency)
+            if config.read_consistency
+            else None
+        )
+        # Qdrant Filter objects keyed by their sorted filter-dict items
+        self._filters: dict[tuple[tuple[str, Any], ...], Any] = {}
+        # Threads for background server requests (add_many upserts, scroll
+        # prefetch); created on first use
+        self._io_executor: ThreadPoolExecutor | None = None
 
         # Build client kwargs based on configuration
         client_kwargs: dict[str, Any] = {}
@@ -32,22 +58,39 @@ class QdrantVecDB(BaseVecDB):
         elif config.host and config.port:
             client_kwargs["host"] = config.host
             client_kwargs["port"] = config.port
+        if self._remote:
+            client_kwargs["prefer_grpc"] = config.prefer_grpc
+            if config.grpc_port is not None:
+                client_kwargs["grpc_port"] = config.grpc_port
         else:
             # Local/embedded mode
             client_kwargs["path"] = config.path
-            logger.info(f"Qdrant running in local mode at: {config.path}")
+            logger.info("Qdrant running in local mode at: %s", config.path)
 
         self.client = QdrantClient(**client_kwargs)
         self.create_collection()
-        logger.info(f"Qdrant initialized with collection: {config.collection_name}")
+        logger.info("Qdrant initialized with collection: %s", config.collection_name)
+
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Return the I/O thread pool, creating it on first use."""
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=self.config.io_workers, thread_name_prefix="qdrant-io"
+            )
+        return self._io_executor
+
+    def close(self) -> None:
+        """Shut down the I/O threads and close the client connection."""
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+        self.client.close()
 
     def create_collection(self) -> None:
         """Create a new collection if it doesn't exist."""
-        from qdrant_client.http import models
-        from qdrant_client.http.exceptions import UnexpectedResponse
-
         if self.collection_exists(self.config.collection_name):
-            logger.debug(f"Collection '{self.config.collection_name}' already exists")
+            logger.debug("Collection '%s' already exists", self.config.collection_name)
+            self._ensure_payload_indexes()
             return
 
         distance_map = {
@@ -56,13 +99,38 @@ class QdrantVecDB(BaseVecDB):
             "dot": models.Distance.DOT,
         }
 
+        # int8 scalar quantization keeps a 4x smaller copy of every vector in
+        # RAM for the HNSW scan (binary: 32x, one bit per dimension); originals
+        # stay on disk for rescoring.
+        # With on_disk, full vectors and payloads are memory-mapped so only
+        # the working set stays resident and the OS pages out cold memories.
+        quantization_config = None
+        if self.config.embed_dtype == "int8":
+            quantization_config = models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    always_ram=True,
+                )
+            )
+        elif self.config.embed_dtype == "binary":
+            quantization_config = models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+
         try:
             self.client.create_collection(
                 collection_name=self.config.collection_name,
                 vectors_config=models.VectorParams(
                     size=self.config.vector_dimension,
                     distance=distance_map[self.config.distance_metric],
+                    on_disk=self.config.on_disk,
+                ),
+                hnsw_config=models.HnswConfigDiff(
+                    m=self.config.hnsw_m,
+                    ef_construct=self.config.hnsw_ef_construct,
                 ),
+                quantization_config=quantization_config,
+                on_disk_payload=self.config.on_disk,
             )
             logger.info(
                 f"Created collection '{self.config.collection_name}' "
@@ -70,9 +138,30 @@ class QdrantVecDB(BaseVecDB):
             )
         except UnexpectedResponse as err:
             if getattr(err, "status_code", None) == 409 or "already exists" in str(err).lower():
-                logger.debug(f"Collection '{self.config.collection_name}' already exists")
+                logger.debug("Collection '%s' already exists", self.config.collection_name)
                 return
             raise
+        self._ensure_payload_indexes()
+
+    def _ensure_payload_indexes(self) -> None:
+        """Create payload indexes needed for ordered scrolls and status counts.
+
+        Server-side ``order_by`` requires a range index on the ordering key.
+        Local (embedded) mode orders without indexes, so it is skipped there.
+        """
+        if not self._remote:
+            return
+
+        self.client.create_payload_index(
+            collection_name=self.config.collection_name,
+            field_name="metadata.created_at",
+            field_schema=models.PayloadSchemaType.DATETIME,
+        )
+        self.client.create_payload_index(
+            collection_name=self.config.collection_name,
+            field_name="metadata.ltm_status",
+            field_schema=models.PayloadSchemaType.KEYWORD,
+        )
 
     def list_collections(self) -> list[str]:
         """List all collections."""
@@ -82,21 +171,21 @@ class QdrantVecDB(BaseVecDB):
     def delete_collection(self, name: str) -> None:
         """Delete a collection."""
         self.client.delete_collection(collection_name=name)
-        logger.info(f"Deleted collection: {name}")
+        logger.info("Deleted collection: %s", name)
 
     def collection_exists(self, name: str) -> bool:
-        """Check if a collection exists."""
-        try:
-            self.client.get_collection(collection_name=name)
-            return True
-        except Exception:
-            return False
+        """Check if a collection exists.
+
+        Connection and auth errors propagate instead of reading as "missing".
+        """
+        return self.client.collection_exists(collection_name=name)
 
     def search(
         self,
         query_vector: list[float],
         top_k: int,
         filter: dict[str, Any] | None = None,
+        with_vectors: bool = False,
     ) -> list[VecDBItem]:
         """Search for similar items.
 
@@ -104,6 +193,7 @@ class QdrantVecDB(BaseVecDB):
             query_vector: Vector to search for.
             top_k: Number of results to return.
             filter: Optional payload filters.
+            with_vectors: Also return the stored vectors.
 
         Returns:
             List of search results with similarity scores.
@@ -115,130 +205,354 @@ class QdrantVecDB(BaseVecDB):
             query=query_vector,
             limit=top_k,
             query_filter=qdrant_filter,
-            with_vectors=True,
+            search_params=self._search_params(),
+            with_vectors=with_vectors,
             with_payload=True,
         ).points
 
-        return [
-            VecDBItem(
-                id=point.id,
-                vector=point.vector,
-                payload=point.payload,
-                score=point.score,
-            )
-            for point in response
-        ]
+        return self._points_to_items(response)
 
-    def _dict_to_filter(self, filter_dict: dict[str, Any]) -> Any:
-        """Convert a dictionary filter to a Qdrant Filter object."""
-        from qdrant_client.http import models
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+        with_vectors: bool = False,
+    ) -> list[list[VecDBItem]]:
+        """Search for several query vectors in one request.
 
-        conditions = []
-        for field, value in filter_dict.items():
-            conditions.append(
-                models.FieldCondition(key=field, match=models.MatchValue(value=value))
-            )
-        return models.Filter(must=conditions)
+        Args:
+            query_vectors: Vectors to search for.
+            top_k: Number of results to return per vector.
+            filter: Optional payload filters applied to every search.
+            with_vectors: Also return the stored vectors.
 
-    def get_by_id(self, id: str) -> VecDBItem | None:
-        """Get an item by ID."""
-        response = self.client.retrieve(
+        Returns:
+            One list of search results per query vector.
+        """
+        if not query_vectors:
+            return []
+
+        qdrant_filter = self._dict_to_filter(filter) if filter else None
+        search_params = self._search_params()
+        responses = self.client.query_batch_points(
             collection_name=self.config.collection_name,
-            ids=[id],
-            with_payload=True,
-            with_vectors=True,
+            requests=[
+                models.QueryRequest(
+                    query=vector,
+                    limit=top_k,
+                    filter=qdrant_filter,
+                    params=search_params,
+                    with_vector=with_vectors,
+                    with_payload=True,
+                )
+                for vector in query_vectors
+            ],
         )
+        return [self._points_to_items(response.points) for response in responses]
 
-        if not response:
+    def _search_params(self) -> Any:
+        """Search-time HNSW/quantization parameters (ignored by embedded mode)."""
+        if not self._remote:
             return None
 
-        point = response[0]
-        return VecDBItem(
-            id=point.id,
-            vector=point.vector,
-            payload=point.payload,
-        )
+        params: dict[str, Any] = {}
+        if self.config.hnsw_ef:
+            params["hnsw_ef"] = self.config.hnsw_ef
+        if self.config.embed_dtype != "fp32":
+            # Over-fetch from the quantized index, then rescore with full vectors
+            params["quantization"] = models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=self.config.quantization_oversampling,
+            )
+        return models.SearchParams(**params) if params else None
+
+    @staticmethod
+    def _points_to_items(points: list[Any]) -> list[VecDBItem]:
+        """Convert scored Qdrant points to VecDBItems."""
+        return [VecDBItem.from_point(point) for point in points]
+
+    def _dict_to_filter(self, filter_dict: dict[str, Any]) -> Any:
+        """Convert a dictionary filter to a Qdrant Filter object.
+
+        A None value matches items where the field is missing, null or empty.
+        Filters are built once per distinct dict and reused, since callers
+        only ever combine a handful of type/source/status values.
+        """
+        try:
+            key = tuple(sorted(filter_dict.items()))
+            cached = self._filters.get(key)
+        except TypeError:  # unhashable values (e.g. lists) are not cached
+            return self._build_filter(filter_dict)
+        if cached is None:
+            if len(self._filters) >= FILTER_CACHE_SIZE:
+                self._filters.clear()
+            cached = self._filters[key] = self._build_filter(filter_dict)
+        return cached
+
+    @staticmethod
+    def _build_filter(filter_dict: dict[str, Any]) -> Any:
+        conditions = []
+        for field, value in filter_dict.items():
+            if value is None:
+                conditions.append(models.IsEmptyCondition(is_empty=models.PayloadField(key=field)))
+            else:
+                conditions.append(
+                    models.FieldCondition(key=field, match=models.MatchValue(value=value))
+                )
+        return models.Filter(must=conditions)
 
-    def get_by_ids(self, ids: list[str]) -> list[VecDBItem]:
+    def get_by_ids(self, ids: list[str], with_vectors: bool = False) -> list[VecDBItem]:
         """Get multiple items by their IDs."""
         if not ids:
             return []
 
         response = self.client.retrieve(
             collection_name=self.config.collection_name,
+            consistency=self._read_consistency,
             ids=ids,
             with_payload=True,
-            with_vectors=True,
+            with_vectors=with_vectors,
         )
 
-        return [
-            VecDBItem(
-                id=point.id,
-                vector=point.vector,
-                payload=point.payload,
-            )
-            for point in response
-        ]
+        return [VecDBItem.from_point(point) for point in response]
 
-    def get_all(self, scroll_limit: int = 100) -> list[VecDBItem]:
+    def get_all(self, with_vectors: bool = False, scroll_limit: int = 100) -> list[VecDBItem]:
         """Get all items in the collection."""
-        all_points = []
-        offset = None
+        return list(self.iter_all(with_vectors, scroll_limit))
 
-        while True:
-            points, offset = self.client.scroll(
+    def iter_all(self, with_vectors: bool = False, scroll_limit: int = 100) -> Iterator[VecDBItem]:
+        """Yield all items in the collection, one scroll page in memory at a time."""
+
+        def fetch(offset: Any) -> tuple[list[Any], Any]:
+            return self.client.scroll(
+                collection_name=self.config.collection_name,
+                consistency=self._read_consistency,
+                limit=scroll_limit,
+                offset=offset,
+                with_vectors=with_vectors,
+                with_payload=True,
+            )
+
+        for points in self._scroll_pages(fetch):
+            for point in points:
+                yield VecDBItem.from_point(point)
+
+    def get_all_arrays(
+        self, scroll_limit: int = 256
+    ) -> tuple[list[str], np.ndarray, list[dict[str, Any]]]:
+        """Get all items as parallel ids, a float32 vector matrix and payloads.
+
+        Each scroll page is converted to float32 as it arrives, so the
+        vectors are never held as Python float lists all at once.
+        """
+
+        def fetch(offset: Any) -> tuple[list[Any], Any]:
+            return self.client.scroll(
                 collection_name=self.config.collection_name,
+                consistency=self._read_consistency,
                 limit=scroll_limit,
                 offset=offset,
                 with_vectors=True,
                 with_payload=True,
             )
 
-            if not points:
-                break
+        ids: list[str] = []
+        payloads: list[dict[str, Any]] = []
+        blocks = [np.empty((0, self.config.vector_dimension), dtype=np.float32)]
+        for points in self._scroll_pages(fetch):
+            ids.extend(str(point.id) for point in points)
+            payloads.extend(point.payload or {} for point in points)
+            blocks.append(np.array([point.vector for point in points], dtype=np.float32))
+        return ids, np.concatenate(blocks), payloads
+
+    def _scroll_pages(
+        self, fetch: Callable[[Any], tuple[list[Any], Any]]
+    ) -> Iterator[list[Any]]:
+        """Yield scroll pages until the offset runs out.
+
+        Each page's offset is only known once it arrives, so pages cannot be
+        requested in parallel; against a server the next page is fetched in
+        the background while the caller handles the current one.
+        """
+        if not self._remote:
+            offset = None
+            while True:
+                points, offset = fetch(offset)
+                if points:
+                    yield points
+                if not points or offset is None:
+                    return
+
+        pool = self._get_io_executor()
+        pending = pool.submit(fetch, None)
+        while True:
+            points, offset = pending.result()
+            if points and offset is not None:
+                pending = pool.submit(fetch, offset)
+            if points:
+                yield points
+            if not points or offset is None:
+                return
 
-            all_points.extend(points)
+    def get_recent(
+        self,
+        limit: int,
+        order_key: str,
+        payload_fields: list[str] | None = None,
+    ) -> list[VecDBItem]:
+        """Get up to limit items ordered by a payload key, descending."""
+        points, _ = self.client.scroll(
+            collection_name=self.config.collection_name,
+            consistency=self._read_consistency,
+            limit=limit,
+            order_by=models.OrderBy(key=order_key, direction=models.Direction.DESC),
+            with_vectors=False,
+            with_payload=payload_fields if payload_fields else True,
+        )
+
+        return [VecDBItem.from_point(point) for point in points]
 
-            if offset is None:
-                break
+    def iter_recent(
+        self, limit: int, order_key: str, page_size: int = 256
+    ) -> Iterator[list[VecDBItem]]:
+        """Yield up to limit items ordered by a payload key, descending, in pages.
 
-        return [
-            VecDBItem(
-                id=point.id,
-                vector=point.vector,
-                payload=point.payload,
+        Each page is one ordered scroll starting from the last value seen.
+        The boundary value is inclusive, so items already yielded with that
+        value are skipped on the next page.
+        """
+        start_from = None
+        seen_at_start: set[Any] = set()
+        remaining = limit
+        while remaining > 0:
+            request_size = min(page_size, remaining) + len(seen_at_start)
+            points, _ = self.client.scroll(
+                collection_name=self.config.collection_name,
+                consistency=self._read_consistency,
+                limit=request_size,
+                order_by=models.OrderBy(
+                    key=order_key, direction=models.Direction.DESC, start_from=start_from
+                ),
+                with_vectors=False,
+                with_payload=True,
             )
-            for point in all_points
-        ]
+            page = [p for p in points if p.id not in seen_at_start][:remaining]
+            if not page:
+                return
+            yield [VecDBItem.from_point(p) for p in page]
+            remaining -= len(page)
+            if len(points) < request_size:
+                return
 
-    def count(self) -> int:
-        """Count items in the collection."""
-        response = self.client.count(collection_name=self.config.collection_name)
+            raw_last = self._payload_value(page[-1].payload, order_key)
+            if raw_last is None:
+                return
+            last = datetime.fromisoformat(raw_last) if isinstance(raw_last, str) else raw_last
+            if last != start_from:
+                seen_at_start = set()
+            seen_at_start.update(
+                p.id for p in page if self._payload_value(p.payload, order_key) == raw_last
+            )
+            start_from = last
+
+    @staticmethod
+    def _payload_value(payload: dict[str, Any] | None, key: str) -> Any:
+        """Read a dotted payload key such as ``metadata.created_at``."""
+        value: Any = payload
+        for part in key.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    def count(self, filter: dict[str, Any] | None = None, exact: bool = False) -> int:
+        """Count items in the collection, optionally matching a filter.
+
+        Without exact, the server sums its segment sizes (or estimates a
+        filter's cardinality) instead of walking every point.
+        """
+        response = self.client.count(
+            collection_name=self.config.collection_name,
+            count_filter=self._dict_to_filter(filter) if filter else None,
+            exact=exact,
+        )
         return response.count
 
     def add(self, data: list[VecDBItem]) -> None:
-        """Add items to the collection."""
-        from qdrant_client.http import models
+        """Add items to the collection.
 
+        More than UPSERT_BATCH_SIZE items are split into several upsert
+        requests (see add_many) to stay under server payload limits.
+        """
         if not data:
             return
+        if len(data) > UPSERT_BATCH_SIZE:
+            self.add_many(data, UPSERT_BATCH_SIZE)
+            return
 
-        points = [
-            models.PointStruct(
-                id=item.id,
-                vector=item.vector,
-                payload=item.payload,
+        if all(item.vector is not None for item in data):
+            # One columnar Batch; the client inspects each PointStruct separately.
+            # VecDBItem has already validated every field, so it is built
+            # without running pydantic over the vectors again.
+            points: Any = models.Batch.model_construct(
+                ids=[item.id for item in data],
+                vectors=[item.vector for item in data],
+                # Batch payloads must be dicts; an empty one is what None stores
+                payloads=[item.payload or {} for item in data],
             )
-            for item in data
-        ]
+        else:
+            points = [
+                models.PointStruct(
+                    id=item.id,
+                    vector=item.vector,
+                    payload=item.payload,
+                )
+                for item in data
+            ]
 
         self.client.upsert(collection_name=self.config.collection_name, points=points)
-        logger.debug(f"Added {len(data)} items to collection")
+        logger.debug("Added %s items to collection", len(data))
+
+    def add_many(
+        self, data: Iterable[VecDBItem], batch_size: int = UPSERT_BATCH_SIZE
+    ) -> int:
+        """Add a large stream of items, sending batches concurrently to a server.
+
+        Embedded mode writes through a single local store, so its batches
+        are added one after another.
+
+        Args:
+            data: Items to add.
+            batch_size: Maximum number of items per upsert request.
+
+        Returns:
+            Number of items added.
+        """
+        if not self._remote:
+            return super().add_many(data, batch_size)
+
+        def add(batch: list[VecDBItem]) -> int:
+            self.add(batch)
+            return len(batch)
+
+        # Batches must not exceed what add() sends in one request: a larger
+        # one would wait on the pool from inside one of its threads
+        batch_size = min(batch_size, UPSERT_BATCH_SIZE)
+        pool = self._get_io_executor()
+        added = 0
+        # At most io_workers batches are in flight, so a long stream is not
+        # materialized in memory ahead of the uploads
+        pending: set[Future[int]] = set()
+        for batch in batched(data, batch_size):
+            if len(pending) >= self.config.io_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                added += sum(future.result() for future in done)
+            pending.add(pool.submit(add, batch))
+        return added + sum(future.result() for future in pending)
 
     def update(self, id: str, data: VecDBItem) -> None:
         """Update an item in the collection."""
-        from qdrant_client.http import models
-
         if data.vector:
             self.client.upsert(
                 collection_name=self.config.collection_name,
@@ -253,8 +567,6 @@ class QdrantVecDB(BaseVecDB):
 
     def delete(self, ids: list[str]) -> None:
         """Delete items from the collection."""
-        from qdrant_client.http import models
-
         if not ids:
             return
 
@@ -262,10 +574,22 @@ class QdrantVecDB(BaseVecDB):
             collection_name=self.config.collection_name,
             points_selector=models.PointIdsList(points=ids),
         )
-        logger.debug(f"Deleted {len(ids)} items from collection")
+        logger.debug("Deleted %s items from collection", len(ids))
 
-    def delete_all(self) -> None:
-        """Delete all items from the collection by recreating it."""
-        self.delete_collection(self.config.collection_name)
-        self.create_collection()
-        logger.info(f"Cleared all items from collection: {self.config.collection_name}")
+    def delete_all(self, hard_reset: bool = False) -> None:
+        """Delete all items from the collection.
+
+        The collection itself, with its payload indexes and vector settings,
+        is kept; hard_reset drops and recreates it instead, e.g. to apply a
+        changed vector dimension or quantization.
+        """
+        if hard_reset:
+            self.delete_collection(self.config.collection_name)
+            self.create_collection()
+        else:
+            # A filter without conditions matches every point
+            self.client.delete(
+                collection_name=self.config.collection_name,
+                points_selector=models.FilterSelector(filter=models.Filter()),
+            )
+        logger.info("Cleared all items from collection: %s", self.config.collection_name)
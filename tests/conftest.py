@@ -1,14 +1,69 @@
 """Pytest configuration and fixtures."""
 
+import hashlib
 import os
 
+import numpy as np
 import pytest
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def setup_test_env():
     """Set up test environment variables."""
     # Use simple memory backend for tests by default
     os.environ.setdefault("MEMOVAULT_MEMORY_BACKEND", "simple")
     os.environ.setdefault("MEMOVAULT_LOG_LEVEL", "WARNING")
     yield
+
+
+class StubEmbedder:
+    """Embedder giving every distinct text its own pseudo-random vector."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_ndarray(texts).tolist()
+
+    def embed_one(self, text: str) -> list[float]:
+        return self.embed([text])[0]
+
+    def embed_ndarray(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        digests = [hashlib.sha256(text.encode()).digest()[:16] for text in texts]
+        return np.array([list(d) for d in digests], dtype=np.float32) - 127.5
+
+
+class StubLLM:
+    """LLM that answers with a numbered reply and records the prompts."""
+
+    def __init__(self):
+        self.calls: list[list[dict[str, str]]] = []
+
+    def generate(self, messages: list[dict[str, str]], **kwargs) -> str:
+        self.calls.append(messages)
+        return f"reply {len(self.calls)}"
+
+    def generate_stream(self, messages: list[dict[str, str]], **kwargs):
+        yield self.generate(messages)
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """A simple-backend MemoVault with stub embedder and LLM, stored in tmp_path."""
+    from memovault.config.settings import Settings
+    from memovault.core.memovault import MemoVault
+
+    settings = Settings(
+        data_dir=str(tmp_path),
+        memory_backend="simple",
+        llm_backend="ollama",
+        auto_score=False,
+        stm_enabled=False,
+        search_batch_window_ms=0,
+    )
+    vault = MemoVault(settings=settings)
+    # Gives the simple backend query embeddings, which enables the caches
+    vault._cube.memory.embedder = StubEmbedder()
+    vault._llm = StubLLM()
+    return vault
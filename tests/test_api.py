@@ -0,0 +1,232 @@
+"""Tests for the MCP server and REST API on a simple-backend vault."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from memovault.api import mcp
+from memovault.api._query_cache import QueryCache
+from memovault.api.mcp import MemoVaultMCPServer
+from memovault.api.rest import create_app
+
+
+def tool_output(result):
+    """Return a call_tool result as FastMCP's structured output."""
+    output = result.structured_content
+    return output["result"] if set(output) == {"result"} else output
+
+
+class TestSharedQueryCache:
+    """Tests for the query cache shared by both APIs."""
+
+    async def test_write_through_mcp_invalidates_rest_results(self, vault):
+        client = TestClient(create_app(vault))
+        server = MemoVaultMCPServer(vault)
+        vault.add(["python one", "cooking pasta"], skip_scoring=True)
+
+        first = client.post("/memories/search", json={"query": "python", "top_k": 5})
+        assert first.json()["total"] == 1
+
+        await server.mcp.call_tool("add_memory", {"content": "python two", "skip_scoring": True})
+
+        second = client.post("/memories/search", json={"query": "python", "top_k": 5})
+        assert second.json()["total"] == 2
+        assert server.qcache is QueryCache.for_vault(vault)
+
+    async def test_rest_then_mcp_search(self, vault):
+        client = TestClient(create_app(vault))
+        server = MemoVaultMCPServer(vault)
+        vault.add("python one", skip_scoring=True)
+
+        assert client.post("/memories/search", json={"query": "python"}).json()["total"] == 1
+        result = await server.mcp.call_tool("search_memories", {"query": "python"})
+
+        assert tool_output(result)["total"] == 1
+        assert "error" not in tool_output(result)
+
+    async def test_mcp_then_rest_search(self, vault):
+        client = TestClient(create_app(vault))
+        server = MemoVaultMCPServer(vault)
+        [memory_id] = vault.add("python one", skip_scoring=True)
+
+        await server.mcp.call_tool("search_memories", {"query": "python"})
+        response = client.post("/memories/search", json={"query": "python"})
+
+        assert response.status_code == 200
+        assert [mem["id"] for mem in response.json()["memories"]] == [memory_id]
+        assert vault.get(memory_id).metadata.recall_count == 2
+
+
+class TestMCPSearchCache:
+    """Tests that MCP writes invalidate cached search results."""
+
+    async def test_add_and_delete_invalidate_results(self, vault):
+        server = MemoVaultMCPServer(vault)
+        [memory_id] = vault.add("python one", skip_scoring=True)
+
+        async def total() -> int:
+            result = await server.mcp.call_tool("search_memories", {"query": "python"})
+            return tool_output(result)["total"]
+
+        assert await total() == 1
+        await server.mcp.call_tool("add_memory", {"content": "python two", "skip_scoring": True})
+        assert await total() == 2
+        await server.mcp.call_tool("delete_memory", {"memory_id": memory_id})
+        assert await total() == 1
+        assert server.qcache.stats()["query_cache"]["hits"] == 0
+
+
+class TestSingleFlight:
+    """Tests for de-duplication of concurrent identical MCP calls."""
+
+    async def test_concurrent_calls_share_one_run(self, vault):
+        server = MemoVaultMCPServer(vault)
+        release = asyncio.Event()
+        runs = []
+
+        async def work() -> list[int]:
+            runs.append(1)
+            await release.wait()
+            return [len(runs)]
+
+        first = asyncio.ensure_future(server._single_flight("key", work))
+        second = asyncio.ensure_future(server._single_flight("key", work))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == [[1], [1]]
+        assert runs == [1]
+        assert server._inflight == {}
+
+    async def test_distinct_keys_run_separately(self, vault):
+        server = MemoVaultMCPServer(vault)
+        runs = []
+
+        async def work() -> int:
+            runs.append(1)
+            await asyncio.sleep(0)
+            return len(runs)
+
+        await asyncio.gather(server._single_flight("a", work), server._single_flight("b", work))
+
+        assert len(runs) == 2
+
+    async def test_error_reaches_every_caller(self, vault):
+        server = MemoVaultMCPServer(vault)
+        release = asyncio.Event()
+
+        async def work() -> None:
+            await release.wait()
+            raise RuntimeError("backend down")
+
+        calls = [asyncio.ensure_future(server._single_flight("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert [str(result) for result in results] == ["backend down", "backend down"]
+        assert server._inflight == {}
+
+
+class TestMCPBatchRoute:
+    """Tests for the /batch route of the MCP HTTP app."""
+
+    def make_client(self, vault) -> TestClient:
+        return TestClient(MemoVaultMCPServer(vault).mcp.http_app())
+
+    def test_results_follow_call_order(self, vault):
+        ids = vault.add(["python one", "cooking pasta"], skip_scoring=True)
+        client = self.make_client(vault)
+
+        response = client.post(
+            "/batch",
+            json=[
+                {"tool": "get_memory", "arguments": {"memory_id": ids[1]}},
+                {"tool": "search_memories", "arguments": {"query": "python"}},
+                {"tool": "no_such_tool"},
+                {"tool": "get_memory", "arguments": {"memory_id": ids[0]}},
+            ],
+        )
+
+        assert response.status_code == 200
+        results = response.json()
+        assert [result["tool"] for result in results] == [
+            "get_memory",
+            "search_memories",
+            "no_such_tool",
+            "get_memory",
+        ]
+        assert results[0]["result"]["memory"] == "cooking pasta"
+        assert results[1]["result"]["total"] == 1
+        assert "error" in results[2]
+        assert results[3]["result"]["memory"] == "python one"
+
+    @pytest.mark.parametrize(
+        "body",
+        [b"not json", b'{"tool": "get_profile"}', b'[{"arguments": {}}]', b'["get_profile"]'],
+    )
+    def test_malformed_body_is_rejected(self, vault, body):
+        response = self.make_client(vault).post("/batch", content=body)
+
+        assert response.status_code == 400
+        assert "error" in response.json()
+
+    def test_oversized_batch_is_rejected(self, vault, monkeypatch):
+        monkeypatch.setattr(mcp, "MAX_BATCH_SIZE", 2)
+
+        response = self.make_client(vault).post("/batch", json=[{"tool": "get_profile"}] * 3)
+
+        assert response.status_code == 400
+        assert "max 2" in response.json()["error"]
+
+
+class TestCachedSearchRecalls:
+    """Tests that searches answered from the cache still count as recalls."""
+
+    async def test_mcp_cache_hit_counts_recall(self, vault):
+        server = MemoVaultMCPServer(vault)
+        [memory_id] = vault.add("python one", skip_scoring=True)
+
+        for _ in range(2):
+            result = await server.mcp.call_tool("search_memories", {"query": "python"})
+            assert tool_output(result)["total"] == 1
+
+        assert server.qcache.stats()["query_cache"]["hits"] == 1
+        assert vault.get(memory_id).metadata.recall_count == 2
+
+    def test_rest_cache_hit_counts_recall(self, vault):
+        client = TestClient(create_app(vault))
+        [memory_id] = vault.add("python one", skip_scoring=True)
+
+        for _ in range(2):
+            response = client.post("/memories/search", json={"query": "python"})
+            assert response.json()["total"] == 1
+
+        assert vault.get(memory_id).metadata.recall_count == 2
+
+
+class TestMCPChat:
+    """Tests for the chat_with_memory tool."""
+
+    async def test_every_chat_is_recorded(self, vault):
+        server = MemoVaultMCPServer(vault)
+
+        for _ in range(2):
+            await server.mcp.call_tool("chat_with_memory", {"query": "hello"})
+
+        assert len(vault.get_chat_history()) == 4
+
+
+class TestRESTChat:
+    """Tests for the /chat endpoint."""
+
+    def test_every_chat_is_recorded(self, vault):
+        client = TestClient(create_app(vault))
+        vault.add("python one", skip_scoring=True)
+
+        for _ in range(2):
+            response = client.post("/chat", json={"query": "python", "top_k": 3})
+            assert response.json()["memories_used"] == 1
+
+        assert len(vault.get_chat_history()) == 4
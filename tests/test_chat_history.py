@@ -1,5 +1,7 @@
 """Tests for chat history."""
 
+from datetime import datetime
+
 import pytest
 
 from memovault.core.chat_history import ChatHistory
@@ -58,3 +60,40 @@ class TestChatHistory:
         assert data["session_id"] == "test"
         assert data["total_messages"] == 1
         assert len(data["messages"]) == 1
+
+    def test_to_dict_tracks_created_at(self):
+        """Test that to_dict reflects a replaced created_at."""
+        history = ChatHistory()
+        assert history.to_dict()["created_at"] == history.created_at.isoformat()
+
+        history.created_at = datetime(2024, 1, 2, 3, 4, 5)
+        assert history.to_dict()["created_at"] == "2024-01-02T03:04:05"
+
+    def test_get_messages_without_copy(self):
+        """Test that copy=False returns the live history list."""
+        history = ChatHistory()
+        history.add_user_message("Hello")
+
+        assert history.get_messages(copy=False) is history.messages
+        assert history.get_messages() is not history.messages
+        assert history.get_messages() == history.messages
+
+
+class TestBoundedChatHistory:
+    """Tests for ChatHistory with max_messages."""
+
+    def test_oldest_messages_are_dropped(self, tmp_path):
+        """Test that only the newest max_messages are kept and persisted."""
+        history = ChatHistory(data_dir=tmp_path, max_messages=3)
+        for i in range(5):
+            history.add_user_message(f"Message {i}")
+
+        assert [m["content"] for m in history.get_messages()] == [
+            "Message 2",
+            "Message 3",
+            "Message 4",
+        ]
+        assert history.get_messages(limit=1) == [{"role": "user", "content": "Message 4"}]
+
+        reloaded = ChatHistory(data_dir=tmp_path, max_messages=2)
+        assert [m["content"] for m in reloaded.get_messages()] == ["Message 3", "Message 4"]
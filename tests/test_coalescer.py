@@ -0,0 +1,118 @@
+"""Tests for the MCP search coalescer."""
+
+import asyncio
+
+import pytest
+
+from memovault.api._coalescer import SearchCoalescer
+
+
+class FakeVault:
+    """Vault stub that records search calls and echoes the queries back."""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.searches: list[tuple[str, int, dict]] = []
+        self.batches: list[tuple[list[str], int, dict]] = []
+
+    def search(self, query: str, top_k: int = 5, **kwargs) -> list[str]:
+        self.searches.append((query, top_k, kwargs))
+        return [query]
+
+    def batch_search(self, queries: list[str], top_k: int = 5, **kwargs) -> list[list[str]]:
+        self.batches.append((list(queries), top_k, kwargs))
+        if self.error is not None:
+            raise self.error
+        return [[query] for query in queries]
+
+
+class TestSearchCoalescer:
+    """Tests for SearchCoalescer."""
+
+    async def test_window_batches_concurrent_searches(self):
+        vault = FakeVault()
+        coalescer = SearchCoalescer(vault, window=0.01)
+
+        results = await asyncio.gather(
+            *(coalescer.search(query, 5) for query in ["a", "b", "c"])
+        )
+
+        assert results == [["a"], ["b"], ["c"]]
+        assert vault.batches == [(["a", "b", "c"], 5, {"max_age_days": None})]
+        assert vault.searches == []
+
+    async def test_groups_by_key(self):
+        vault = FakeVault()
+        coalescer = SearchCoalescer(vault, window=0.01)
+
+        results = await asyncio.gather(
+            coalescer.search("a", 5),
+            coalescer.search("b", 3),
+            coalescer.search("c", 5, filter_dict={"metadata.type": "fact"}),
+            coalescer.search("d", 5),
+        )
+
+        assert results == [["a"], ["b"], ["c"], ["d"]]
+        batches = sorted(
+            (queries, top_k, kwargs.get("filter")) for queries, top_k, kwargs in vault.batches
+        )
+        assert batches == [
+            (["a", "d"], 5, None),
+            (["b"], 3, None),
+            (["c"], 5, {"metadata.type": "fact"}),
+        ]
+
+    async def test_precomputed_vectors_are_passed_through(self):
+        vault = FakeVault()
+        coalescer = SearchCoalescer(vault, window=0.01)
+
+        await asyncio.gather(
+            coalescer.search("a", 5, query_vector=[1.0]),
+            coalescer.search("b", 5, query_vector=[2.0]),
+        )
+
+        assert vault.batches[0][2]["query_vectors"] == [[1.0], [2.0]]
+
+    async def test_later_search_starts_a_new_window(self):
+        vault = FakeVault()
+        coalescer = SearchCoalescer(vault, window=0.01)
+
+        assert await coalescer.search("a", 5) == ["a"]
+        assert await coalescer.search("b", 5) == ["b"]
+
+        assert [queries for queries, _, _ in vault.batches] == [["a"], ["b"]]
+
+    async def test_error_reaches_every_waiter(self):
+        vault = FakeVault(error=RuntimeError("backend down"))
+        coalescer = SearchCoalescer(vault, window=0.01)
+
+        results = await asyncio.gather(
+            coalescer.search("a", 5), coalescer.search("b", 5), return_exceptions=True
+        )
+
+        assert [str(result) for result in results] == ["backend down", "backend down"]
+        assert len(vault.batches) == 1
+
+    async def test_zero_window_searches_directly(self):
+        vault = FakeVault()
+        coalescer = SearchCoalescer(vault, window=0)
+
+        assert await coalescer.search("a", 5, filter_dict={"metadata.source": "manual"}) == ["a"]
+
+        assert vault.batches == []
+        assert vault.searches == [
+            ("a", 5, {"max_age_days": None, "filter": {"metadata.source": "manual"}})
+        ]
+
+    async def test_cancelled_waiter_does_not_break_the_batch(self):
+        vault = FakeVault()
+        coalescer = SearchCoalescer(vault, window=0.01)
+
+        cancelled = asyncio.ensure_future(coalescer.search("a", 5))
+        kept = asyncio.ensure_future(coalescer.search("b", 5))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == ["b"]
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
@@ -0,0 +1,25 @@
+"""Tests for configuration classes."""
+
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+import memovault.config  # noqa: F401 - registers every config class
+from memovault.config.base import BaseConfig
+
+
+def _config_classes(cls=BaseConfig):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _config_classes(sub)
+
+
+class TestConfigSchemas:
+    """Tests for config schema compilation."""
+
+    def test_schemas_compiled_at_import(self):
+        """Test that no config defers schema building to first use."""
+        classes = list(_config_classes())
+        assert classes
+        for cls in classes:
+            assert cls.__pydantic_complete__, cls.__name__
+            assert isinstance(cls.__pydantic_validator__, SchemaValidator), cls.__name__
+            assert isinstance(cls.__pydantic_serializer__, SchemaSerializer), cls.__name__
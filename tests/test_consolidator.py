@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from memovault.core.consolidator import MemoryConsolidator
 from memovault.memory.item import MemoryItem
 
@@ -36,6 +38,61 @@ class TestMemoryConsolidator:
         )
         assert result["merged_groups"] == 0
 
+    def test_consolidate_with_embeddings(self):
+        cons = self._make_consolidator("User likes Python for coding")
+        items = [
+            MemoryItem(memory="User likes Python"),
+            MemoryItem(memory="User enjoys hiking"),
+            MemoryItem(memory="User prefers Python for coding"),
+        ]
+        vectors = {
+            "User likes Python": [1.0, 0.0],
+            "User enjoys hiking": [0.0, 1.0],
+            "User prefers Python for coding": [0.95, 0.1],
+        }
+        search_fn = MagicMock()
+        delete_fn = MagicMock()
+        add_fn = MagicMock()
+        progress = []
+
+        result = cons.consolidate(
+            get_all_fn=lambda: items,
+            search_fn=search_fn,
+            add_fn=add_fn,
+            delete_fn=delete_fn,
+            embed_fn=lambda texts: [vectors[t] for t in texts],
+            progress_fn=lambda *args: progress.append(args),
+        )
+
+        assert result == {"merged_groups": 1, "total_removed": 1}
+        search_fn.assert_not_called()
+        delete_fn.assert_called_once_with([items[0].id, items[2].id])
+        assert add_fn.call_args[0][0].memory == "User likes Python for coding"
+        assert progress[-1] == (3, 3, 1)
+
+    def test_consolidate_with_stored_vectors(self):
+        cons = self._make_consolidator("User likes Python for coding")
+        items = [
+            MemoryItem(memory="User likes Python"),
+            MemoryItem(memory="User enjoys hiking"),
+            MemoryItem(memory="User prefers Python for coding"),
+        ]
+        embed_fn = MagicMock()
+        delete_fn = MagicMock()
+
+        result = cons.consolidate(
+            get_all_fn=lambda: items,
+            search_fn=MagicMock(),
+            add_fn=MagicMock(),
+            delete_fn=delete_fn,
+            embed_fn=embed_fn,
+            vectors=np.array([[1.0, 0.0], [0.0, 1.0], [0.95, 0.1]], dtype=np.float32),
+        )
+
+        assert result == {"merged_groups": 1, "total_removed": 1}
+        embed_fn.assert_not_called()
+        delete_fn.assert_called_once_with([items[0].id, items[2].id])
+
     def test_get_stats_empty(self):
         cons = self._make_consolidator()
         stats = cons.get_stats(
@@ -0,0 +1,211 @@
+"""Tests for shared embedder behaviour."""
+
+import base64
+
+import httpx
+import numpy as np
+import pytest
+
+from memovault.config.embedder import BaseEmbedderConfig
+from memovault.embedder.base import BaseEmbedder
+
+
+class FixedEmbedder(BaseEmbedder):
+    """Embedder returning preset vectors."""
+
+    def __init__(self, config: BaseEmbedderConfig, vectors: list[list[float]]):
+        self.config = config
+        self.vectors = vectors
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return self._normalize(self.vectors[: len(texts)])
+
+
+class TestEmbedderNormalize:
+    """Tests for L2 normalization of embeddings."""
+
+    def test_normalizes_by_default(self):
+        """Test that embeddings are unit length by default."""
+        config = BaseEmbedderConfig(model_name_or_path="test")
+        embedder = FixedEmbedder(config, [[3.0, 4.0], [0.0, 2.0]])
+
+        embeddings = embedder.embed(["a", "b"])
+
+        assert np.allclose(embeddings, [[0.6, 0.8], [0.0, 1.0]])
+
+    def test_embed_ndarray_default(self):
+        """Test that embed_ndarray falls back to a float32 matrix of embed()."""
+        config = BaseEmbedderConfig(model_name_or_path="test", normalize=False)
+        embedder = FixedEmbedder(config, [[3.0, 4.0], [0.0, 2.0]])
+
+        matrix = embedder.embed_ndarray(["a", "b"])
+
+        assert matrix.dtype == np.float32
+        assert matrix.flags.c_contiguous
+        assert matrix.tolist() == [[3.0, 4.0], [0.0, 2.0]]
+
+    def test_zero_vector_is_kept(self):
+        """Test that an all-zero embedding does not produce NaNs."""
+        config = BaseEmbedderConfig(model_name_or_path="test")
+        embedder = FixedEmbedder(config, [[0.0, 0.0]])
+
+        assert embedder.embed_one("a") == [0.0, 0.0]
+
+    def test_normalize_disabled(self):
+        """Test that raw embeddings are returned when normalization is off."""
+        config = BaseEmbedderConfig(model_name_or_path="test", normalize=False)
+        embedder = FixedEmbedder(config, [[3.0, 4.0]])
+
+        assert embedder.embed_one("a") == [3.0, 4.0]
+
+
+class CountingEmbedder(BaseEmbedder):
+    """Embedder mapping each text to [len(text), 1] and counting model calls."""
+
+    def __init__(self, config: BaseEmbedderConfig):
+        self.config = config
+        self.embedded: list[str] = []
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return self._embed_cached(texts, self._compute).tolist()
+
+    def _compute(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestEmbeddingCache:
+    """Tests for the persistent embedding cache."""
+
+    def test_only_misses_are_embedded(self, tmp_path):
+        """Test that cached texts skip the model and order is preserved."""
+        config = BaseEmbedderConfig(
+            model_name_or_path="test", cache_path=str(tmp_path / "emb.sqlite3")
+        )
+        embedder = CountingEmbedder(config)
+
+        embedder.embed(["aa", "bbbb"])
+        embeddings = embedder.embed(["bbbb", "c", "aa"])
+
+        assert embedder.embedded == ["aa", "bbbb", "c"]
+        assert embeddings == [[4.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+
+    def test_cache_persists_and_is_keyed_by_model(self, tmp_path):
+        """Test that a new embedder reuses the file only for the same model."""
+        path = str(tmp_path / "emb.sqlite3")
+        CountingEmbedder(BaseEmbedderConfig(model_name_or_path="m1", cache_path=path)).embed(["x"])
+
+        same = CountingEmbedder(BaseEmbedderConfig(model_name_or_path="m1", cache_path=path))
+        other = CountingEmbedder(BaseEmbedderConfig(model_name_or_path="m2", cache_path=path))
+        same.embed(["x"])
+        other.embed(["x"])
+
+        assert same.embedded == []
+        assert other.embedded == ["x"]
+
+    def test_vectors_round_trip_exactly(self, tmp_path):
+        """Test that cached vectors keep full float32 precision."""
+        from memovault.embedder.cache import EmbeddingCache
+
+        vector = np.array([0.1, 1 / 3, -1e-5], dtype=np.float32)
+        cache = EmbeddingCache(tmp_path / "emb.sqlite3", "test")
+        cache.store(["x"], [vector])
+
+        [cached], misses = cache.lookup(["x"])
+
+        assert misses == []
+        assert cached.dtype == np.float32
+        assert np.array_equal(cached, vector)
+
+    def test_disabled_without_path(self):
+        """Test that every call reaches the model when no cache path is set."""
+        embedder = CountingEmbedder(BaseEmbedderConfig(model_name_or_path="test"))
+
+        embedder.embed(["x"])
+        embedder.embed(["x"])
+
+        assert embedder.embedded == ["x", "x"]
+
+
+class TestOpenAIEmbedderBatching:
+    """Tests for splitting OpenAI embedding requests."""
+
+    def test_batches_are_reassembled_in_order(self):
+        """Test that sub-batch results come back in input order."""
+        from types import SimpleNamespace
+
+        from memovault.config.embedder import OpenAIEmbedderConfig
+        from memovault.embedder.openai import OpenAIEmbedder
+
+        config = OpenAIEmbedderConfig(
+            model_name_or_path="test", api_key="x", batch_size=2, normalize=False
+        )
+        embedder = OpenAIEmbedder(config)
+        requests = []
+
+        def create(model, input, encoding_format):
+            requests.append(list(input))
+            # Return out of order to exercise the index sort
+            data = [
+                SimpleNamespace(
+                    index=i,
+                    embedding=base64.b64encode(np.float32([text]).tobytes()).decode(),
+                )
+                for i, text in enumerate(input)
+            ]
+            return SimpleNamespace(data=data[::-1])
+
+        embedder.client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+
+        embeddings = embedder.embed([str(i) for i in range(5)])
+
+        assert embeddings == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+        assert sorted(requests) == [["0", "1"], ["2", "3"], ["4"]]
+
+
+class TestOllamaEmbedderDecoding:
+    """Tests for parsing Ollama embedding responses."""
+
+    def test_raw_response_is_parsed(self):
+        """Test that /api/embed responses are decoded into the matrix."""
+        from json import dumps
+        from types import SimpleNamespace
+
+        from memovault.config.embedder import OllamaEmbedderConfig
+        from memovault.embedder.ollama import OllamaEmbedder
+
+        embedder = OllamaEmbedder.__new__(OllamaEmbedder)
+        embedder.config = OllamaEmbedderConfig(model_name_or_path="test", normalize=False)
+        calls = []
+
+        def post(path, json):
+            calls.append((path, json))
+            embeddings = [[float(len(text)), 0.5] for text in json["input"]]
+            return httpx.Response(
+                200,
+                content=dumps({"embeddings": embeddings}).encode(),
+                request=httpx.Request("POST", path),
+            )
+
+        embedder.http = SimpleNamespace(post=post)
+
+        assert embedder.embed(["a", "bcd"]) == [[1.0, 0.5], [3.0, 0.5]]
+        assert calls == [("/api/embed", {"model": "test", "input": ["a", "bcd"]})]
+
+    def test_error_status_raises(self):
+        """Test that an error response is not parsed as embeddings."""
+        from types import SimpleNamespace
+
+        from memovault.config.embedder import OllamaEmbedderConfig
+        from memovault.embedder.ollama import OllamaEmbedder
+
+        embedder = OllamaEmbedder.__new__(OllamaEmbedder)
+        embedder.config = OllamaEmbedderConfig(model_name_or_path="missing")
+
+        def post(path, json):
+            return httpx.Response(404, request=httpx.Request("POST", path))
+
+        embedder.http = SimpleNamespace(post=post)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            embedder.embed(["a"])
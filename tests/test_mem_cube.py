@@ -0,0 +1,114 @@
+"""Tests for MemCube."""
+
+import pytest
+from pydantic import ValidationError
+
+from memovault.config.embedder import EmbedderConfig, OllamaEmbedderConfig
+from memovault.config.memory import MemoryConfig, SimpleMemoryConfig, VectorMemoryConfig
+from memovault.config.vecdb import QdrantConfig
+from memovault.core.mem_cube import MemCube
+from memovault.memory.factory import MemoryFactory
+from memovault.memory.item import MemoryItem
+
+
+class TestMemCubeCount:
+    """Tests for MemCube's cached count."""
+
+    @pytest.fixture
+    def cube(self):
+        return MemCube(MemoryConfig(backend="simple", config=SimpleMemoryConfig()))
+
+    def test_count_tracks_add_and_delete(self, cube):
+        assert cube.count() == 0
+        ids = cube.add(["one", "two", "three"])
+        assert cube.count() == 3
+
+        cube.delete(ids[0])
+        assert cube.count() == 2
+
+        cube.delete("not-a-stored-id")
+        assert cube.count() == 2
+
+        cube.delete_all()
+        assert cube.count() == 0
+
+    def test_count_is_cached(self, cube):
+        cube.add(["one"])
+        cube.count()
+        # Writes that bypass the cube are not seen until invalidation
+        cube.memory.memories.clear()
+        assert cube.count() == 1
+
+    def test_readded_memory_is_counted_once(self, cube):
+        item = MemoryItem(memory="one")
+        cube.add([item])
+        cube.count()
+        cube.add([item])
+        assert cube.count() == 1
+
+    def test_count_expires(self, cube):
+        cube.add(["one"])
+        cube.count()
+        cube.memory.memories.clear()
+        # Writes made elsewhere show up once the cached count expires
+        cube._count_expires = 0.0
+        assert cube.count() == 0
+
+
+class TestMemCubeLazyBackend:
+    """Tests for deferred backend creation."""
+
+    def test_backend_created_on_first_use(self, monkeypatch):
+        created = []
+        original = MemoryFactory.from_config
+
+        def from_config(config):
+            created.append(config)
+            return original(config)
+
+        monkeypatch.setattr(MemoryFactory, "from_config", from_config)
+        cube = MemCube(MemoryConfig(backend="simple", config=SimpleMemoryConfig()))
+        assert created == []
+
+        cube.add(["one"])
+        assert cube.count() == 1
+        assert len(created) == 1
+
+
+class TestMemCubePersistence:
+    """Tests for dumping and reloading a MemCube."""
+
+    def test_load_from_path_round_trip(self, tmp_path):
+        cube = MemCube(MemoryConfig(backend="simple", config=SimpleMemoryConfig()))
+        cube.add(["one", "two"])
+        cube.dump(str(tmp_path))
+
+        loaded = MemCube.load_from_path(str(tmp_path))
+        assert isinstance(loaded.config.config, SimpleMemoryConfig)
+        assert loaded.config == cube.config
+        assert sorted(m.memory for m in loaded.get_all()) == ["one", "two"]
+
+    def test_trusted_config_builds_nested_models(self, tmp_path):
+        config = MemoryConfig(
+            backend="vector",
+            config=VectorMemoryConfig(
+                vector_db=QdrantConfig(collection_name="c", path="/tmp/q"),
+                embedder=EmbedderConfig(
+                    backend="ollama",
+                    config=OllamaEmbedderConfig(model_name_or_path="nomic"),
+                ),
+            ),
+        )
+        path = str(tmp_path / "config.json")
+        config.to_json_file(path)
+
+        loaded = MemoryConfig.from_json_file(path, trusted=True)
+        assert loaded == config
+        assert isinstance(loaded.config.embedder.config, OllamaEmbedderConfig)
+
+    def test_trusted_config_falls_back_to_validation(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text('{"backend": "simple", "config": {"unknown": 1}}')
+
+        with pytest.raises(ValidationError):
+            MemoryConfig.from_json_file(str(path), trusted=True)
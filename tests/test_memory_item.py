@@ -73,3 +73,20 @@ class TestMemoryItem:
         s = str(item)
         assert "Short memory" in s
         assert item.id in s
+
+    def test_from_stored_round_trip(self):
+        """Test rebuilding a stored memory from its dict."""
+        item = MemoryItem(
+            memory="Stored memory",
+            metadata={"type": "fact", "tags": ["a"], "ltm_status": "promoted", "custom": 1},
+        )
+        restored = MemoryItem.from_stored(item.to_dict())
+        assert restored == item
+        assert restored.metadata.custom == 1
+
+    def test_metadata_drops_item_fields(self):
+        """Test that id/memory keys in a metadata dict are not kept as metadata."""
+        item = MemoryItem(memory="Test", metadata={"id": "x", "memory": "y", "type": "fact"})
+        assert item.metadata.type == "fact"
+        assert "id" not in item.metadata.model_dump()
+        assert "memory" not in item.metadata.model_dump()
@@ -0,0 +1,45 @@
+"""Tests for MemoVault chat on a simple-backend vault."""
+
+# Custom prompt that does not depend on the chat turn
+PROMPT = "{profile_section}{memories_section}{stm_section}"
+
+
+class TestChatCache:
+    """Tests for the chat reply cache."""
+
+    def test_profile_update_invalidates_replies(self, vault):
+        """Test that replies cached before a profile change are dropped."""
+        ask = {"system_prompt": PROMPT, "include_history": False}
+        assert vault.chat("what is my name?", **ask) == "reply 1"
+        assert vault.chat("what is my name?", **ask) == "reply 1"
+
+        vault.update_profile("name", "Alice")
+
+        assert vault.chat("what is my name?", **ask) == "reply 2"
+        assert "Alice" in vault._llm.calls[-1][0]["content"]
+
+    def test_history_turns_are_not_cached(self, vault):
+        """Test that a follow-up in a conversation is never answered from the cache."""
+        assert vault.chat("tell me more", system_prompt=PROMPT) == "reply 1"
+        assert vault.chat("tell me more", system_prompt=PROMPT) == "reply 2"
+        assert len(vault._llm.calls[-1]) == 4  # system, earlier turn, query
+
+    def test_hit_advances_turns(self, vault):
+        """Test that a cached reply still counts as a chat turn."""
+        ask = {"system_prompt": PROMPT, "include_history": False}
+        vault.chat("hello", **ask)
+        vault.chat("hello", **ask)
+
+        assert len(vault._llm.calls) == 1
+        assert vault._chat_turn == 2
+        assert len(vault.get_chat_history()) == 4
+
+    def test_hit_counts_recalls(self, vault):
+        """Test that a cached reply still counts its memories as recalled."""
+        [memory_id] = vault.add("python one", skip_scoring=True)
+        ask = {"system_prompt": PROMPT, "include_history": False}
+        vault.chat("python", **ask)
+        vault.chat("python", **ask)
+
+        assert len(vault._llm.calls) == 1
+        assert vault.get(memory_id).metadata.recall_count == 2
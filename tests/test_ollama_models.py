@@ -0,0 +1,48 @@
+"""Tests for the shared Ollama model list cache."""
+
+from types import SimpleNamespace
+
+from memovault.utils import ollama_models
+from memovault.utils.ollama_models import forget_models, list_local_models
+
+
+class CountingClient:
+    """Stand-in for ollama.Client counting list() calls."""
+
+    def __init__(self, names: list[str]):
+        self.names = names
+        self.calls = 0
+
+    def list(self):
+        self.calls += 1
+        return {"models": [SimpleNamespace(model=name) for name in self.names]}
+
+
+class TestListLocalModels:
+    """Tests for list_local_models."""
+
+    def test_list_is_shared_per_host(self):
+        """Test that a second lookup for the same host reuses the list."""
+        client = CountingClient(["llama3.1:latest"])
+        forget_models("http://cache-test:1")
+
+        first = list_local_models(client, "http://cache-test:1")
+        second = list_local_models(client, "http://cache-test:1")
+
+        assert first == second == frozenset({"llama3.1:latest"})
+        assert client.calls == 1
+
+    def test_expired_or_forgotten_list_is_refetched(self, monkeypatch):
+        """Test that the TTL and forget_models force a new request."""
+        client = CountingClient(["a"])
+        forget_models("http://cache-test:2")
+
+        list_local_models(client, "http://cache-test:2")
+        forget_models("http://cache-test:2")
+        list_local_models(client, "http://cache-test:2")
+        monkeypatch.setattr(ollama_models, "MODEL_LIST_TTL", -1.0)
+        forget_models("http://cache-test:2")
+        list_local_models(client, "http://cache-test:2")
+        list_local_models(client, "http://cache-test:2")
+
+        assert client.calls == 4
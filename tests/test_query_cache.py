@@ -0,0 +1,79 @@
+"""Tests for the API query cache."""
+
+from types import SimpleNamespace
+
+from memovault.api._query_cache import QueryCache
+
+
+class FakeVault:
+    """Vault stub that records embedder calls."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.settings = SimpleNamespace(semcache_tau=0.97, semcache_size=8, semcache_ttl=0)
+
+    def embed_query(self, query: str) -> list[float]:
+        self.calls.append([query])
+        return [float(len(query)), 1.0]
+
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        self.calls.append(list(queries))
+        return [[float(len(q)), 1.0] for q in queries]
+
+
+class TestQueryCache:
+    """Tests for QueryCache."""
+
+    def test_repeated_text_is_embedded_once(self):
+        vault = FakeVault()
+        cache = QueryCache.from_vault(vault)
+
+        first = cache.embed("coding setup")
+        second = cache.embed("coding setup")
+
+        assert first == second
+        assert vault.calls == [["coding setup"]]
+        assert cache.stats()["embedding_cache"] == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_prime_embeds_uncached_queries_in_one_call(self):
+        vault = FakeVault()
+        cache = QueryCache(vault)
+        cache.embed("a")
+
+        cache.prime(["a", "bb", "ccc", "bb"])
+
+        assert vault.calls == [["a"], ["bb", "ccc"]]
+        assert cache.cached_embedding("ccc") == [3.0, 1.0]
+
+    def test_embedding_cache_is_bounded(self):
+        cache = QueryCache(FakeVault(), embedding_cache_size=2)
+        for query in ("a", "bb", "ccc"):
+            cache.embed(query)
+
+        assert cache.cached_embedding("a") is None
+        assert cache.stats()["embedding_cache"]["size"] == 2
+
+    def test_invalidate_drops_results_but_keeps_embeddings(self):
+        vault = FakeVault()
+        cache = QueryCache(vault)
+        vector = cache.embed("query")
+        cache.put(vector, "result", key=("search", 5))
+        assert cache.get(vector, ("search", 5)) == "result"
+
+        cache.invalidate()
+
+        assert cache.get(vector, ("search", 5)) is None
+        assert cache.cached_embedding("query") == vector
+
+    def test_put_after_invalidate_is_dropped(self):
+        """Test that a result computed before a write is not cached after it."""
+        cache = QueryCache(FakeVault())
+        vector = cache.embed("query")
+        generation = cache.generation
+
+        cache.invalidate()
+        cache.put(vector, "stale", key=("search", 5), generation=generation)
+        assert cache.get(vector, ("search", 5)) is None
+
+        cache.put(vector, "fresh", key=("search", 5), generation=cache.generation)
+        assert cache.get(vector, ("search", 5)) == "fresh"
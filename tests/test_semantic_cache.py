@@ -0,0 +1,92 @@
+"""Tests for the semantic query cache."""
+
+import numpy as np
+
+from memovault.core._kernels import dot_scores
+from memovault.core.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache."""
+
+    def test_miss_on_empty(self):
+        cache = SemanticCache()
+        assert cache.get([1.0, 0.0]) is None
+        assert cache.misses == 1
+
+    def test_hit_on_similar_vector(self):
+        cache = SemanticCache(threshold=0.97)
+        cache.put([1.0, 0.0, 0.0], "answer")
+        assert cache.get([0.99, 0.05, 0.0]) == "answer"
+        assert cache.hits == 1
+
+    def test_miss_below_threshold(self):
+        cache = SemanticCache(threshold=0.97)
+        cache.put([1.0, 0.0], "answer")
+        assert cache.get([0.0, 1.0]) is None
+
+    def test_key_must_match(self):
+        cache = SemanticCache()
+        cache.put([1.0, 0.0], "top5", key=("search", 5))
+        assert cache.get([1.0, 0.0], key=("search", 10)) is None
+        assert cache.get([1.0, 0.0], key=("search", 5)) == "top5"
+
+    def test_lru_eviction(self):
+        cache = SemanticCache(max_entries=2)
+        cache.put([1.0, 0.0, 0.0], "a")
+        cache.put([0.0, 1.0, 0.0], "b", key="other")
+        cache.get([1.0, 0.0, 0.0])  # "a" becomes most recently used
+        cache.put([0.0, 0.0, 1.0], "c")
+
+        assert len(cache) == 2
+        assert cache.get([0.0, 1.0, 0.0], key="other") is None
+        assert cache.get([1.0, 0.0, 0.0]) == "a"
+
+    def test_eviction_counter(self):
+        cache = SemanticCache(max_entries=1)
+        cache.put([1.0, 0.0], "a")
+        cache.put([0.0, 1.0], "b")
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("memovault.core.semantic_cache.time.monotonic", lambda: now[0])
+        cache = SemanticCache(ttl=60)
+        cache.put([1.0, 0.0], "answer")
+        assert cache.get([1.0, 0.0]) == "answer"
+
+        now[0] += 61
+        assert cache.get([1.0, 0.0]) is None
+        assert len(cache) == 0
+
+    def test_zero_vector_is_ignored(self):
+        cache = SemanticCache()
+        cache.put([0.0, 0.0], "answer")
+        assert len(cache) == 0
+
+    def test_clear(self):
+        cache = SemanticCache()
+        cache.put([1.0, 0.0], "answer")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get([1.0, 0.0]) is None
+
+    def test_grows_past_initial_capacity(self):
+        cache = SemanticCache(threshold=0.999, max_entries=100)
+        rng = np.random.default_rng(1)
+        vectors = rng.standard_normal((40, 8))
+        for i, vec in enumerate(vectors):
+            cache.put(vec, i)
+
+        assert len(cache) == 40
+        assert cache.get(vectors[37]) == 37
+
+
+class TestDotScores:
+    """Tests for the similarity kernel."""
+
+    def test_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.standard_normal((8, 16)).astype(np.float32)
+        query = rng.standard_normal(16).astype(np.float32)
+        np.testing.assert_allclose(dot_scores(matrix, query), matrix @ query, rtol=1e-4)
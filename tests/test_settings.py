@@ -0,0 +1,60 @@
+"""Tests for settings loading."""
+
+import pytest
+
+from memovault.config.settings import Settings, _settings_cache_path, get_settings
+
+
+@pytest.fixture
+def fresh_settings(tmp_path, monkeypatch):
+    """Point the settings cache at a temp dir and clear the in-process cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    get_settings.cache_clear()
+    yield tmp_path
+    get_settings.cache_clear()
+
+
+class TestSettingsCache:
+    """Tests for the on-disk settings cache."""
+
+    def test_reuses_cached_values(self, fresh_settings, monkeypatch):
+        """Test that a second process-level load comes from the disk cache."""
+        monkeypatch.setenv("MEMOVAULT_IMPORTANCE_THRESHOLD", "7")
+        first = get_settings()
+        assert _settings_cache_path().exists()
+
+        get_settings.cache_clear()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("settings were revalidated")
+
+        monkeypatch.setattr(Settings, "__init__", fail)
+        second = get_settings()
+        assert second.importance_threshold == 7
+        assert second.model_dump() == first.model_dump()
+
+    def test_env_change_invalidates(self, fresh_settings, monkeypatch):
+        """Test that changing a MEMOVAULT_* variable bypasses the cache."""
+        monkeypatch.setenv("MEMOVAULT_IMPORTANCE_THRESHOLD", "7")
+        assert get_settings().importance_threshold == 7
+
+        get_settings.cache_clear()
+        monkeypatch.setenv("MEMOVAULT_IMPORTANCE_THRESHOLD", "3")
+        assert get_settings().importance_threshold == 3
+
+    def test_env_file_change_invalidates(self, fresh_settings):
+        """Test that editing .env bypasses the cache."""
+        env_file = fresh_settings / ".env"
+        env_file.write_text("MEMOVAULT_API_PORT=9000\n")
+        assert get_settings().api_port == 9000
+
+        get_settings.cache_clear()
+        env_file.write_text("MEMOVAULT_API_PORT=9100\n")
+        assert get_settings().api_port == 9100
+
+    def test_cache_can_be_disabled(self, fresh_settings, monkeypatch):
+        """Test that MEMOVAULT_SETTINGS_CACHE=0 always validates from the sources."""
+        monkeypatch.setenv("MEMOVAULT_SETTINGS_CACHE", "0")
+        assert get_settings().api_port == 8080
+        assert not _settings_cache_path().exists()
@@ -6,7 +6,7 @@ import tempfile
 import pytest
 
 from memovault.config.memory import SimpleMemoryConfig
-from memovault.memory.item import MemoryItem
+from memovault.memory.item import MemoryItem, MemoryMetadata
 from memovault.memory.simple import SimpleMemory
 
 
@@ -56,6 +56,54 @@ class TestSimpleMemory:
         # Memory with more Python mentions should rank higher (BM25 TF)
         assert "Python" in results[0].memory
 
+    def test_search_top_k(self, memory):
+        """Test top_k selection returns the highest-scoring memories in order."""
+        memory.add([
+            MemoryItem(memory="python"),
+            MemoryItem(memory="python python python"),
+            MemoryItem(memory="rust only"),
+            MemoryItem(memory="python python"),
+            MemoryItem(memory="go only"),
+        ])
+
+        results = memory.search("python", top_k=2)
+        assert [r.memory for r in results] == ["python python python", "python python"]
+
+    def test_search_batch(self, memory):
+        """Test batched search returns one result list per query, in order."""
+        memory.add([
+            MemoryItem(memory="python programming"),
+            MemoryItem(memory="rust programming"),
+            MemoryItem(memory="cooking pasta"),
+        ])
+
+        results = memory.search_batch(["rust", "pasta"], top_k=1)
+        assert [[r.memory for r in batch] for batch in results] == [
+            ["rust programming"],
+            ["cooking pasta"],
+        ]
+
+    def test_iter_recent_pages(self, memory):
+        """Test paged recent listing matches get_recent, newest first."""
+        memory.add([MemoryItem(memory=f"m{i}") for i in range(7)])
+
+        pages = list(memory.iter_recent(5, page_size=2))
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [m.memory for page in pages for m in page] == [
+            m.memory for m in memory.get_recent(5)
+        ]
+
+    def test_count_by_ltm_status(self, memory):
+        """Test per-status counts, with legacy memories keyed by None."""
+        memory.add([
+            MemoryItem(memory="a", metadata=MemoryMetadata(ltm_status="candidate")),
+            MemoryItem(memory="b", metadata=MemoryMetadata(ltm_status="promoted")),
+            MemoryItem(memory="c", metadata=MemoryMetadata(ltm_status="promoted")),
+            MemoryItem(memory="d"),
+        ])
+
+        assert memory.count_by_ltm_status() == {"candidate": 1, "promoted": 2, None: 1}
+
     def test_search_empty(self, memory):
         """Test searching with no memories."""
         results = memory.search("anything")
@@ -68,6 +116,78 @@ class TestSimpleMemory:
         results = memory.search("zebra")
         assert results == []
 
+    def test_search_index_follows_changes(self, memory):
+        """Test that the cached BM25 index is rebuilt only when texts change."""
+        item = MemoryItem(memory="I like green tea")
+        memory.add([item, MemoryItem(memory="Rust is fast"), MemoryItem(memory="Go is simple")])
+        assert memory.search("tea")[0].id == item.id
+        index = memory._bm25
+
+        item.metadata.recall_count = 1
+        memory.update(item.id, item)
+        assert memory.search("tea")[0].id == item.id
+        assert memory._bm25 is index
+
+        memory.update(item.id, MemoryItem(memory="I like black coffee"))
+        assert memory.search("tea") == []
+        assert memory.search("coffee")[0].id == item.id
+
+        memory.delete([item.id])
+        assert memory.search("coffee") == []
+
+    def test_search_by_id(self, memory):
+        """Test that searching for a stored id returns that memory."""
+        item = MemoryItem(memory="Looked up by id")
+        memory.add([item, MemoryItem(memory="Other")])
+
+        assert [m.id for m in memory.search(f" {item.id} ")] == [item.id]
+        assert memory._bm25 is None
+        assert memory.search("   ") == []
+
+    def test_repeated_search_reuses_ranking(self, memory, monkeypatch):
+        """Test that repeated queries skip scoring but see metadata updates."""
+        item = MemoryItem(memory="I like green tea")
+        memory.add([item, MemoryItem(memory="Rust is fast")])
+        assert memory.search("Green tea")[0].id == item.id
+
+        def fail(*args):
+            raise AssertionError("ranked again")
+
+        monkeypatch.setattr(memory, "_rank", fail)
+        item.metadata.recall_count = 3
+        memory.update(item.id, item)
+        [hit] = memory.search("green  TEA")
+        assert hit.metadata.recall_count == 3
+
+        monkeypatch.undo()
+        memory.add([MemoryItem(memory="tea again")])
+        assert len(memory.search("green tea")) == 2
+
+    def test_search_without_bm25s(self, memory, monkeypatch):
+        """Test that ranking falls back to rank_bm25 when bm25s is missing."""
+        from memovault.memory import simple
+
+        monkeypatch.setattr(simple, "bm25s", None)
+        memory.add([
+            MemoryItem(memory="Python is great for data science"),
+            MemoryItem(memory="I enjoy hiking in the mountains"),
+            MemoryItem(memory="Rust compiles fast code"),
+        ])
+
+        results = memory.search("python data", top_k=2)
+        assert [r.memory for r in results] == ["Python is great for data science"]
+
+    def test_search_without_bm25s_partial_top_k(self, memory, monkeypatch):
+        """Test that partial top-k selection matches a full sort of the scores."""
+        from memovault.memory import simple
+
+        monkeypatch.setattr(simple, "bm25s", None)
+        memory.add([MemoryItem(memory=" ".join(["tea"] * n + ["x"] * (8 - n))) for n in range(8)])
+        memory.add([MemoryItem(memory=f"filler text {i}") for i in range(12)])
+
+        results = memory.search("tea", top_k=3)
+        assert [r.memory.count("tea") for r in results] == [7, 6, 5]
+
     def test_get_by_id(self, memory):
         """Test getting a memory by ID."""
         item = MemoryItem(memory="Specific memory")
@@ -77,11 +197,40 @@ class TestSimpleMemory:
         assert result is not None
         assert result.memory == "Specific memory"
 
+    def test_positions_follow_delete(self, memory):
+        """Test that id lookups stay correct after deleting earlier items."""
+        items = [MemoryItem(memory=f"Memory {i}") for i in range(4)]
+        memory.add(items)
+        memory.delete([items[0].id, items[2].id])
+
+        assert memory.get(items[3].id).memory == "Memory 3"
+        assert memory.get(items[0].id) is None
+        memory.update(items[3].id, MemoryItem(memory="Updated"))
+        assert [m.memory for m in memory.get_all()] == ["Memory 1", "Updated"]
+        assert memory.add([items[0]]) == [items[0].id]
+
+    def test_search_after_delete_and_update(self, memory):
+        """Test that stored tokens stay aligned with memories."""
+        items = [MemoryItem(memory=f"topic{i} shared") for i in range(3)]
+        memory.add(items)
+        memory.delete([items[0].id])
+        memory.update(items[2].id, MemoryItem(memory="renamed shared"))
+
+        assert [m.id for m in memory.search("topic1")] == [items[1].id]
+        assert [m.id for m in memory.search("renamed")] == [items[2].id]
+        assert memory.search("topic2") == []
+
     def test_get_nonexistent(self, memory):
         """Test getting a nonexistent memory."""
         result = memory.get("nonexistent-id")
         assert result is None
 
+    def test_get_many(self, memory):
+        """Test getting several memories, skipping unknown IDs."""
+        ids = memory.add([MemoryItem(memory="first"), MemoryItem(memory="second")])
+        results = memory.get_many([ids[1], "nonexistent-id", ids[0]])
+        assert [m.memory for m in results] == ["second", "first"]
+
     def test_get_all(self, memory):
         """Test getting all memories."""
         items = [
@@ -93,6 +242,27 @@ class TestSimpleMemory:
         all_memories = memory.get_all()
         assert len(all_memories) == 2
 
+    def test_get_recent(self, memory):
+        """Test getting the most recent memories, newest first."""
+        items = [MemoryItem(memory=f"Memory {i}") for i in range(5)]
+        memory.add(items)
+
+        recent = memory.get_recent(2)
+        assert [m.memory for m in recent] == ["Memory 4", "Memory 3"]
+        assert len(memory.get_recent(10)) == 5
+        assert memory.get_recent(0) == []
+
+    def test_get_recent_previews(self, memory):
+        """Test previews are truncated and flagged."""
+        memory.add([
+            MemoryItem(memory="short", metadata={"type": "fact"}),
+            MemoryItem(memory="x" * 150),
+        ])
+
+        previews = memory.get_recent_previews(5, preview_len=100)
+        assert previews[0][1:] == ("x" * 100, True, None)
+        assert previews[1][1:] == ("short", False, "fact")
+
     def test_update(self, memory):
         """Test updating a memory."""
         item = MemoryItem(memory="Original content")
@@ -152,3 +322,40 @@ class TestSimpleMemory:
             memories_text = [m.memory for m in loaded]
             assert "Persistent memory 1" in memories_text
             assert "Persistent memory 2" in memories_text
+            assert len(new_memory.search("persistent")) == 2
+
+    def test_load_corrupt_file(self, memory):
+        """Test that an unreadable memory file is logged, not raised."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "memories.json"), "w") as f:
+                f.write("[{not json")
+            memory.load(tmpdir)
+
+        assert memory.count() == 0
+
+    def test_pretty_dump_round_trips(self, memory):
+        """Test that the indented export loads like the compact format."""
+        memory.add([MemoryItem(memory="Café notes ☕")])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory.dump(tmpdir, pretty=True)
+            with open(os.path.join(tmpdir, "memories.json"), encoding="utf-8") as f:
+                assert "\n  " in f.read()
+
+            new_memory = SimpleMemory(SimpleMemoryConfig())
+            new_memory.load(tmpdir)
+
+        assert [m.memory for m in new_memory.get_all()] == ["Café notes ☕"]
+
+    def test_add_and_load_skip_duplicates(self, memory):
+        """Test that duplicate ids within a batch or a reload are skipped."""
+        item = MemoryItem(memory="Only once")
+        other = MemoryItem(memory="Other")
+        assert memory.add([item, item, other]) == [item.id, other.id]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory.dump(tmpdir)
+            memory.load(tmpdir)
+
+        assert memory.count() == 2
+        assert memory.get(item.id).memory == "Only once"
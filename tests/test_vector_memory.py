@@ -0,0 +1,347 @@
+"""Tests for vector memory implementation."""
+
+import numpy as np
+import pytest
+
+from memovault.config.memory import VectorMemoryConfig
+from memovault.config.vecdb import QdrantConfig
+from memovault.memory.item import MemoryItem
+from memovault.memory.vector import VectorMemory
+from memovault.vecdb.item import VecDBItem
+from memovault.vecdb.qdrant import QdrantVecDB
+
+
+class CountingEmbedder:
+    """Embedder stand-in recording each embed_ndarray call."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed_ndarray(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_ndarray(texts).tolist()
+
+
+class RecordingVecDB:
+    """Vector DB stand-in recording upserts."""
+
+    def __init__(self):
+        self.upserts: list[list] = []
+
+    def add(self, items) -> None:
+        self.upserts.append(list(items))
+
+
+class TestVectorMemoryUpdate:
+    """Tests for VectorMemory.update and update_many."""
+
+    def make_memory(self) -> VectorMemory:
+        memory = VectorMemory.__new__(VectorMemory)
+        memory.embedder = CountingEmbedder()
+        memory.vector_db = RecordingVecDB()
+        return memory
+
+    def test_update_many_batches_calls(self):
+        """Test that K updates cost one embedder call and one upsert."""
+        memory = self.make_memory()
+        a, b = MemoryItem(memory="alpha"), MemoryItem(memory="be")
+
+        memory.update_many([(a.id, a), (b.id, {"memory": "beta", "metadata": {}})])
+
+        assert memory.embedder.calls == [["alpha", "beta"]]
+        [items] = memory.vector_db.upserts
+        assert [item.id for item in items] == [a.id, b.id]
+        assert items[1].vector == [4.0, 1.0]
+        assert items[1].payload["memory"] == "beta"
+
+    def test_update_routes_through_update_many(self):
+        """Test that a single update uses the same upsert path."""
+        memory = self.make_memory()
+        item = MemoryItem(memory="old")
+
+        memory.update(item.id, MemoryItem(memory="new"))
+
+        [[stored]] = memory.vector_db.upserts
+        assert stored.id == item.id
+        assert stored.payload["memory"] == "new"
+
+
+class TestVectorMemoryLoad:
+    """Tests for VectorMemory dump/load through a local Qdrant store."""
+
+    def make_db(self, tmp_path) -> QdrantVecDB:
+        return QdrantVecDB(
+            QdrantConfig(collection_name="t", vector_dimension=2, path=str(tmp_path / "db"))
+        )
+
+    def test_add_many_batches(self, tmp_path):
+        """Test that add_many adds a stream in several batches."""
+        db = self.make_db(tmp_path)
+        items = (VecDBItem(vector=[1.0, float(i)], payload={"i": i}) for i in range(5))
+
+        assert db.add_many(items, batch_size=2) == 5
+        assert db.count() == 5
+        pages = db.iter_all(scroll_limit=2)
+        assert sorted(item.payload["i"] for item in pages) == [0, 1, 2, 3, 4]
+        # Server mode prefetches the next page in the background
+        db._remote = True
+        pages = db.iter_all(scroll_limit=2)
+        assert sorted(item.payload["i"] for item in pages) == [0, 1, 2, 3, 4]
+
+    def test_delete_all_keeps_collection(self, tmp_path, monkeypatch):
+        """Test that delete_all empties the collection without recreating it."""
+        db = self.make_db(tmp_path)
+        db.add([VecDBItem(vector=[1.0, 0.0]), VecDBItem(vector=[0.0, 1.0])])
+        monkeypatch.setattr(db, "delete_collection", None)
+
+        db.delete_all()
+
+        assert db.count(exact=True) == 0
+        monkeypatch.undo()
+        db.delete_all(hard_reset=True)
+        assert db.collection_exists("t")
+
+    def test_large_add_is_split(self, tmp_path, monkeypatch):
+        """Test that add() sends oversized inputs as several upserts."""
+        from memovault.vecdb import qdrant
+
+        db = self.make_db(tmp_path)
+        sizes = []
+        upsert = db.client.upsert
+        monkeypatch.setattr(qdrant, "UPSERT_BATCH_SIZE", 2)
+        monkeypatch.setattr(
+            db.client, "upsert", lambda **kw: sizes.append(len(kw["points"].ids)) or upsert(**kw)
+        )
+
+        db.add([VecDBItem(vector=[1.0, float(i)]) for i in range(5)])
+
+        assert sizes == [2, 2, 1]
+        assert db.count() == 5
+
+    def test_server_add_many_uses_io_pool(self, tmp_path, monkeypatch):
+        """Test that server uploads run on the I/O threads in small batches."""
+        import threading
+
+        from memovault.vecdb import qdrant
+
+        db = self.make_db(tmp_path)
+        db._remote = True
+        calls = []
+        monkeypatch.setattr(qdrant, "UPSERT_BATCH_SIZE", 2)
+        monkeypatch.setattr(
+            db.client,
+            "upsert",
+            lambda **kw: calls.append((len(kw["points"].ids), threading.current_thread().name)),
+        )
+
+        assert db.add_many((VecDBItem(vector=[1.0, float(i)]) for i in range(5)), 10) == 5
+
+        assert sorted(size for size, _ in calls) == [1, 2, 2]
+        assert all(name.startswith("qdrant-io") for _, name in calls)
+        db.close()
+        assert db._io_executor is None
+
+    def test_server_add_many_bounds_batches_in_flight(self, tmp_path, monkeypatch):
+        """Test that add_many reads the stream only a few batches ahead of uploads."""
+        import threading
+        import time
+
+        db = self.make_db(tmp_path)
+        db._remote = True
+        db.config.io_workers = 2
+        lock = threading.Lock()
+        state = {"read": 0, "uploaded": 0, "running": 0, "max_running": 0, "max_ahead": 0}
+
+        def items():
+            for i in range(40):
+                with lock:
+                    state["read"] += 1
+                yield VecDBItem(vector=[1.0, float(i)])
+
+        def upsert(**kw):
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+                state["max_ahead"] = max(state["max_ahead"], state["read"] - state["uploaded"])
+            time.sleep(0.005)
+            with lock:
+                state["running"] -= 1
+                state["uploaded"] += len(kw["points"].ids)
+
+        monkeypatch.setattr(db.client, "upsert", upsert)
+
+        assert db.add_many(items(), 2) == 40
+
+        assert state["max_running"] <= 2
+        # Two batches uploading plus the one waiting for a free slot
+        assert state["max_ahead"] <= 3 * 2
+
+    def test_dump_and_load(self, tmp_path):
+        """Test that load restores every dumped item."""
+        db = self.make_db(tmp_path)
+        memory = VectorMemory.__new__(VectorMemory)
+        memory.config = VectorMemoryConfig.model_construct(memory_filename="memories.json")
+        memory.embedder = CountingEmbedder()
+        memory.vector_db = db
+        items = [MemoryItem(memory=f"memory {i}") for i in range(5)]
+        memory.add(items)
+        memory.dump(str(tmp_path))
+
+        db.delete_all()
+        memory.load(str(tmp_path))
+
+        assert db.count() == 5
+        assert memory.get(items[3].id).memory == "memory 3"
+        missing = "00000000-0000-0000-0000-000000000000"
+        assert [m.memory for m in memory.get_many([items[1].id, missing])] == ["memory 1"]
+
+        memories, matrix = memory.get_all_with_vectors()
+        assert matrix.shape == (5, 2) and matrix.dtype == np.float32
+        by_id = {m.id: row for m, row in zip(memories, matrix)}
+        row = by_id[items[3].id]
+        assert row[0] / row[1] == pytest.approx(len("memory 3"))
+
+    def test_get_all_arrays_empty(self, tmp_path):
+        """Test that an empty collection gives an empty matrix."""
+        ids, matrix, payloads = self.make_db(tmp_path).get_all_arrays()
+        assert ids == [] and payloads == []
+        assert matrix.shape == (0, 2)
+
+
+class TestVectorMemorySearchBatch:
+    """Tests for batched VectorMemory searches against a local Qdrant store."""
+
+    def test_one_request_for_all_queries(self, tmp_path, monkeypatch):
+        """Test that N queries cost one embedder call and one batch request."""
+        db = QdrantVecDB(
+            QdrantConfig(collection_name="t", vector_dimension=2, path=str(tmp_path))
+        )
+        memory = VectorMemory.__new__(VectorMemory)
+        memory.embedder = CountingEmbedder()
+        memory.vector_db = db
+        memory.add([MemoryItem(memory="a"), MemoryItem(memory="bbbbbbbb")])
+        monkeypatch.setattr(db, "search", None)
+        memory.embedder.calls.clear()
+
+        # Embeddings are [len(text), 1.0]; cosine picks the nearest length
+        results = memory.search_batch(["x", "yyyyyyyyy"], top_k=1)
+
+        assert memory.embedder.calls == [["x", "yyyyyyyyy"]]
+        assert [[m.memory for m in hits] for hits in results] == [["a"], ["bbbbbbbb"]]
+
+    def test_vectors_only_on_request(self, tmp_path):
+        """Test that reads skip stored vectors unless asked for them."""
+        db = QdrantVecDB(
+            QdrantConfig(collection_name="t", vector_dimension=2, path=str(tmp_path))
+        )
+        item = VecDBItem(vector=[1.0, 0.0], payload={"memory": "m"})
+        db.add([item])
+
+        assert db.search([1.0, 0.0], 1)[0].vector is None
+        assert db.get_by_id(item.id).vector is None
+        assert db.get_by_ids([item.id], with_vectors=True)[0].vector == [1.0, 0.0]
+        assert [i.vector for i in db.iter_all(with_vectors=True)] == [[1.0, 0.0]]
+
+
+class TestQdrantConnection:
+    """Tests for the Qdrant client options."""
+
+    def make_db(self, monkeypatch, **config) -> dict:
+        import qdrant_client
+
+        seen = {}
+        monkeypatch.setattr(qdrant_client, "QdrantClient", lambda **kwargs: seen.update(kwargs))
+        monkeypatch.setattr(QdrantVecDB, "create_collection", lambda self: None)
+        QdrantVecDB(QdrantConfig(collection_name="t", **config))
+        return seen
+
+    def test_server_prefers_grpc(self, monkeypatch):
+        """Test that server connections use gRPC unless turned off."""
+        seen = self.make_db(monkeypatch, host="qdrant", port=6333, grpc_port=7334)
+        assert seen["prefer_grpc"] is True
+        assert seen["grpc_port"] == 7334
+
+        seen = self.make_db(monkeypatch, url="https://example", prefer_grpc=False)
+        assert seen["prefer_grpc"] is False
+        assert "grpc_port" not in seen
+
+    def test_quantized_collection(self, monkeypatch, tmp_path):
+        """Test that embed_dtype picks the collection's quantization."""
+        from qdrant_client.http import models
+
+        db = QdrantVecDB(
+            QdrantConfig(collection_name="t", path=str(tmp_path), embed_dtype="int8")
+        )
+        created = {}
+        monkeypatch.setattr(db, "collection_exists", lambda name: False)
+        monkeypatch.setattr(db.client, "create_collection", lambda **kw: created.update(kw))
+
+        db.create_collection()
+        assert created["quantization_config"].scalar.type == models.ScalarType.INT8
+        assert created["hnsw_config"] == models.HnswConfigDiff(m=16, ef_construct=100)
+
+        db.config = db.config.model_copy(update={"embed_dtype": "binary"})
+        db.create_collection()
+        assert isinstance(created["quantization_config"], models.BinaryQuantization)
+
+    def test_read_consistency(self, monkeypatch, tmp_path):
+        """Test that point reads ask for the configured read consistency."""
+        from qdrant_client.http import models
+
+        db = QdrantVecDB(
+            QdrantConfig(collection_name="t", path=str(tmp_path), read_consistency="majority")
+        )
+        seen = {}
+        monkeypatch.setattr(db.client, "retrieve", lambda **kw: seen.update(kw) or [])
+
+        assert db.get_by_id("5c56c793-69f3-4fbf-87e6-c4bf54c28c26") is None
+        assert seen["consistency"] == models.ReadConsistencyType.MAJORITY
+        assert db.get_all() == []
+
+    def test_collection_exists_surfaces_errors(self, monkeypatch, tmp_path):
+        """Test that a failing server is not mistaken for a missing collection."""
+        db = QdrantVecDB(QdrantConfig(collection_name="t", path=str(tmp_path)))
+        assert db.collection_exists("t")
+        assert not db.collection_exists("other")
+
+        def unreachable(**kwargs):
+            raise ConnectionError("refused")
+
+        monkeypatch.setattr(db.client, "collection_exists", unreachable)
+        with pytest.raises(ConnectionError):
+            db.create_collection()
+
+    def test_local_mode_has_no_transport(self, monkeypatch, tmp_path):
+        """Test that embedded mode only gets a path."""
+        assert self.make_db(monkeypatch, path=str(tmp_path)) == {"path": str(tmp_path)}
+
+
+class TestQdrantFilters:
+    """Tests for reuse of prebuilt Qdrant filters."""
+
+    def test_filters_are_reused(self, tmp_path):
+        """Test that equal filter dicts share one Filter object."""
+        db = QdrantVecDB(QdrantConfig(collection_name="t", vector_dimension=2, path=str(tmp_path)))
+
+        first = db._dict_to_filter({"type": "fact", "ltm_status": None})
+        assert db._dict_to_filter({"ltm_status": None, "type": "fact"}) is first
+        assert db._dict_to_filter({"type": "event"}) is not first
+        assert len(db._filters) == 2
+
+
+class TestVecDBItemFromPoint:
+    """Tests for wrapping database points as VecDBItems."""
+
+    def test_from_point(self):
+        """Test that scored and plain points keep their fields."""
+        from types import SimpleNamespace
+
+        scored = SimpleNamespace(id="p1", vector=[0.5], payload={"memory": "m"}, score=0.9)
+        record = SimpleNamespace(id="p2", vector=None, payload={"memory": "n"})
+
+        item = VecDBItem.from_point(scored)
+        assert (item.id, item.vector, item.score) == ("p1", [0.5], 0.9)
+        assert VecDBItem.from_point(record).to_dict() == {"id": "p2", "payload": {"memory": "n"}}